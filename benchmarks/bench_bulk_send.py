@@ -0,0 +1,147 @@
+"""Throughput benchmark for send_bulk_sms against the local mock server.
+
+Reports messages/sec, p50/p99 per-message latency and peak memory for the sync
+and async clients at each recipient count. The mock server runs in its own
+process so it doesn't compete with the client for the GIL, and every scenario
+runs in a fresh subprocess so peak RSS is measured independently.
+
+    python benchmarks/bench_bulk_send.py
+    python benchmarks/bench_bulk_send.py --sizes 1000,100000,1000000 --latency 0.005
+"""
+import argparse
+from array import array
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from textbelt_utils import AsyncTextbeltClient, BulkSMSRequest, RateLimiter, TextbeltClient
+
+def percentile(samples: array, fraction: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def make_request(size: int) -> BulkSMSRequest:
+    return BulkSMSRequest(
+        phones=[f"+1{i:010d}" for i in range(size)],
+        message="Benchmark message",
+        key="bench_key",
+    )
+
+def run_sync(url: str, size: int, workers: int) -> array:
+    latencies = array("d")
+
+    class TimedClient(TextbeltClient):
+        def send_sms(self, request):
+            start = time.perf_counter()
+            try:
+                return super().send_sms(request)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    # An effectively unlimited rate limiter replaces the fixed per-message delay
+    limiter = RateLimiter(rate=1e9, burst=10**9)
+    with TimedClient("bench_key", base_url=url, pool_maxsize=workers, rate_limiter=limiter) as client:
+        response = client.send_bulk_sms(make_request(size), max_workers=workers)
+    assert response.successful_messages == size, response.failed_messages
+    return latencies
+
+def run_async(url: str, size: int, concurrency: int) -> array:
+    latencies = array("d")
+
+    class TimedClient(AsyncTextbeltClient):
+        async def send_sms(self, request):
+            start = time.perf_counter()
+            try:
+                return await super().send_sms(request)
+            finally:
+                latencies.append(time.perf_counter() - start)
+
+    async def main():
+        limiter = RateLimiter(rate=1e9, burst=10**9)
+        async with TimedClient(
+            "bench_key",
+            base_url=url,
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+            rate_limiter=limiter,
+        ) as client:
+            return await client.send_bulk_sms(make_request(size), max_concurrency=concurrency)
+
+    response = asyncio.run(main())
+    assert response.successful_messages == size, response.failed_messages
+    return latencies
+
+def run_scenario(args) -> dict:
+    """Run one scenario in this process and return its measurements."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "textbelt_utils.mock_server", "--port", "0",
+         "--latency", str(args.latency)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        url = server.stdout.readline().split()[-1]
+        start = time.perf_counter()
+        if args.scenario == "sync":
+            latencies = run_sync(url, args.size, args.workers)
+        else:
+            latencies = run_async(url, args.size, args.concurrency)
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mib = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    return {
+        "scenario": args.scenario,
+        "size": args.size,
+        "seconds": elapsed,
+        "messages_per_sec": args.size / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_rss_mib": peak_mib,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,100000,1000000",
+                        help="Comma-separated recipient counts")
+    parser.add_argument("--scenarios", default="sync,async", help="Comma-separated: sync, async")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock server latency in seconds")
+    parser.add_argument("--workers", type=int, default=16, help="Threads for the sync client")
+    parser.add_argument("--concurrency", type=int, default=64, help="In-flight sends for the async client")
+    parser.add_argument("--scenario", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(args)))
+        return
+
+    print(f"{'scenario':<8} {'recipients':>10} {'msgs/sec':>10} {'p50 ms':>8} {'p99 ms':>8} {'peak MiB':>9}")
+    for scenario in args.scenarios.split(","):
+        for size in (int(s) for s in args.sizes.split(",")):
+            command = [
+                sys.executable, __file__,
+                "--scenario", scenario,
+                "--size", str(size),
+                "--latency", str(args.latency),
+                "--workers", str(args.workers),
+                "--concurrency", str(args.concurrency),
+            ]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{result['scenario']:<8} {result['size']:>10} {result['messages_per_sec']:>10.0f} "
+                f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f} {result['peak_rss_mib']:>9.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
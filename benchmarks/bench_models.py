@@ -0,0 +1,42 @@
+"""Microbenchmark for per-message model construction in the bulk send path.
+
+Compares building an SMSRequest through the validating constructor with the
+trusted constructor the bulk senders use, and reports the memory held by a
+large number of SMSResponse instances.
+
+    python benchmarks/bench_models.py
+    python benchmarks/bench_models.py --count 1000000
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+
+from textbelt_utils import SMSRequest, SMSResponse
+
+def time_per_call(statement, count: int) -> float:
+    """Best-of-five nanoseconds per call of ``statement``."""
+    return min(timeit.repeat(statement, number=count, repeat=5)) / count * 1e9
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000, help="Objects built per measurement")
+    args = parser.parse_args()
+
+    fields = ("+12025550108", "Benchmark message", "bench_key")
+    validated = time_per_call(lambda: SMSRequest(*fields), args.count)
+    trusted = time_per_call(lambda: SMSRequest._trusted(*fields), args.count)
+
+    tracemalloc.start()
+    responses = [SMSResponse(True, 100, str(i)) for i in range(args.count)]
+    text_ids = sum(sys.getsizeof(r.text_id) for r in responses)
+    held = tracemalloc.get_traced_memory()[0] - text_ids
+    tracemalloc.stop()
+
+    print(f"SMSRequest(...)           {validated:8.0f} ns/object")
+    print(f"SMSRequest._trusted(...)  {trusted:8.0f} ns/object")
+    print(f"SMSResponse instance      {held / args.count:8.0f} bytes/object "
+          f"(slots: {not hasattr(responses[0], '__dict__')})")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import Mock
 import json
@@ -11,7 +13,13 @@ from textbelt_utils.models import (
     OTPGenerateRequest,
     OTPVerifyRequest,
 )
-from textbelt_utils.exceptions import QuotaExceededError, InvalidRequestError
+from textbelt_utils.exceptions import (
+    QuotaExceededError,
+    InvalidRequestError,
+    RequestTimeoutError,
+)
+from textbelt_utils.retry import RetryPolicy
+from textbelt_utils.status_cache import StatusCache
 
 @pytest_asyncio.fixture
 async def client():
@@ -109,6 +117,46 @@ async def test_check_status(client, respx_mock):
     response = await client.check_status("12345")
     assert response.status == "DELIVERED"
 
+@pytest.mark.asyncio
+async def test_check_status_many(client, respx_mock):
+    in_flight = 0
+    peak = 0
+
+    async def status(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.path.endswith("/bad"):
+            return httpx.Response(404, json={"error": "Not found"})
+        return httpx.Response(200, json={"status": "SENT"})
+
+    route = respx_mock.get(url__regex=r"https://textbelt.com/status/.*").mock(side_effect=status)
+    text_ids = [str(i) for i in range(10)] + ["bad", "3"]
+
+    response = await client.check_status_many(text_ids, max_concurrency=4)
+
+    assert route.call_count == 11
+    assert peak <= 4
+    assert len(response.statuses) == 10
+    assert response.statuses["3"].status == "SENT"
+    assert list(response.errors) == ["bad"]
+
+@pytest.mark.asyncio
+async def test_check_status_cache(respx_mock):
+    route = respx_mock.get("https://textbelt.com/status/12345").mock(
+        return_value=httpx.Response(200, json={"status": "FAILED"})
+    )
+    cache = StatusCache()
+    async with AsyncTextbeltClient(api_key="test_key", status_cache=cache) as client:
+        first = await client.check_status("12345")
+        second = await client.check_status("12345")
+
+    assert first.status == second.status == "FAILED"
+    assert route.call_count == 1
+    assert cache.hits == 1
+
 @pytest.mark.asyncio
 async def test_check_quota(client, respx_mock):
     respx_mock.get("https://textbelt.com/quota/test_key").mock(
@@ -125,6 +173,30 @@ async def test_check_quota(client, respx_mock):
     assert response.success is True
     assert response.quota_remaining == 50
 
+@pytest.mark.asyncio
+async def test_check_quota_cache_coalesces_requests(base_request, respx_mock):
+    async def slow_quota(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"success": True, "quotaRemaining": 50})
+
+    quota_route = respx_mock.get("https://textbelt.com/quota/test_key").mock(side_effect=slow_quota)
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 49, "textId": "12345"}
+        )
+    )
+
+    async with AsyncTextbeltClient(api_key="test_key", quota_cache_ttl=60) as client:
+        responses = await asyncio.gather(*(client.check_quota() for _ in range(8)))
+        assert [r.quota_remaining for r in responses] == [50] * 8
+        assert quota_route.call_count == 1
+
+        # A send refreshes the cached quota
+        await client.send_sms(base_request)
+        assert (await client.check_quota()).quota_remaining == 49
+        assert quota_route.call_count == 1
+
 @pytest.mark.asyncio
 async def test_send_test_sms(client, base_request, respx_mock):
     respx_mock.post("https://textbelt.com/text").mock(
@@ -316,3 +388,133 @@ async def test_verify_otp_invalid(client, respx_mock):
     response = await client.verify_otp(request)
     assert response.success is True
     assert response.is_valid_otp is False
+
+@pytest.mark.asyncio
+async def test_connection_options():
+    client = AsyncTextbeltClient(
+        api_key="test_key",
+        http2=True,
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=30.0,
+    )
+    pool = client._client._transport._pool
+    assert pool._http2 is True
+    assert pool._max_connections == 10
+    assert pool._max_keepalive_connections == 5
+    assert pool._keepalive_expiry == 30.0
+    await client.aclose()
+    assert client._client.is_closed
+
+@pytest.mark.asyncio
+async def test_external_client_not_closed(base_request, respx_mock):
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "success": True,
+                "quotaRemaining": 100,
+                "textId": "12345"
+            }
+        )
+    )
+
+    async with httpx.AsyncClient() as http_client:
+        async with AsyncTextbeltClient(api_key="test_key", client=http_client) as client:
+            response = await client.send_sms(base_request)
+            assert response.success is True
+        assert not http_client.is_closed
+
+@pytest.mark.asyncio
+async def test_send_sms_retries_rate_limit(base_request, respx_mock, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("textbelt_utils.async_client.asyncio.sleep", fake_sleep)
+    respx_mock.post("https://textbelt.com/text").mock(
+        side_effect=[
+            httpx.Response(429, json={"success": False, "retryAfter": 3}),
+            httpx.Response(503),
+            httpx.Response(200, json={"success": True, "quotaRemaining": 100, "textId": "12345"}),
+        ]
+    )
+
+    async with AsyncTextbeltClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_attempts=3, jitter=False),
+    ) as client:
+        response = await client.send_sms(base_request)
+
+    assert response.success is True
+    assert delays == [3.0, 1.0]
+
+@pytest.mark.asyncio
+async def test_send_is_not_retried_after_read_timeout(base_request, respx_mock):
+    route = respx_mock.post("https://textbelt.com/text").mock(side_effect=[
+        httpx.ReadTimeout("read timed out"),
+        httpx.Response(200, json={"success": True, "quotaRemaining": 100, "textId": "12345"}),
+    ])
+
+    async with AsyncTextbeltClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+    ) as client:
+        with pytest.raises(RequestTimeoutError):
+            await client.send_sms(base_request)
+
+    assert route.call_count == 1
+
+@pytest.mark.asyncio
+async def test_send_is_retried_when_connection_fails(base_request, respx_mock):
+    route = respx_mock.post("https://textbelt.com/text").mock(side_effect=[
+        httpx.ConnectError("connection refused"),
+        httpx.Response(200, json={"success": True, "quotaRemaining": 100, "textId": "12345"}),
+    ])
+
+    async with AsyncTextbeltClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+    ) as client:
+        response = await client.send_sms(base_request)
+
+    assert response.success is True
+    assert route.call_count == 2
+
+@pytest.mark.asyncio
+async def test_status_is_retried_after_read_timeout(respx_mock):
+    route = respx_mock.get("https://textbelt.com/status/12345").mock(side_effect=[
+        httpx.ReadTimeout("read timed out"),
+        httpx.Response(200, json={"status": "DELIVERED"}),
+    ])
+
+    async with AsyncTextbeltClient(
+        api_key="test_key",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0, jitter=False),
+    ) as client:
+        response = await client.check_status("12345")
+
+    assert response.status == "DELIVERED"
+    assert route.call_count == 2
+
+@pytest.mark.asyncio
+async def test_read_timeout_raises_request_timeout_error(client, respx_mock):
+    respx_mock.get("https://textbelt.com/status/12345").mock(
+        side_effect=httpx.ReadTimeout("read timed out")
+    )
+
+    with pytest.raises(RequestTimeoutError):
+        await client.check_status("12345")
+
+@pytest.mark.asyncio
+async def test_total_timeout(respx_mock):
+    async def slow_response(request):
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={"status": "SENT"})
+
+    respx_mock.get("https://textbelt.com/status/12345").mock(side_effect=slow_response)
+
+    async with AsyncTextbeltClient(api_key="test_key", total_timeout=0.05) as client:
+        with pytest.raises(RequestTimeoutError):
+            await client.check_status("12345")
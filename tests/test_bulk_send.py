@@ -1,8 +1,10 @@
+import json
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
 from textbelt_utils.client import TextbeltClient
-from textbelt_utils.models import BulkSMSRequest, SMSResponse
+from textbelt_utils.models import BulkSMSRequest, SMSRequest, SMSResponse
 from textbelt_utils.exceptions import (
     QuotaExceededError,
     InvalidRequestError,
@@ -83,7 +85,7 @@ class TestBulkSMS(unittest.TestCase):
                 delay_between_messages=0.01
             )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_bulk_send_success(self, mock_post):
         mock_response = Mock()
         mock_response.ok = True
@@ -102,7 +104,7 @@ class TestBulkSMS(unittest.TestCase):
         self.assertTrue(response.success)
         self.assertFalse(response.partial_success)
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_bulk_send_partial_failure(self, mock_post):
         def mock_send(*args, **kwargs):
             data = kwargs.get('data', {})
@@ -137,7 +139,7 @@ class TestBulkSMS(unittest.TestCase):
         self.assertEqual(len(response.errors), 1)
         self.assertIn("Invalid number", response.errors["+12025550109"])
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_bulk_send_quota_exceeded(self, mock_post):
         def mock_send(*args, **kwargs):
             return Mock(
@@ -155,7 +157,7 @@ class TestBulkSMS(unittest.TestCase):
             self.client.send_bulk_sms(self.base_request)
         self.assertIn("quota exceeded", str(context.exception))
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_bulk_send_rate_limit(self, mock_post):
         def mock_send(*args, **kwargs):
             return Mock(
@@ -174,5 +176,354 @@ class TestBulkSMS(unittest.TestCase):
             self.client.send_bulk_sms(self.base_request)
         self.assertEqual(context.exception.retry_after, 60)
 
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_threaded(self, mock_post, mock_sleep):
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+        barrier = threading.Barrier(4)
+
+        def mock_send(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            try:
+                barrier.wait(timeout=0.05)
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                in_flight -= 1
+            phone = kwargs['data']['phone']
+            if phone.endswith("7"):
+                return Mock(ok=True, status_code=200, json=lambda: {
+                    "success": False,
+                    "error": "Invalid number",
+                    "quotaRemaining": 99
+                })
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": 100,
+                "textId": "12345"
+            })
+
+        mock_post.side_effect = mock_send
+        phones = [f"+1{i:010d}" for i in range(20)]
+        request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+        response = self.client.send_bulk_sms(request, max_workers=4)
+
+        self.assertEqual(response.total_messages, 20)
+        self.assertEqual(response.successful_messages, 18)
+        self.assertEqual(set(response.errors), {"+10000000007", "+10000000017"})
+        self.assertEqual(mock_post.call_count, 20)
+        self.assertTrue(1 < max_in_flight <= 4)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_threaded_quota_exceeded(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": False,
+            "quotaRemaining": 0,
+            "error": "Out of quota"
+        })
+        phones = [f"+1{i:010d}" for i in range(100)]
+        request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+        with self.assertRaises(QuotaExceededError):
+            self.client.send_bulk_sms(request, max_workers=2)
+        # Dispatching stops at the first critical error
+        self.assertLess(mock_post.call_count, 100)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_skips_revalidation(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+
+        with patch.object(SMSRequest, '__post_init__') as mock_validate:
+            response = self.client.send_bulk_sms(self.base_request)
+
+        self.assertTrue(response.success)
+        mock_validate.assert_not_called()
+        sent = [call.kwargs['data']['phone'] for call in mock_post.call_args_list]
+        self.assertEqual(sent, ["+12025550108", "+12025550109"])
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_skips_duplicate_phones(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109", " +12025550108"],
+            message="Test bulk message",
+            key="test_key"
+        )
+
+        response = self.client.send_bulk_sms(request)
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(response.total_messages, 2)
+        self.assertEqual(response.duplicates_removed, 1)
+        self.assertTrue(response.success)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_without_deduplication_reports_each_phone_once(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109", "+12025550108"],
+            message="Test bulk message",
+            key="test_key",
+            deduplicate=False,
+        )
+
+        response = self.client.send_bulk_sms(request)
+
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(list(response.results), ["+12025550108", "+12025550109"])
+        self.assertEqual(len(response.results), len(dict(response.results)))
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_accepts_integer_text_ids(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": 12345
+        })
+
+        response = self.client.send_bulk_sms(self.base_request)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.results["+12025550108"].text_id, 12345)
+        self.assertEqual(json.loads(json.dumps(response.errors.to_dict())), {})
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_bulk_send_respect_quota(self, mock_post, mock_get, mock_sleep):
+        quota = {"remaining": 2}
+
+        def mock_send(*args, **kwargs):
+            quota["remaining"] -= 1
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": quota["remaining"],
+                "textId": "12345"
+            })
+
+        mock_get.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 2
+        })
+        mock_post.side_effect = mock_send
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109", "+12025550110", "+12025550111"],
+            message="Test bulk message",
+            key="test_key"
+        )
+
+        for max_workers in (None, 2):
+            quota["remaining"] = 2
+            if max_workers is not None:
+                # Simulate a top-up reported by another response
+                self.client._quota.update(2)
+            mock_post.reset_mock()
+            response = self.client.send_bulk_sms(
+                request, max_workers=max_workers, respect_quota=True
+            )
+
+            self.assertEqual(mock_post.call_count, 2)
+            self.assertEqual(response.successful_messages, 2)
+            self.assertEqual(len(response.errors), 2)
+            self.assertIn("quota", response.errors["+12025550111"])
+            self.assertEqual(self.client.quota_remaining, 0)
+            self.assertEqual(self.client._quota.available, 0)
+
+        # Quota is only checked when the tracker has not seen it yet
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_respect_quota_with_out_of_order_responses(self, mock_post, mock_sleep):
+        # The server answers +12025550108 (quota 2) before +12025550109 (quota 1),
+        # but the second response reaches the client first
+        first_started = threading.Event()
+
+        def mock_send(*args, **kwargs):
+            phone = kwargs['data']['phone']
+            if phone == "+12025550108":
+                first_started.set()
+                # time.sleep is patched, so poll with an Event timeout instead
+                for _ in range(500):
+                    if self.client.quota_remaining == 1:
+                        break
+                    threading.Event().wait(0.01)
+                remaining = 2
+            elif phone == "+12025550109":
+                first_started.wait(5)
+                remaining = 1
+            else:
+                remaining = 0
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": remaining,
+                "textId": "12345"
+            })
+
+        mock_post.side_effect = mock_send
+        self.client._quota.update(3)
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109", "+12025550110", "+12025550111"],
+            message="Test bulk message",
+            key="test_key"
+        )
+
+        response = self.client.send_bulk_sms(request, max_workers=2, respect_quota=True)
+
+        # One message was still affordable once the late response settled
+        self.assertEqual(response.successful_messages, 3)
+        self.assertEqual(list(response.errors), ["+12025550111"])
+        self.assertIn("quota", response.errors["+12025550111"])
+        self.assertEqual(self.client._quota.available, 0)
+
+    def test_trusted_request_matches_validated_request(self):
+        trusted = SMSRequest._trusted("+12025550108", "Hello", "test_key", sender="Acme")
+        self.assertEqual(
+            trusted,
+            SMSRequest(phone="+12025550108", message="Hello", key="test_key", sender="Acme")
+        )
+
+    def test_bulk_send_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            self.client.send_bulk_sms(self.base_request, max_workers=0)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_stream(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        consumed = []
+
+        def recipients():
+            for phone in ["+12025550108", "not-a-phone", "+12025550109"]:
+                consumed.append(phone)
+                yield phone
+
+        stream = self.client.send_bulk_sms_stream(recipients(), message="Hello")
+
+        # Recipients are consumed lazily, one result at a time
+        first = next(stream)
+        self.assertEqual(first.phone, "+12025550108")
+        self.assertTrue(first.success)
+        self.assertEqual(consumed, ["+12025550108"])
+
+        rest = list(stream)
+        self.assertEqual([r.phone for r in rest], ["not-a-phone", "+12025550109"])
+        self.assertFalse(rest[0].success)
+        self.assertIn("E.164", rest[0].error)
+        self.assertTrue(rest[1].success)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_stream_threaded_individual_messages(self, mock_post, mock_sleep):
+        mock_post.side_effect = lambda *args, **kwargs: Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": kwargs['data']['message']
+        })
+        recipients = ((f"+1{i:010d}", f"Message {i}") for i in range(50))
+
+        results = list(self.client.send_bulk_sms_stream(recipients, max_workers=4))
+
+        self.assertEqual(len(results), 50)
+        self.assertTrue(all(r.success for r in results))
+        self.assertEqual(
+            {r.phone: r.response.text_id for r in results}["+10000000007"],
+            "Message 7"
+        )
+
+    @patch('requests.Session.post')
+    def test_bulk_send_deadline_returns_partial_results(self, mock_post):
+        clock = [0.0]
+
+        def mock_send(*args, **kwargs):
+            clock[0] += 1.0
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": 100,
+                "textId": "12345"
+            })
+
+        mock_post.side_effect = mock_send
+        phones = [f"+1{i:010d}" for i in range(10)]
+        request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+        with patch('textbelt_utils.client.time.monotonic', lambda: clock[0]), \
+                patch('textbelt_utils.client.time.sleep'):
+            response = self.client.send_bulk_sms(request, deadline=3.5)
+
+        self.assertEqual(response.total_messages, 10)
+        self.assertEqual(response.successful_messages, 4)
+        self.assertEqual(len(response.errors), 6)
+        self.assertIn("deadline", response.errors["+10000000009"])
+
+    @patch('requests.Session.post')
+    def test_bulk_send_deadline_skips_queued_threaded_sends(self, mock_post):
+        clock = [0.0]
+        dispatcher_reads = [0]
+        main = threading.current_thread()
+        # Set once the dispatcher has computed the deadline and queued 4 calls
+        queued = threading.Event()
+        # Both workers are mid-request when the deadline passes
+        in_flight = threading.Barrier(2, timeout=5)
+
+        def monotonic():
+            if threading.current_thread() is main:
+                dispatcher_reads[0] += 1
+                if dispatcher_reads[0] >= 5:
+                    queued.set()
+            return clock[0]
+
+        def mock_send(*args, **kwargs):
+            queued.wait(5)
+            in_flight.wait()
+            clock[0] = 1.0
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": 100,
+                "textId": "12345"
+            })
+
+        mock_post.side_effect = mock_send
+        phones = [f"+1{i:010d}" for i in range(10)]
+        request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+        with patch('textbelt_utils.client.time.monotonic', monotonic), \
+                patch('textbelt_utils.client.time.sleep'):
+            response = self.client.send_bulk_sms(request, max_workers=2, deadline=0.5)
+
+        # The two calls queued behind those in flight are not sent after the deadline
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(response.successful_messages, 2)
+        self.assertEqual(len(response.errors), 8)
+        self.assertIn("deadline", response.errors["+10000000009"])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
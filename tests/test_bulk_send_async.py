@@ -7,6 +7,8 @@ import pytest_asyncio
 
 from textbelt_utils.async_client import AsyncTextbeltClient
 from textbelt_utils.models import BulkSMSRequest, SMSResponse
+from textbelt_utils.journal import SendJournal
+from textbelt_utils.rate_limit import RateLimiter
 from textbelt_utils.exceptions import (
     QuotaExceededError,
     InvalidRequestError,
@@ -232,4 +234,205 @@ async def test_bulk_send_concurrent_batching(client, respx_mock):
 
     assert response.total_messages == 150
     assert response.successful_messages == 150
-    assert max_concurrent <= 50  # Ensure we don't exceed batch size 
\ No newline at end of file
+    assert max_concurrent <= 50  # Ensure we don't exceed batch size 
+
+@pytest.mark.asyncio
+async def test_bulk_send_sliding_window(client, respx_mock):
+    phones = [f"+1{i:010d}" for i in range(40)]
+    request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+    in_flight = 0
+    max_in_flight = 0
+    completed = 0
+    completed_during_slow = 0
+
+    async def mock_response(request):
+        nonlocal in_flight, max_in_flight, completed, completed_during_slow
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        slow = b"%2B10000000000" in request.content
+        await asyncio.sleep(0.2 if slow else 0.01)
+        if slow:
+            completed_during_slow = completed
+        completed += 1
+        in_flight -= 1
+        return httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 100, "textId": "12345"}
+        )
+
+    respx_mock.post("https://textbelt.com/text").mock(side_effect=mock_response)
+
+    # Pace with a generous limiter so the fixed per-message delay is skipped
+    client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+    response = await client.send_bulk_sms(request, max_concurrency=5)
+
+    assert response.successful_messages == 40
+    assert max_in_flight == 5
+    # The other workers kept going while the first request was slow
+    assert completed_during_slow == 39
+
+@pytest.mark.asyncio
+async def test_bulk_send_sliding_window_propagates_critical_errors(client, respx_mock):
+    phones = [f"+1{i:010d}" for i in range(20)]
+    request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={"success": False, "quotaRemaining": 0, "error": "Out of quota"}
+        )
+    )
+
+    with pytest.raises(QuotaExceededError):
+        await client.send_bulk_sms(request, max_concurrency=4)
+    assert respx_mock.calls.call_count <= 4
+
+@pytest.mark.asyncio
+async def test_bulk_send_invalid_concurrency(client, base_request):
+    with pytest.raises(ValueError):
+        await client.send_bulk_sms(base_request, max_concurrency=0)
+
+@pytest.mark.asyncio
+async def test_bulk_send_stream(client, respx_mock):
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 100, "textId": "12345"}
+        )
+    )
+    client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+
+    async def recipients():
+        for i in range(30):
+            yield f"+1{i:010d}"
+        yield "bad-number"
+
+    results = [
+        result
+        async for result in client.send_bulk_sms_stream(
+            recipients(), message="Hello", max_concurrency=5
+        )
+    ]
+
+    assert len(results) == 31
+    assert sum(r.success for r in results) == 30
+    failed = [r for r in results if not r.success]
+    assert failed[0].phone == "bad-number"
+    assert respx_mock.calls.call_count == 30
+
+@pytest.mark.asyncio
+async def test_bulk_send_stream_sync_iterable_and_critical_error(client, respx_mock):
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={"success": False, "quotaRemaining": 0, "error": "Out of quota"}
+        )
+    )
+    recipients = [(f"+1{i:010d}", f"Message {i}") for i in range(10)]
+
+    with pytest.raises(QuotaExceededError):
+        async for _ in client.send_bulk_sms_stream(recipients, max_concurrency=2):
+            pass
+
+@pytest.mark.asyncio
+async def test_bulk_send_stream_yields_in_flight_sends_before_critical_error(client, respx_mock):
+    async def mock_response(request):
+        if b"%2B10000000000" in request.content:
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={"success": False, "quotaRemaining": 0, "error": "Out of quota"}
+            )
+        # Still in flight when the quota error arrives
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 100, "textId": "12345"}
+        )
+
+    respx_mock.post("https://textbelt.com/text").mock(side_effect=mock_response)
+    client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+    recipients = [f"+1{i:010d}" for i in range(20)]
+    results = []
+
+    with pytest.raises(QuotaExceededError):
+        async for result in client.send_bulk_sms_stream(
+            recipients, message="Hello", max_concurrency=5
+        ):
+            results.append(result)
+
+    assert respx_mock.calls.call_count == 5
+    assert len(results) == 4
+    assert all(r.success for r in results)
+
+@pytest.mark.asyncio
+async def test_bulk_send_resume_from_journal(client, respx_mock, tmp_path):
+    phones = [f"+1{i:010d}" for i in range(6)]
+    request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+    respx_mock.post("https://textbelt.com/text").mock(
+        return_value=httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 100, "textId": "12345"}
+        )
+    )
+
+    with SendJournal(str(tmp_path / "journal.db")) as journal:
+        journal.record(phones[0], response=SMSResponse(True, 100, "12345"))
+        journal.record(phones[1], response=SMSResponse(True, 100, "12345"))
+        response = await client.resume_bulk_sms(request, journal, max_concurrency=2)
+        assert journal.completed() == set(phones)
+
+    assert response.total_messages == 4
+    assert respx_mock.calls.call_count == 4
+
+@pytest.mark.asyncio
+async def test_bulk_send_deadline_returns_partial_results(client, respx_mock):
+    async def slow_response(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": 100, "textId": "12345"}
+        )
+
+    respx_mock.post("https://textbelt.com/text").mock(side_effect=slow_response)
+    client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+    phones = [f"+1{i:010d}" for i in range(20)]
+    request = BulkSMSRequest(phones=phones, message="Test message", key="test_key")
+
+    response = await client.send_bulk_sms(request, max_concurrency=2, deadline=0.12)
+
+    assert response.total_messages == 20
+    assert 0 < response.successful_messages < 20
+    assert response.successful_messages + len(response.errors) == 20
+    assert all("deadline" in error for error in response.errors.values())
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [None, 3])
+async def test_bulk_send_respect_quota(client, respx_mock, max_concurrency):
+    quota = {"remaining": 3}
+
+    def send(request):
+        quota["remaining"] -= 1
+        return httpx.Response(
+            200,
+            json={"success": True, "quotaRemaining": quota["remaining"], "textId": "12345"}
+        )
+
+    respx_mock.get("https://textbelt.com/quota/test_key").mock(return_value=httpx.Response(
+        200, json={"success": True, "quotaRemaining": 3}
+    ))
+    send_route = respx_mock.post("https://textbelt.com/text").mock(side_effect=send)
+    client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+    phones = [f"+1{i:010d}" for i in range(5)]
+    request = BulkSMSRequest(phones=phones, message="Test message", key="test_key", batch_size=2)
+
+    response = await client.send_bulk_sms(
+        request, max_concurrency=max_concurrency, respect_quota=True
+    )
+
+    assert send_route.call_count == 3
+    assert response.successful_messages == 3
+    assert len(response.errors) == 2
+    assert all("quota" in error for error in response.errors.values())
+    assert client.quota_remaining == 0
+    assert client._quota.available == 0
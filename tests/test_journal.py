@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from textbelt_utils.client import TextbeltClient
+from textbelt_utils.journal import SendJournal
+from textbelt_utils.models import BulkSMSRequest, SMSResponse
+from textbelt_utils.exceptions import QuotaExceededError
+
+PHONES = [f"+1{i:010d}" for i in range(10)]
+
+class TestSendJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "journal.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_records_are_batched_and_durable(self):
+        journal = SendJournal(self.path, flush_every=3, flush_interval=60)
+        journal.record("+12025550108", response=SMSResponse(True, 99, "id-1"))
+        journal.record("+12025550109", error="Invalid number")
+
+        # Nothing is committed until the batch fills up
+        reader = SendJournal(self.path)
+        self.assertEqual(reader.completed(include_failed=True), set())
+
+        journal.record("+12025550110", response=SMSResponse(True, 98, "id-2"))
+        self.assertEqual(reader.completed(), {"+12025550108", "+12025550110"})
+        self.assertEqual(
+            reader.completed(include_failed=True),
+            {"+12025550108", "+12025550109", "+12025550110"}
+        )
+        self.assertEqual(
+            sorted(reader.text_ids()),
+            [("+12025550108", "id-1"), ("+12025550110", "id-2")]
+        )
+        journal.close()
+        reader.close()
+
+    def test_close_flushes(self):
+        with SendJournal(self.path, flush_every=100, flush_interval=60) as journal:
+            journal.record("+12025550108", response=SMSResponse(True, 99, "id-1"))
+        with SendJournal(self.path) as journal:
+            self.assertEqual(journal.completed(), {"+12025550108"})
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_resume_skips_sent_recipients(self, mock_post, mock_sleep):
+        sent = []
+
+        def mock_send(*args, **kwargs):
+            phone = kwargs['data']['phone']
+            sent.append(phone)
+            if len(sent) == 4:
+                return Mock(ok=True, status_code=200, json=lambda: {
+                    "success": False,
+                    "quotaRemaining": 0,
+                    "error": "Out of quota"
+                })
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": 100,
+                "textId": f"id-{phone}"
+            })
+
+        mock_post.side_effect = mock_send
+        client = TextbeltClient(api_key="test_key")
+        request = BulkSMSRequest(phones=PHONES, message="Test message", key="test_key")
+
+        with SendJournal(self.path, flush_every=50) as journal:
+            with self.assertRaises(QuotaExceededError):
+                client.send_bulk_sms(request, journal=journal)
+
+        # The first three sends were journaled despite the crash
+        with SendJournal(self.path) as journal:
+            self.assertEqual(journal.completed(), set(PHONES[:3]))
+            response = client.resume_bulk_sms(request, journal)
+
+        self.assertEqual(response.total_messages, 7)
+        self.assertTrue(response.success)
+        self.assertEqual(sent[4:], PHONES[3:])
+
+        with SendJournal(self.path) as journal:
+            self.assertEqual(journal.completed(), set(PHONES))
+            response = client.resume_bulk_sms(request, journal)
+        self.assertEqual(response.total_messages, 0)
+
+if __name__ == '__main__':
+    unittest.main()
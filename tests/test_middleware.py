@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import hmac
+import io
+import json
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from textbelt_utils.middleware import WebhookMiddleware, WSGIWebhookMiddleware
+from textbelt_utils.models import WebhookResponse
+from textbelt_utils.webhooks import ReplayGuard, WebhookVerifier
+
+API_KEY = "test_key"
+PATH = "/textbelt/webhook"
+
+def signed(payload=None, api_key=API_KEY):
+    body = json.dumps(payload or {
+        "textId": "123", "fromNumber": "+12025550108", "text": "Hi", "data": "user-1",
+    }).encode()
+    timestamp = str(int(time.time()))
+    signature = hmac.new(api_key.encode(), timestamp.encode() + body, hashlib.sha256).hexdigest()
+    return timestamp, signature, body
+
+# ASGI
+
+async def fallback_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 204, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+async def asgi_post(app, timestamp, signature, body, path=PATH, method="POST", chunk=None):
+    headers = [(b"content-type", b"application/json")]
+    if timestamp is not None:
+        headers.append((b"x-textbelt-timestamp", timestamp.encode()))
+    if signature is not None:
+        headers.append((b"x-textbelt-signature", signature.encode()))
+    scope = {"type": "http", "method": method, "path": path, "headers": headers}
+    chunk = chunk or len(body) or 1
+    messages = [
+        {"type": "http.request", "body": body[i:i + chunk], "more_body": i + chunk < len(body)}
+        for i in range(0, max(len(body), 1), chunk)
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent[0]["status"], dict(sent[0]["headers"])
+
+@pytest.mark.asyncio
+async def test_asgi_verifies_and_hands_off():
+    received = []
+
+    async def handler(webhook):
+        received.append(webhook)
+
+    app = WebhookMiddleware(fallback_app, WebhookVerifier(API_KEY), handler)
+    status, _ = await asgi_post(app, *signed(), chunk=10)
+    await app.join()
+
+    assert status == 200
+    assert received == [WebhookResponse("123", "+12025550108", "Hi", "user-1")]
+    await app.aclose()
+
+@pytest.mark.asyncio
+async def test_asgi_rejects_bad_requests():
+    received = []
+    app = WebhookMiddleware(fallback_app, WebhookVerifier(API_KEY), received.append, max_body_size=1000)
+    timestamp, signature, body = signed()
+
+    assert (await asgi_post(app, timestamp, "0" * 64, body))[0] == 401
+    assert (await asgi_post(app, None, None, body))[0] == 401
+    assert (await asgi_post(app, timestamp, signature, body, method="GET"))[0] == 405
+    assert (await asgi_post(app, *signed({"unexpected": True})))[0] == 400
+    assert (await asgi_post(app, *signed({"text": "x" * 2000})))[0] == 413
+    assert (await asgi_post(app, timestamp, signature, body, path="/other"))[0] == 204
+    await app.aclose()
+    assert received == []
+
+@pytest.mark.asyncio
+async def test_asgi_rejects_replays():
+    app = WebhookMiddleware(
+        fallback_app, WebhookVerifier(API_KEY, replay_guard=ReplayGuard()), lambda webhook: None
+    )
+    request = signed()
+    assert (await asgi_post(app, *request))[0] == 200
+    assert (await asgi_post(app, *request))[0] == 401
+    await app.aclose()
+
+@pytest.mark.asyncio
+async def test_asgi_backpressure_returns_503():
+    release = asyncio.Event()
+    handled = []
+
+    async def slow_handler(webhook):
+        await release.wait()
+        handled.append(webhook.text_id)
+
+    app = WebhookMiddleware(
+        fallback_app, WebhookVerifier(API_KEY), slow_handler, workers=1, queue_size=2
+    )
+    statuses = []
+    for i in range(5):
+        statuses.append((await asgi_post(app, *signed({
+            "textId": str(i), "fromNumber": "+12025550108", "text": "Hi",
+        })))[0])
+        await asyncio.sleep(0)
+
+    # One webhook in the worker, two queued, the rest shed
+    assert statuses == [200, 200, 200, 503, 503]
+    release.set()
+    await app.aclose()
+    assert handled == ["0", "1", "2"]
+
+@pytest.mark.asyncio
+async def test_asgi_sync_handler_errors_are_reported():
+    errors = []
+
+    def handler(webhook):
+        raise RuntimeError("boom")
+
+    app = WebhookMiddleware(
+        fallback_app, WebhookVerifier(API_KEY), handler,
+        on_error=lambda webhook, error: errors.append((webhook.text_id, str(error))),
+    )
+    assert (await asgi_post(app, *signed()))[0] == 200
+    await app.aclose()
+    assert errors == [("123", "boom")]
+
+@pytest.mark.asyncio
+async def test_asgi_lifespan_shutdown_drains_queue():
+    handled = []
+
+    async def handler(webhook):
+        await asyncio.sleep(0.01)
+        handled.append(webhook.text_id)
+
+    async def lifespan_app(scope, receive, send):
+        message = await receive()
+        assert message["type"] == "lifespan.shutdown"
+        assert handled == ["123"]
+
+    app = WebhookMiddleware(lifespan_app, WebhookVerifier(API_KEY), handler)
+    await asgi_post(app, *signed())
+
+    async def receive():
+        return {"type": "lifespan.shutdown"}
+
+    await app({"type": "lifespan"}, receive, None)
+
+# WSGI
+
+def fallback_wsgi(environ, start_response):
+    start_response("204 No Content", [])
+    return [b""]
+
+def wsgi_post(app, timestamp, signature, body, path=PATH, method="POST"):
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": io.BytesIO(body),
+    }
+    if timestamp is not None:
+        environ["HTTP_X_TEXTBELT_TIMESTAMP"] = timestamp
+    if signature is not None:
+        environ["HTTP_X_TEXTBELT_SIGNATURE"] = signature
+    setup_testing_defaults(environ)
+    response = {}
+
+    def start_response(status, headers):
+        response["status"] = int(status.split()[0])
+        response["headers"] = dict(headers)
+
+    b"".join(app(environ, start_response))
+    return response["status"], response["headers"]
+
+def test_wsgi_verifies_and_hands_off():
+    received = []
+    app = WSGIWebhookMiddleware(fallback_wsgi, WebhookVerifier(API_KEY), received.append)
+    timestamp, signature, body = signed()
+
+    assert wsgi_post(app, timestamp, signature, body)[0] == 200
+    assert wsgi_post(app, timestamp, "0" * 64, body)[0] == 401
+    assert wsgi_post(app, timestamp, signature, body, method="PUT")[0] == 405
+    assert wsgi_post(app, timestamp, signature, body, path="/other")[0] == 204
+    app.close()
+
+    assert received == [WebhookResponse("123", "+12025550108", "Hi", "user-1")]
+
+def test_wsgi_backpressure_returns_503():
+    release = threading.Event()
+    started = threading.Event()
+    handled = []
+
+    def slow_handler(webhook):
+        started.set()
+        release.wait(5)
+        handled.append(webhook.text_id)
+
+    app = WSGIWebhookMiddleware(
+        fallback_wsgi, WebhookVerifier(API_KEY), slow_handler, workers=1, queue_size=1
+    )
+    first = wsgi_post(app, *signed({"textId": "0", "fromNumber": "+1", "text": "a"}))
+    assert started.wait(5)
+    second = wsgi_post(app, *signed({"textId": "1", "fromNumber": "+1", "text": "b"}))
+    status, headers = wsgi_post(app, *signed({"textId": "2", "fromNumber": "+1", "text": "c"}))
+
+    assert (first[0], second[0], status) == (200, 200, 503)
+    assert headers["Retry-After"] == "5"
+    release.set()
+    app.close()
+    assert handled == ["0", "1"]
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        WSGIWebhookMiddleware(fallback_wsgi, WebhookVerifier(API_KEY), print, workers=0)
+    with pytest.raises(ValueError):
+        WebhookMiddleware(fallback_app, WebhookVerifier(API_KEY), print, queue_size=0)
@@ -0,0 +1,148 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from textbelt_utils.async_client import AsyncTextbeltClient
+from textbelt_utils.client import TextbeltClient
+from textbelt_utils.exceptions import QuotaExceededError, RequestTimeoutError
+from textbelt_utils.journal import SendJournal
+from textbelt_utils.mock_server import MockTextbeltServer
+from textbelt_utils.models import (
+    BulkSMSRequest,
+    OTPGenerateRequest,
+    OTPVerifyRequest,
+    SMSRequest,
+)
+from textbelt_utils.rate_limit import RateLimiter
+from textbelt_utils.retry import RetryPolicy
+
+class TestMockServer(unittest.TestCase):
+    def setUp(self):
+        self.server = MockTextbeltServer(quota=5).start()
+        self.client = TextbeltClient(api_key="test_key", base_url=self.server.url)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_send_status_and_quota(self):
+        response = self.client.send_sms(
+            SMSRequest(phone="+12025550108", message="Hello", key="test_key")
+        )
+        self.assertTrue(response.success)
+        self.assertEqual(response.quota_remaining, 4)
+
+        status = self.client.check_status(response.text_id)
+        self.assertEqual(status.status, "DELIVERED")
+        self.assertEqual(self.client.check_quota().quota_remaining, 4)
+
+    def test_quota_runs_out(self):
+        request = BulkSMSRequest(
+            phones=[f"+1{i:010d}" for i in range(10)],
+            message="Hello",
+            key="test_key",
+        )
+        self.client._rate_limiter = RateLimiter(rate=10000, burst=10000)
+
+        with self.assertRaises(QuotaExceededError):
+            self.client.send_bulk_sms(request, max_workers=2)
+        self.assertEqual(self.server.messages_sent, 5)
+
+    def test_async_otp_round_trip(self):
+        async def run():
+            async with AsyncTextbeltClient(api_key="test_key", base_url=self.server.url) as client:
+                generated = await client.generate_otp(
+                    OTPGenerateRequest(phone="+12025550108", userid="user123", key="test_key")
+                )
+                valid = await client.verify_otp(
+                    OTPVerifyRequest(otp=generated.otp, userid="user123", key="test_key")
+                )
+                invalid = await client.verify_otp(
+                    OTPVerifyRequest(otp="0000000", userid="user123", key="test_key")
+                )
+                return valid.is_valid_otp, invalid.is_valid_otp
+
+        self.assertEqual(asyncio.run(run()), (True, False))
+
+    def test_send_not_repeated_after_read_timeout(self):
+        self.server.latency = 0.3
+        client = TextbeltClient(
+            api_key="test_key",
+            base_url=self.server.url,
+            read_timeout=0.2,
+            retry_policy=RetryPolicy(max_attempts=3, backoff_base=0),
+        )
+        with client, self.assertRaises(RequestTimeoutError):
+            client.send_sms(SMSRequest(phone="+12025550108", message="Hello", key="test_key"))
+        time.sleep(0.2)
+        self.assertEqual(self.server.messages_sent, 1)
+
+    def test_stop_with_open_keep_alive_connection(self):
+        server = MockTextbeltServer().start()
+        client = TextbeltClient(api_key="test_key", base_url=server.url)
+        client.send_sms(SMSRequest(phone="+12025550108", message="Hello", key="test_key"))
+        with self.assertNoLogs("asyncio", level="ERROR"):
+            server.stop()
+        client.close()
+
+class TestJournalMatchesServer(unittest.TestCase):
+    """Messages in flight when the quota runs out must still be journaled"""
+
+    def setUp(self):
+        self.server = MockTextbeltServer(quota=150, latency=0.002).start()
+        self.request = BulkSMSRequest(
+            phones=[f"+1{i:010d}" for i in range(300)],
+            message="Hello",
+            key="test_key",
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.journal = SendJournal(os.path.join(directory.name, "journal.db"))
+        self.addCleanup(self.journal.close)
+
+    def tearDown(self):
+        self.server.stop()
+
+    @staticmethod
+    def limiter():
+        # Replaces the fixed delay between messages
+        return RateLimiter(rate=100000, burst=100000)
+
+    def assert_journal_matches_server(self):
+        self.assertEqual(self.server.messages_sent, 150)
+        self.assertEqual(len(self.journal.completed()), self.server.messages_sent)
+
+    def test_threaded(self):
+        with TextbeltClient(
+            api_key="test_key", base_url=self.server.url, pool_maxsize=32, rate_limiter=self.limiter()
+        ) as client:
+            with self.assertRaises(QuotaExceededError):
+                client.send_bulk_sms(self.request, max_workers=32, journal=self.journal)
+        self.assert_journal_matches_server()
+
+    def test_async_batches(self):
+        async def run():
+            async with AsyncTextbeltClient(
+                api_key="test_key", base_url=self.server.url, rate_limiter=self.limiter()
+            ) as client:
+                await client.send_bulk_sms(self.request, journal=self.journal)
+
+        with self.assertRaises(QuotaExceededError):
+            asyncio.run(run())
+        self.assert_journal_matches_server()
+
+    def test_async_window(self):
+        async def run():
+            async with AsyncTextbeltClient(
+                api_key="test_key", base_url=self.server.url, rate_limiter=self.limiter()
+            ) as client:
+                await client.send_bulk_sms(self.request, max_concurrency=32, journal=self.journal)
+
+        with self.assertRaises(QuotaExceededError):
+            asyncio.run(run())
+        self.assert_journal_matches_server()
+
+if __name__ == '__main__':
+    unittest.main()
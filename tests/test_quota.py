@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import unittest
+
+from textbelt_utils.quota import QuotaTracker
+
+class TestQuotaTracker(unittest.TestCase):
+    def test_unknown_until_updated(self):
+        tracker = QuotaTracker()
+        self.assertIsNone(tracker.remaining)
+        self.assertIsNone(tracker.available)
+        self.assertTrue(tracker.reserve())
+
+    def test_reservations_reduce_available(self):
+        tracker = QuotaTracker()
+        tracker.update(2)
+        self.assertTrue(tracker.reserve())
+        self.assertTrue(tracker.reserve())
+        self.assertFalse(tracker.reserve())
+        self.assertEqual(tracker.available, 0)
+        tracker.release(2)
+        self.assertEqual(tracker.available, 2)
+
+    def test_hold_is_settled_by_the_update_of_its_own_send(self):
+        tracker = QuotaTracker()
+        tracker.update(2)
+        with tracker.hold() as held:
+            self.assertTrue(held)
+            self.assertEqual(tracker.available, 1)
+            # The response reports quota after this message was sent
+            tracker.update(1)
+            self.assertEqual(tracker.available, 1)
+        self.assertEqual(tracker.available, 1)
+
+    def test_hold_released_without_update(self):
+        tracker = QuotaTracker()
+        tracker.update(1)
+        with tracker.hold() as held:
+            self.assertTrue(held)
+            with tracker.hold() as second:
+                self.assertFalse(second)
+        self.assertEqual(tracker.available, 1)
+
+    def test_holds_in_other_threads_are_not_settled(self):
+        tracker = QuotaTracker()
+        tracker.update(3)
+        holding = threading.Event()
+        done = threading.Event()
+
+        def worker():
+            with tracker.hold():
+                holding.set()
+                done.wait()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        holding.wait()
+        tracker.update(3)  # e.g. a quota check on another thread
+        self.assertEqual(tracker.available, 2)
+        done.set()
+        thread.join()
+        self.assertEqual(tracker.available, 3)
+
+    def test_late_stale_response_does_not_raise_remaining(self):
+        tracker = QuotaTracker()
+        tracker.update(10)
+        both_holding = threading.Barrier(2)
+        newer_reported = threading.Event()
+
+        def send(reported, wait_for=None):
+            with tracker.hold():
+                both_holding.wait()
+                if wait_for is not None:
+                    wait_for.wait()
+                tracker.update(reported)
+                if wait_for is None:
+                    newer_reported.set()
+
+        # The send that reports 9 was answered first but its response arrives last
+        newer = threading.Thread(target=send, args=(8,))
+        stale = threading.Thread(target=send, args=(9, newer_reported))
+        newer.start()
+        stale.start()
+        newer.join()
+        stale.join()
+
+        self.assertEqual(tracker.remaining, 8)
+        self.assertEqual(tracker.available, 8)
+
+    def test_higher_quota_accepted_when_nothing_is_in_flight(self):
+        tracker = QuotaTracker()
+        tracker.update(2)
+        tracker.update(50)  # e.g. the account was topped up
+        self.assertEqual(tracker.remaining, 50)
+
+    def test_wait_available_lets_out_of_order_sends_settle(self):
+        tracker = QuotaTracker()
+        tracker.update(3)
+        holding = threading.Event()
+        answer = threading.Event()
+
+        def first_send():
+            with tracker.hold():
+                holding.set()
+                answer.wait()
+                tracker.update(2)  # answered first by the server, arrives last
+
+        thread = threading.Thread(target=first_send)
+        thread.start()
+        holding.wait()
+        with tracker.hold():
+            # Already counts the first send, whose reservation is still held
+            tracker.update(1)
+        self.assertEqual(tracker.available, 0)
+        self.assertEqual(tracker.wait_available(timeout=0), 0)
+
+        waited = []
+        waiter = threading.Thread(target=lambda: waited.append(tracker.wait_available()))
+        waiter.start()
+        answer.set()
+        thread.join()
+        waiter.join(5)
+
+        self.assertEqual(waited, [1])
+        self.assertTrue(tracker.reserve())
+
+    def test_wait_available_returns_at_once_when_nothing_is_in_flight(self):
+        tracker = QuotaTracker()
+        self.assertIsNone(tracker.wait_available())
+        tracker.update(0)
+        self.assertEqual(tracker.wait_available(), 0)
+
+    def test_await_available_lets_out_of_order_sends_settle(self):
+        async def run():
+            tracker = QuotaTracker()
+            tracker.update(3)
+            answer = asyncio.Event()
+
+            async def first_send():
+                with tracker.hold():
+                    await answer.wait()
+                    tracker.update(2)
+
+            task = asyncio.ensure_future(first_send())
+            await asyncio.sleep(0)
+            with tracker.hold():
+                tracker.update(1)
+            waiter = asyncio.ensure_future(tracker.await_available())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+            answer.set()
+            await task
+            return await asyncio.wait_for(waiter, 5)
+
+        self.assertEqual(asyncio.run(run()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from textbelt_utils.client import TextbeltClient
+from textbelt_utils.models import BulkSMSRequest
+from textbelt_utils.rate_limit import RateLimiter, TokenBucket
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=3, clock=clock)
+
+        # The first `burst` requests go through immediately
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+
+        # Further requests are spaced 1/rate apart
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+        self.assertAlmostEqual(bucket.reserve(), 0.2)
+
+        # Tokens refill over time, capped at burst
+        clock.now = 10.0
+        self.assertEqual([bucket.reserve() for _ in range(3)], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(bucket.reserve(), 0.1)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+class TestRateLimiter(unittest.TestCase):
+    def test_endpoint_bucket_is_tighter(self):
+        clock = FakeClock()
+        limiter = RateLimiter(
+            rate=100,
+            burst=100,
+            endpoint_limits={"status": TokenBucket(rate=1, burst=1, clock=clock)},
+            clock=clock,
+        )
+
+        self.assertEqual(limiter.reserve("status"), 0.0)
+        self.assertAlmostEqual(limiter.reserve("status"), 1.0)
+        # Other endpoints only consult the global bucket
+        self.assertEqual(limiter.reserve("text"), 0.0)
+
+    def test_unlimited_without_rate(self):
+        limiter = RateLimiter()
+        self.assertEqual(limiter.reserve("text"), 0.0)
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_bulk_send_uses_limiter_instead_of_delay(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        limiter = Mock(spec=RateLimiter)
+        client = TextbeltClient(api_key="test_key", rate_limiter=limiter)
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            message="Test bulk message",
+            key="test_key"
+        )
+
+        response = client.send_bulk_sms(request)
+
+        self.assertTrue(response.success)
+        self.assertEqual(limiter.acquire.call_count, 2)
+        limiter.acquire.assert_called_with("text")
+        mock_sleep.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import unittest
+
+from textbelt_utils.models import BulkSMSResponse, SMSResponse
+from textbelt_utils.results import BulkResultTable
+
+class TestBulkResultTable(unittest.TestCase):
+    def setUp(self):
+        self.table = BulkResultTable()
+        self.table.add_response("+12025550108", SMSResponse(True, 99, "12345"))
+        self.table.add_error("+12025550109", "Invalid number")
+        self.table.add_response("+12025550110", SMSResponse(True, 98, "abc-1"))
+        self.table.add_error("+12025550111", "Invalid number")
+        self.table.add_response("+12025550112", SMSResponse(False, 98, None, "Out of quota"))
+
+    def test_results_view_rebuilds_responses(self):
+        results = self.table.results
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results["+12025550108"], SMSResponse(True, 99, "12345"))
+        self.assertEqual(results["+12025550110"].text_id, "abc-1")
+        self.assertEqual(results["+12025550112"], SMSResponse(False, 98, None, "Out of quota"))
+        self.assertNotIn("+12025550109", results)
+        self.assertEqual(
+            list(results),
+            ["+12025550108", "+12025550110", "+12025550112"]
+        )
+
+    def test_errors_view_interns_messages(self):
+        errors = self.table.errors
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(
+            dict(errors),
+            {"+12025550109": "Invalid number", "+12025550111": "Invalid number"}
+        )
+        self.assertEqual(self.table._error_messages, ["Invalid number", "Out of quota"])
+
+    def test_counts(self):
+        self.assertEqual(len(self.table), 5)
+        self.assertEqual(self.table.successful_count, 2)
+        self.assertEqual(self.table.response_count, 3)
+        self.assertEqual(self.table.error_count, 2)
+
+    def test_text_ids_with_leading_zeros_round_trip(self):
+        table = BulkResultTable()
+        table.add_response("+12025550108", SMSResponse(True, 1, "007"))
+        table.add_response("+12025550109", SMSResponse(True, 1, "0"))
+        self.assertEqual(table.results["+12025550108"].text_id, "007")
+        self.assertEqual(table.results["+12025550109"].text_id, "0")
+
+    def test_text_ids_keep_their_type(self):
+        table = BulkResultTable()
+        table.add_response("+12025550108", SMSResponse(True, 1, "12"))
+        table.add_response("+12025550109", SMSResponse(True, 1, 12345))
+        table.add_error("+12025550110", "Invalid number")
+        table.add_response("+12025550111", SMSResponse(True, 1, "\u0661\u0662\u0663"))
+        table.add_response("+12025550112", SMSResponse(True, 1, 2 ** 70))
+        self.assertEqual(table.results["+12025550108"].text_id, "12")
+        self.assertEqual(table.results["+12025550109"].text_id, 12345)
+        self.assertEqual(table.results["+12025550111"].text_id, "\u0661\u0662\u0663")
+        self.assertEqual(table.results["+12025550112"].text_id, 2 ** 70)
+
+    def test_views_convert_to_dicts(self):
+        self.assertEqual(
+            json.loads(json.dumps(self.table.errors.to_dict())),
+            {"+12025550109": "Invalid number", "+12025550111": "Invalid number"}
+        )
+        self.assertIs(type(self.table.results.to_dict()), dict)
+        self.assertIn(("+12025550110", SMSResponse(True, 98, "abc-1")), self.table.results.items())
+        self.assertEqual(len(self.table.results.values()), 3)
+
+    def test_lookup_sees_rows_added_after_first_access(self):
+        table = BulkResultTable()
+        table.add_error("+12025550108", "Invalid number")
+        self.assertNotIn("+12025550109", table.errors)
+        table.add_error("+12025550109", "Timed out")
+        self.assertEqual(table.errors["+12025550109"], "Timed out")
+
+    def test_views_compare_equal_to_dicts(self):
+        response = BulkSMSResponse(
+            total_messages=5,
+            successful_messages=self.table.successful_count,
+            failed_messages=3,
+            results=self.table.results,
+            errors=self.table.errors,
+        )
+        self.assertTrue(response.partial_success)
+        self.assertFalse(response.success)
+        self.assertEqual(
+            response.errors,
+            {"+12025550109": "Invalid number", "+12025550111": "Invalid number"}
+        )
+
+    def test_duplicate_phones_collapse_like_a_dict(self):
+        table = BulkResultTable()
+        table.add_error("+2", "Timed out")
+        table.add_response("+1", SMSResponse(True, 5, "1"))
+        table.add_error("+2", "Invalid number")
+        table.add_response("+1", SMSResponse(True, 4, "2"))
+
+        self.assertEqual(list(table.errors), ["+2"])
+        self.assertEqual(len(table.errors), len(dict(table.errors)))
+        self.assertEqual(dict(table.errors), {"+2": "Invalid number"})
+        self.assertEqual(len(table.results), 1)
+        self.assertEqual(list(table.results.values()), [SMSResponse(True, 4, "2")])
+        self.assertEqual(list(table.results.items()), [("+1", SMSResponse(True, 4, "2"))])
+        self.assertEqual((table.response_count, table.error_count), (2, 2))
+
+    def test_unique_phones_skip_the_index(self):
+        table = BulkResultTable(unique_phones=True)
+        table.add_response("+1", SMSResponse(True, 5, "1"))
+        table.add_error("+2", "Timed out")
+        self.assertEqual(list(table.results), ["+1"])
+        self.assertEqual(len(table.errors), 1)
+        self.assertIsNone(table.results._index)
+        self.assertEqual(table.errors["+2"], "Timed out")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from textbelt_utils.client import TextbeltClient
+from textbelt_utils.models import BulkSMSRequest, SMSRequest
+from textbelt_utils.exceptions import APIError, RateLimitError, RequestTimeoutError
+from textbelt_utils.retry import RetryPolicy, parse_retry_after
+
+SUCCESS = {"success": True, "quotaRemaining": 100, "textId": "12345"}
+
+def make_response(status_code, data, headers=None):
+    return Mock(
+        ok=status_code < 400,
+        status_code=status_code,
+        headers=headers or {},
+        json=lambda: data,
+    )
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backoff_is_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        self.assertEqual([policy.backoff(n) for n in range(1, 5)], [1.0, 2.0, 4.0, 5.0])
+
+    def test_backoff_with_jitter_stays_in_range(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        for attempt in range(1, 6):
+            self.assertTrue(0 <= policy.backoff(attempt) <= 5.0)
+
+    def test_retry_after_takes_precedence(self):
+        policy = RetryPolicy(jitter=False)
+        self.assertEqual(policy.backoff(1, retry_after=7), 7)
+        policy = RetryPolicy(jitter=False, respect_retry_after=False)
+        self.assertEqual(policy.backoff(1, retry_after=7), 0.5)
+
+    def test_retry_after_is_capped_by_backoff_max(self):
+        policy = RetryPolicy(jitter=False, backoff_max=10.0)
+        self.assertEqual(policy.backoff(1, retry_after=3600), 10.0)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after({"retryAfter": 3}, {}), 3.0)
+        self.assertEqual(parse_retry_after(None, {"Retry-After": "4"}), 4.0)
+        self.assertIsNone(parse_retry_after(None, {"Retry-After": "soon"}))
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+@patch('textbelt_utils.client.time.sleep')
+class TestClientRetries(unittest.TestCase):
+    def setUp(self):
+        self.client = TextbeltClient(
+            api_key="test_key",
+            retry_policy=RetryPolicy(max_attempts=3, jitter=False),
+        )
+        self.request = SMSRequest(phone="+1234567890", message="Test message", key="test_key")
+
+    @patch('requests.Session.post')
+    def test_rate_limit_is_retried_after_server_delay(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            make_response(429, {"success": False, "error": "Rate limit exceeded", "retryAfter": 2}),
+            make_response(200, SUCCESS),
+        ]
+
+        response = self.client.send_sms(self.request)
+
+        self.assertTrue(response.success)
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('requests.Session.get')
+    def test_server_error_and_transport_error_are_retried(self, mock_get, mock_sleep):
+        mock_get.side_effect = [
+            requests.ConnectionError("reset"),
+            make_response(503, {"success": False}),
+            make_response(200, {"success": True, "quotaRemaining": 50}),
+        ]
+
+        response = self.client.check_quota()
+
+        self.assertEqual(response.quota_remaining, 50)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0])
+
+    @patch('requests.Session.post')
+    def test_send_is_not_retried_after_read_timeout(self, mock_post, mock_sleep):
+        mock_post.side_effect = [requests.ReadTimeout("read timed out"), make_response(200, SUCCESS)]
+
+        with self.assertRaises(RequestTimeoutError):
+            self.client.send_sms(self.request)
+        self.assertEqual(mock_post.call_count, 1)
+
+    @patch('requests.Session.post')
+    def test_send_is_not_retried_after_connection_reset(self, mock_post, mock_sleep):
+        mock_post.side_effect = [requests.ConnectionError("reset"), make_response(200, SUCCESS)]
+
+        with self.assertRaises(requests.ConnectionError):
+            self.client.send_sms(self.request)
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_send_is_retried_when_connection_fails(self, mock_sleep):
+        # Nothing listens on this port, so the connection is refused before sending
+        client = TextbeltClient(
+            api_key="test_key",
+            base_url="http://127.0.0.1:9",
+            retry_policy=RetryPolicy(max_attempts=3, jitter=False),
+        )
+        with patch.object(client._session, "post", wraps=client._session.post) as post:
+            with self.assertRaises(requests.ConnectionError):
+                client.send_sms(self.request)
+        self.assertEqual(post.call_count, 3)
+
+    @patch('requests.Session.post')
+    def test_send_is_retried_after_connect_timeout(self, mock_post, mock_sleep):
+        mock_post.side_effect = [requests.ConnectTimeout("connect timed out"), make_response(200, SUCCESS)]
+
+        self.assertTrue(self.client.send_sms(self.request).success)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch('requests.Session.post')
+    def test_gives_up_after_max_attempts(self, mock_post, mock_sleep):
+        mock_post.return_value = make_response(500, {"success": False, "error": "Server error"})
+
+        with self.assertRaises(APIError):
+            self.client.send_sms(self.request)
+        self.assertEqual(mock_post.call_count, 3)
+
+    @patch('requests.Session.post')
+    def test_bulk_send_absorbs_transient_rate_limits(self, mock_post, mock_sleep):
+        mock_post.side_effect = [
+            make_response(200, SUCCESS),
+            make_response(429, {"success": False, "retryAfter": 1}),
+            make_response(200, SUCCESS),
+        ]
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            message="Test bulk message",
+            key="test_key"
+        )
+
+        response = self.client.send_bulk_sms(request)
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.successful_messages, 2)
+
+    @patch('requests.Session.post')
+    def test_no_retry_without_policy(self, mock_post, mock_sleep):
+        mock_post.return_value = make_response(429, {"success": False, "retryAfter": 60})
+        client = TextbeltClient(api_key="test_key")
+
+        with self.assertRaises(RateLimitError):
+            client.send_sms(self.request)
+        self.assertEqual(mock_post.call_count, 1)
+
+if __name__ == '__main__':
+    unittest.main()
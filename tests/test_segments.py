@@ -0,0 +1,73 @@
+import unittest
+
+from textbelt_utils.models import BulkSMSRequest
+from textbelt_utils.segments import count_segments, estimate_segments
+from textbelt_utils.templates import MessageTemplate
+
+class TestCountSegments(unittest.TestCase):
+    def test_gsm7(self):
+        self.assertEqual(count_segments("a" * 160).segments, 1)
+        self.assertEqual(count_segments("a" * 161).segments, 2)
+        self.assertEqual(count_segments("a" * 306).segments, 2)
+        self.assertEqual(count_segments("a" * 307).segments, 3)
+        self.assertEqual(count_segments("Café @ 5€").encoding, "GSM-7")
+
+    def test_gsm7_extension_characters_take_two_septets(self):
+        info = count_segments("€" * 80)
+        self.assertEqual((info.units, info.segments), (160, 1))
+        self.assertEqual(count_segments("€" * 81).segments, 2)
+        # An escape sequence is never split across parts
+        self.assertEqual(count_segments("a" * 152 + "€" + "a" * 10).segments, 2)
+        self.assertEqual(count_segments("a" * 152 + "€" * 77).segments, 3)
+
+    def test_ucs2(self):
+        info = count_segments("ą" * 70)
+        self.assertEqual((info.encoding, info.segments), ("UCS-2", 1))
+        self.assertEqual(count_segments("ą" * 71).segments, 2)
+        self.assertEqual(count_segments("ą" * 134).segments, 2)
+        self.assertEqual(count_segments("ą" * 135).segments, 3)
+
+    def test_emoji_take_two_code_units(self):
+        info = count_segments("😀" * 35)
+        self.assertEqual((info.units, info.segments), (70, 1))
+        self.assertEqual(count_segments("😀" * 36).segments, 2)
+        # A surrogate pair is never split across parts
+        self.assertEqual(count_segments("a" * 66 + "😀" + "a" * 66).segments, 3)
+
+class TestEstimateSegments(unittest.TestCase):
+    def test_shared_message(self):
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            message="a" * 200,
+            key="test_key"
+        )
+        estimate = estimate_segments(request, cost_per_segment=0.01)
+        self.assertEqual(estimate.messages, 2)
+        self.assertEqual(estimate.total_segments, 4)
+        self.assertEqual(estimate.max_segments, 2)
+        self.assertAlmostEqual(estimate.estimated_cost, 0.04)
+
+    def test_individual_and_template_messages(self):
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            individual_messages={"+12025550108": "Hi", "+12025550109": "Hi 😀"},
+            key="test_key"
+        )
+        estimate = estimate_segments(request)
+        self.assertEqual(estimate.total_segments, 2)
+        self.assertEqual(estimate.ucs2_messages, 1)
+        self.assertIsNone(estimate.estimated_cost)
+
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            template=MessageTemplate("Hi $name"),
+            variables={"+12025550108": {"name": "x" * 200}, "+12025550109": {}},
+            key="test_key"
+        )
+        estimate = estimate_segments(request)
+        self.assertEqual(estimate.messages, 1)
+        self.assertEqual(estimate.total_segments, 2)
+        self.assertEqual(estimate.unrenderable, 1)
+
+if __name__ == '__main__':
+    unittest.main()
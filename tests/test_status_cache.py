@@ -0,0 +1,88 @@
+import unittest
+
+from textbelt_utils.models import StatusResponse
+from textbelt_utils.status_cache import StatusCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_terminal_status_never_expires(self):
+        cache = StatusCache(pending_ttl=5, clock=self.clock)
+        cache.put("1", StatusResponse(status="DELIVERED"))
+        self.clock.now = 10**6
+        self.assertEqual(cache.get("1").status, "DELIVERED")
+        self.assertEqual(cache.hits, 1)
+
+    def test_pending_status_expires_after_ttl(self):
+        cache = StatusCache(pending_ttl=5, clock=self.clock)
+        cache.put("1", StatusResponse(status="SENDING"))
+        self.clock.now = 4.9
+        self.assertEqual(cache.get("1").status, "SENDING")
+        self.clock.now = 5.0
+        self.assertIsNone(cache.get("1"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 1)
+
+    def test_zero_ttl_only_caches_terminal_statuses(self):
+        cache = StatusCache(pending_ttl=0, clock=self.clock)
+        cache.put("1", StatusResponse(status="SENT"))
+        self.assertIsNone(cache.get("1"))
+
+    def test_terminal_status_replaces_pending(self):
+        cache = StatusCache(clock=self.clock)
+        cache.put("1", StatusResponse(status="SENT"))
+        cache.put("1", StatusResponse(status="FAILED"))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get("1").status, "FAILED")
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = StatusCache(maxsize=2, clock=self.clock)
+        cache.put("1", StatusResponse(status="DELIVERED"))
+        cache.put("2", StatusResponse(status="DELIVERED"))
+        cache.get("1")
+        cache.put("3", StatusResponse(status="FAILED"))
+        self.assertIsNone(cache.get("2"))
+        self.assertIsNotNone(cache.get("1"))
+        self.assertIsNotNone(cache.get("3"))
+
+    def test_pending_entries_are_bounded(self):
+        cache = StatusCache(maxsize=2, clock=self.clock)
+        for text_id in "123":
+            cache.put(text_id, StatusResponse(status="SENT"))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("1"))
+
+    def test_custom_store_holds_terminal_statuses(self):
+        store = {}
+        cache = StatusCache(maxsize=1, store=store, clock=self.clock)
+        cache.put("1", StatusResponse(status="DELIVERED"))
+        cache.put("2", StatusResponse(status="FAILED"))
+        cache.put("3", StatusResponse(status="SENT"))
+        self.assertEqual(store, {"1": "DELIVERED", "2": "FAILED"})
+        self.assertEqual(StatusCache(store=store).get("2").status, "FAILED")
+
+    def test_invalidate_and_clear(self):
+        cache = StatusCache(clock=self.clock)
+        cache.put("1", StatusResponse(status="DELIVERED"))
+        cache.put("2", StatusResponse(status="SENT"))
+        cache.invalidate("1")
+        self.assertIsNone(cache.get("1"))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            StatusCache(maxsize=0)
+        with self.assertRaises(ValueError):
+            StatusCache(pending_ttl=-1)
+
+if __name__ == "__main__":
+    unittest.main()
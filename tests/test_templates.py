@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from textbelt_utils.client import TextbeltClient
+from textbelt_utils.models import BulkSMSRequest
+from textbelt_utils.templates import MessageTemplate
+
+class TestMessageTemplate(unittest.TestCase):
+    def test_render(self):
+        template = MessageTemplate("Hi $name, your code is ${code}. Cost: $$5")
+        self.assertEqual(template.placeholders, {"name", "code"})
+        self.assertEqual(
+            template.render({"name": "Ada", "code": 1234}),
+            "Hi Ada, your code is 1234. Cost: $5"
+        )
+
+    def test_without_placeholders(self):
+        template = MessageTemplate("Hello!")
+        self.assertEqual(template.placeholders, frozenset())
+        self.assertEqual(template.render(), "Hello!")
+
+    def test_missing_variable(self):
+        template = MessageTemplate("Hi $name")
+        with self.assertRaisesRegex(ValueError, "Missing template variable 'name'"):
+            template.render({})
+
+    def test_rendered_length_is_checked(self):
+        template = MessageTemplate("Hi $name", max_length=10)
+        self.assertEqual(template.render({"name": "Ada"}), "Hi Ada")
+        with self.assertRaisesRegex(ValueError, "exceeds maximum of 10"):
+            template.render({"name": "Bartholomew"})
+        with self.assertRaisesRegex(ValueError, "cannot be empty"):
+            MessageTemplate("$name").render({"name": ""})
+
+    def test_invalid_templates(self):
+        with self.assertRaises(ValueError):
+            MessageTemplate("")
+        with self.assertRaises(ValueError):
+            MessageTemplate("Price: $5")
+        with self.assertRaises(ValueError):
+            MessageTemplate("x" * 11, max_length=10)
+
+class TestTemplateBulkSend(unittest.TestCase):
+    def setUp(self):
+        self.client = TextbeltClient(api_key="test_key")
+        self.template = MessageTemplate("Hi $name")
+
+    def test_request_requires_variables_for_every_phone(self):
+        with self.assertRaisesRegex(ValueError, "Missing template variables"):
+            BulkSMSRequest(
+                phones=["+12025550108", "+12025550109"],
+                template=self.template,
+                variables={"+12025550108": {"name": "Ada"}},
+                key="test_key"
+            )
+        with self.assertRaises(ValueError):
+            BulkSMSRequest(
+                phones=["+12025550108"],
+                message="Hello",
+                template=self.template,
+                key="test_key"
+            )
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.post')
+    def test_messages_are_rendered_at_send_time(self, mock_post, mock_sleep):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109"],
+            template=self.template,
+            variables={"+12025550108": {"name": "Ada"}, "+12025550109": {}},
+            key="test_key"
+        )
+
+        response = self.client.send_bulk_sms(request)
+
+        sent = [call.kwargs['data']['message'] for call in mock_post.call_args_list]
+        self.assertEqual(sent, ["Hi Ada"])
+        self.assertEqual(response.successful_messages, 1)
+        self.assertIn("Missing template variable 'name'", response.errors["+12025550109"])
+
+if __name__ == '__main__':
+    unittest.main()
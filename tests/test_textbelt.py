@@ -1,10 +1,21 @@
+import threading
+import time
 import unittest
 from unittest.mock import patch, Mock
 import json
 
+import requests
+
 from textbelt_utils.client import TextbeltClient
 from textbelt_utils.models import SMSRequest
-from textbelt_utils.exceptions import QuotaExceededError, WebhookVerificationError
+from textbelt_utils.exceptions import (
+    APIError,
+    QuotaExceededError,
+    RequestTimeoutError,
+    WebhookVerificationError,
+)
+from textbelt_utils.retry import RetryPolicy
+from textbelt_utils.status_cache import StatusCache
 from textbelt_utils.utils import verify_webhook, is_valid_e164
 
 class TestTextbeltClient(unittest.TestCase):
@@ -16,7 +27,7 @@ class TestTextbeltClient(unittest.TestCase):
             key="test_key"
         )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_sms_success(self, mock_post):
         mock_response = Mock()
         mock_response.ok = True
@@ -33,7 +44,7 @@ class TestTextbeltClient(unittest.TestCase):
         self.assertEqual(response.quota_remaining, 100)
         self.assertEqual(response.text_id, "12345")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_send_sms_quota_exceeded(self, mock_post):
         mock_response = Mock()
         mock_response.ok = True
@@ -47,7 +58,7 @@ class TestTextbeltClient(unittest.TestCase):
         with self.assertRaises(QuotaExceededError):
             self.client.send_sms(self.base_request)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_check_status(self, mock_get):
         mock_response = Mock()
         mock_response.ok = True
@@ -57,7 +68,40 @@ class TestTextbeltClient(unittest.TestCase):
         response = self.client.check_status("12345")
         self.assertEqual(response.status, "DELIVERED")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
+    def test_check_status_many(self, mock_get):
+        def mock_status(url, **kwargs):
+            text_id = url.rsplit("/", 1)[-1]
+            if text_id == "bad":
+                return Mock(ok=False, status_code=404, json=lambda: {"error": "Not found"})
+            return Mock(ok=True, status_code=200, json=lambda: {"status": "DELIVERED"})
+
+        mock_get.side_effect = mock_status
+
+        response = self.client.check_status_many(["1", "2", "bad", "1"], max_workers=3)
+
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(set(response.statuses), {"1", "2"})
+        self.assertEqual(response.statuses["1"].status, "DELIVERED")
+        self.assertIn("Not found", response.errors["bad"])
+        self.assertFalse(response.success)
+
+    @patch('requests.Session.get')
+    def test_check_status_cache(self, mock_get):
+        statuses = iter(["SENT", "DELIVERED"])
+        mock_get.side_effect = lambda url, **kwargs: Mock(
+            ok=True, status_code=200, json=lambda status=next(statuses): {"status": status}
+        )
+        client = TextbeltClient(api_key="test_key", status_cache=StatusCache(pending_ttl=0))
+
+        self.assertEqual(client.check_status("12345").status, "SENT")
+        # Non-terminal statuses aren't reused with pending_ttl=0
+        self.assertEqual(client.check_status("12345").status, "DELIVERED")
+        self.assertEqual(client.check_status("12345").status, "DELIVERED")
+        self.assertEqual(client.check_status_many(["12345"]).statuses["12345"].status, "DELIVERED")
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
     def test_check_quota(self, mock_get):
         mock_response = Mock()
         mock_response.ok = True
@@ -71,6 +115,124 @@ class TestTextbeltClient(unittest.TestCase):
         self.assertTrue(response.success)
         self.assertEqual(response.quota_remaining, 50)
 
+    @patch('requests.Session.post')
+    @patch('requests.Session.get')
+    def test_check_quota_cache(self, mock_get, mock_post):
+        client = TextbeltClient(api_key="test_key", quota_cache_ttl=60)
+        mock_get.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 50
+        })
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 49,
+            "textId": "12345"
+        })
+
+        self.assertEqual(client.check_quota().quota_remaining, 50)
+        self.assertEqual(client.check_quota().quota_remaining, 50)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # A send refreshes the cached quota
+        client.send_sms(self.base_request)
+        self.assertEqual(client.check_quota().quota_remaining, 49)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # Expired entries are fetched again
+        client._quota_cache_ttl = 0
+        client._quota._updated_at -= 1
+        self.assertEqual(client.check_quota().quota_remaining, 50)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('requests.Session.get')
+    def test_check_quota_cache_coalesces_concurrent_misses(self, mock_get):
+        client = TextbeltClient(api_key="test_key", quota_cache_ttl=60)
+
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return Mock(ok=True, status_code=200, json=lambda: {
+                "success": True,
+                "quotaRemaining": 50
+            })
+
+        mock_get.side_effect = slow_get
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(client.check_quota()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual([r.quota_remaining for r in results], [50] * 8)
+
+    @patch('requests.Session.get')
+    @patch('requests.Session.post')
+    def test_session_reused_across_endpoints(self, mock_post, mock_get):
+        mock_post.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 100,
+            "textId": "12345"
+        })
+        mock_get.return_value = Mock(ok=True, status_code=200, json=lambda: {
+            "success": True,
+            "quotaRemaining": 99
+        })
+
+        with TextbeltClient(api_key="test_key", pool_maxsize=4) as client:
+            session = client._session
+            client.send_sms(self.base_request)
+            client.check_quota()
+            self.assertIs(client._session, session)
+            adapter = session.get_adapter("https://textbelt.com")
+            self.assertEqual(adapter._pool_maxsize, 4)
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_keep_alive_disabled(self):
+        client = TextbeltClient(api_key="test_key", keep_alive=False)
+        self.assertEqual(client._session.headers["Connection"], "close")
+        client.close()
+
+    @patch('requests.Session.get')
+    def test_timeouts_are_applied(self, mock_get):
+        mock_get.return_value = Mock(ok=True, status_code=200, json=lambda: {"status": "SENT"})
+        client = TextbeltClient(api_key="test_key", connect_timeout=2, read_timeout=7)
+
+        client.check_status("12345")
+
+        self.assertEqual(mock_get.call_args.kwargs["timeout"], (2, 7))
+
+    @patch('requests.Session.get')
+    def test_timeout_raises_request_timeout_error(self, mock_get):
+        mock_get.side_effect = requests.ReadTimeout("read timed out")
+
+        with self.assertRaises(RequestTimeoutError):
+            self.client.check_status("12345")
+
+    @patch('textbelt_utils.client.time.sleep')
+    @patch('requests.Session.get')
+    def test_total_timeout_bounds_retries(self, mock_get, mock_sleep):
+        mock_get.return_value = Mock(ok=False, status_code=503, headers={}, json=lambda: {})
+        client = TextbeltClient(
+            api_key="test_key",
+            read_timeout=30,
+            total_timeout=5,
+            retry_policy=RetryPolicy(max_attempts=10, backoff_base=10, jitter=False),
+        )
+
+        with self.assertRaises(APIError):
+            client.check_status("12345")
+
+        # The 10s backoff would overrun the 5s budget, so no retry is attempted
+        self.assertEqual(mock_get.call_count, 1)
+        connect, read = mock_get.call_args.kwargs["timeout"]
+        self.assertLessEqual(read, 5)
+
 class TestUtils(unittest.TestCase):
     def test_valid_e164(self):
         valid_numbers = [
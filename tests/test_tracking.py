@@ -0,0 +1,173 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from textbelt_utils.models import BulkStatusResponse, StatusResponse
+from textbelt_utils.tracking import StatusTracker, StatusTransition
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def scripted_client(script, errors=None):
+    """Mock client whose check_status_many returns statuses from ``script``.
+
+    ``script`` maps text_id to the list of statuses it reports on successive polls;
+    the last status repeats once the list runs out.
+    """
+    calls = []
+    polls = {}
+    errors = errors or set()
+
+    def check_status_many(text_ids, max_workers=10):
+        calls.append(list(text_ids))
+        response = BulkStatusResponse(statuses={}, errors={})
+        for text_id in text_ids:
+            if text_id in errors:
+                response.errors[text_id] = "lookup failed"
+                continue
+            statuses = script[text_id]
+            index = min(polls.get(text_id, 0), len(statuses) - 1)
+            polls[text_id] = polls.get(text_id, 0) + 1
+            response.statuses[text_id] = StatusResponse(status=statuses[index])
+        return response
+
+    client = Mock()
+    client.check_status_many.side_effect = check_status_many
+    return client, calls
+
+class TestStatusTracker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def tracker(self, client, **kwargs):
+        kwargs.setdefault("initial_delay", 5.0)
+        return StatusTracker(client, clock=self.clock, **kwargs)
+
+    def test_nothing_is_polled_before_it_is_due(self):
+        client, calls = scripted_client({"a": ["DELIVERED"]})
+        tracker = self.tracker(client)
+        tracker.track("a")
+        self.assertEqual(tracker.poll(), [])
+        self.assertEqual(calls, [])
+        self.assertEqual(tracker.next_poll_in(), 5.0)
+
+    def test_terminal_status_is_emitted_and_dropped(self):
+        client, calls = scripted_client({"a": ["SENT", "DELIVERED"], "b": ["FAILED"]})
+        tracker = self.tracker(client)
+        tracker.track_many(["a", "b"])
+
+        self.clock.now = 5.0
+        transitions = tracker.poll()
+        self.assertEqual(calls, [["a", "b"]])
+        self.assertEqual(transitions, [
+            StatusTransition("a", None, "SENT", False),
+            StatusTransition("b", None, "FAILED", True),
+        ])
+        self.assertIn("a", tracker)
+        self.assertNotIn("b", tracker)
+        self.assertEqual(tracker.status("a"), "SENT")
+
+        # A status change resets the delay, so "a" is due again after initial_delay
+        self.clock.now = 10.0
+        self.assertEqual(tracker.poll(), [StatusTransition("a", "SENT", "DELIVERED", True)])
+        self.assertEqual(len(tracker), 0)
+        self.assertIsNone(tracker.next_poll_in())
+
+    def test_unchanged_status_backs_off(self):
+        client, calls = scripted_client({"a": ["SENDING"]})
+        tracker = self.tracker(client, backoff=2.0, max_delay=20.0)
+        tracker.track("a", delay=0)
+
+        delays = []
+        for _ in range(5):
+            tracker.poll()
+            delays.append(tracker.next_poll_in())
+            self.clock.now += tracker.next_poll_in()
+        # First poll is a change (None -> SENDING); later ones back off up to max_delay
+        self.assertEqual(delays, [5.0, 10.0, 20.0, 20.0, 20.0])
+        self.assertEqual(len(calls), 5)
+
+    def test_failed_lookup_is_retried_with_backoff(self):
+        client, calls = scripted_client({}, errors={"a"})
+        tracker = self.tracker(client, backoff=3.0)
+        tracker.track("a", delay=0)
+        self.assertEqual(tracker.poll(), [])
+        self.assertIn("a", tracker)
+        self.assertEqual(tracker.next_poll_in(), 15.0)
+
+    def test_max_polls_abandons_stuck_messages(self):
+        client, _ = scripted_client({"a": ["SENT"]})
+        tracker = self.tracker(client, max_polls=2)
+        tracker.track("a", delay=0)
+        tracker.poll()
+        self.clock.now += tracker.next_poll_in()
+        tracker.poll()
+        self.assertNotIn("a", tracker)
+        self.assertEqual(tracker.abandoned, ["a"])
+
+    def test_run_yields_transitions_and_calls_callback(self):
+        client, calls = scripted_client({
+            "a": ["SENDING", "SENT", "SENT", "DELIVERED"],
+            "b": ["DELIVERED"],
+        })
+        seen = []
+        tracker = self.tracker(client, on_transition=seen.append)
+        tracker.track_many(["a", "b"])
+
+        transitions = list(tracker.run(sleep=self.clock.sleep))
+        self.assertEqual(
+            [(t.text_id, t.status) for t in transitions],
+            [("a", "SENDING"), ("b", "DELIVERED"), ("a", "SENT"), ("a", "DELIVERED")],
+        )
+        self.assertEqual(seen, transitions)
+        self.assertEqual(len(tracker), 0)
+        # Only "a" is polled once "b" is terminal
+        self.assertEqual(calls[1:], [["a"], ["a"], ["a"]])
+
+    def test_run_stops_at_timeout(self):
+        client, calls = scripted_client({"a": ["SENT"]})
+        tracker = self.tracker(client)
+        tracker.track("a")
+        list(tracker.run(timeout=25, sleep=self.clock.sleep))
+        # Polls at t=5, 10 and 20; the next one at t=40 is past the timeout
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(self.clock.now, 20.0)
+        self.assertIn("a", tracker)
+
+    def test_track_ignores_ids_already_tracked(self):
+        client, _ = scripted_client({"a": ["SENT"]})
+        tracker = self.tracker(client)
+        tracker.track("a")
+        tracker.track("a", delay=0)
+        self.assertEqual(len(tracker), 1)
+        self.assertEqual(tracker.next_poll_in(), 5.0)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            StatusTracker(Mock(), initial_delay=10, max_delay=5)
+        with self.assertRaises(ValueError):
+            StatusTracker(Mock(), backoff=0.5)
+
+    def test_async_run(self):
+        sync_client, calls = scripted_client({"a": ["SENT", "DELIVERED"]})
+        client = Mock()
+        client.check_status_many = AsyncMock(side_effect=sync_client.check_status_many.side_effect)
+        tracker = StatusTracker(client, initial_delay=0.01)
+        tracker.track("a")
+
+        async def collect():
+            return [t async for t in tracker.arun(timeout=5)]
+
+        transitions = asyncio.run(collect())
+        self.assertEqual([t.status for t in transitions], ["SENT", "DELIVERED"])
+        self.assertEqual(len(calls), 2)
+
+if __name__ == "__main__":
+    unittest.main()
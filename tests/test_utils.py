@@ -0,0 +1,38 @@
+import unittest
+
+from textbelt_utils.utils import is_valid_e164, normalize_phone, normalize_phones
+
+class TestNormalizePhone(unittest.TestCase):
+    def setUp(self):
+        normalize_phone.cache_clear()
+
+    def test_national_formats(self):
+        for raw in ["(202) 555-0108", "202.555.0108", "1-202-555-0108", " 2025550108 "]:
+            self.assertEqual(normalize_phone(raw), "+12025550108", raw)
+
+    def test_international_formats(self):
+        self.assertEqual(normalize_phone("+1 202 555 0108"), "+12025550108")
+        self.assertEqual(normalize_phone("+44 (0)20 7946 0958"), "+442079460958")
+        self.assertEqual(normalize_phone("0044 20 7946 0958"), "+442079460958")
+
+    def test_default_country_code(self):
+        self.assertEqual(normalize_phone("020 7946 0958", "44"), "+442079460958")
+        self.assertEqual(normalize_phone("7946 0958", "44"), "+4479460958")
+
+    def test_rejects_unparseable_numbers(self):
+        for raw in ["", "abc", "202555010", "2025550108 x12", "+0123456789", "+1234567890123456"]:
+            self.assertIsNone(normalize_phone(raw), raw)
+        self.assertIsNone(normalize_phone(None))
+
+    def test_results_are_cached(self):
+        normalize_phones(["(202) 555-0108", "(202) 555-0108", "202.555.0109"])
+        info = normalize_phone.cache_info()
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 1)
+
+    def test_normalized_numbers_are_valid(self):
+        for phone in normalize_phones(["(202) 555-0108", "+44 20 7946 0958"]):
+            self.assertTrue(is_valid_e164(phone))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from textbelt_utils.models import BulkSMSRequest
+from textbelt_utils.validation import deduplicate_phones, validate_phones
+
+class TestValidatePhones(unittest.TestCase):
+    def test_reports_every_invalid_phone(self):
+        phones = [
+            "+12025550108",
+            "12025550109",
+            "",
+            "+1 202 555 0110",
+            "+02025550111",
+            "+1234567890123456",
+            "+12025550112",
+        ]
+        report = validate_phones(phones)
+
+        self.assertFalse(report.valid)
+        self.assertEqual(report.total, 7)
+        self.assertEqual(report.invalid, {
+            1: "missing leading +",
+            2: "empty",
+            3: "contains non-digit characters",
+            4: "country code cannot start with 0",
+            5: "too long (max 15 digits)",
+        })
+        self.assertEqual(report.valid_phones(phones), ["+12025550108", "+12025550112"])
+
+    def test_all_valid(self):
+        phones = [f"+1{i:010d}" for i in range(1000)]
+        report = validate_phones(phones)
+        self.assertTrue(report.valid)
+        self.assertEqual(report.invalid_count, 0)
+
+    def test_embedded_newlines_and_non_strings(self):
+        report = validate_phones(["+1202\n5550108", None, "+12025550109"])
+        self.assertEqual(report.invalid, {
+            0: "contains non-digit characters",
+            1: "not a string (NoneType)",
+        })
+
+    def test_bulk_request_reports_all_invalid_phones(self):
+        with self.assertRaises(ValueError) as ctx:
+            BulkSMSRequest(
+                phones=["+12025550108", "bad", "+12025550109", "12025550110"],
+                message="Hello",
+                key="test_key"
+            )
+        self.assertIn("2 phone number(s)", str(ctx.exception))
+        self.assertIn("'bad' at index 1", str(ctx.exception))
+        self.assertIn("'12025550110' at index 3", str(ctx.exception))
+
+    def test_bulk_request_drop_invalid(self):
+        request = BulkSMSRequest(
+            phones=["+12025550108", "bad", "+12025550109"],
+            message="Hello",
+            key="test_key",
+            drop_invalid=True
+        )
+        self.assertEqual(request.phones, ["+12025550108", "+12025550109"])
+        self.assertEqual(request.validation_report.invalid, {1: "missing leading +"})
+
+        with self.assertRaises(ValueError):
+            BulkSMSRequest(phones=["bad"], message="Hello", key="test_key", drop_invalid=True)
+
+    def test_deduplicate_phones(self):
+        unique, removed = deduplicate_phones(
+            ["+12025550108", " +12025550109", "+12025550108", "+12025550109\t"]
+        )
+        self.assertEqual(unique, ["+12025550108", "+12025550109"])
+        self.assertEqual(removed, 2)
+
+    def test_bulk_request_deduplicates(self):
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550109 ", "+12025550108"],
+            individual_messages={
+                "+12025550108": "Message 1",
+                "+12025550109 ": "Message 2"
+            },
+            key="test_key"
+        )
+        self.assertEqual(request.phones, ["+12025550108", "+12025550109"])
+        self.assertEqual(request.duplicates_removed, 1)
+        self.assertEqual(request.message_for("+12025550109"), "Message 2")
+
+        request = BulkSMSRequest(
+            phones=["+12025550108", "+12025550108"],
+            message="Hello",
+            key="test_key",
+            deduplicate=False
+        )
+        self.assertEqual(request.phones, ["+12025550108", "+12025550108"])
+        self.assertEqual(request.duplicates_removed, 0)
+
+if __name__ == '__main__':
+    unittest.main()
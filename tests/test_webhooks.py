@@ -0,0 +1,140 @@
+import hashlib
+import hmac
+import time
+import unittest
+
+from textbelt_utils.exceptions import WebhookVerificationError
+from textbelt_utils.utils import verify_webhook
+from textbelt_utils.models import WebhookResponse
+from textbelt_utils.webhooks import ReplayGuard, WebhookVerifier, parse_webhook
+
+NOW = 1_700_000_000
+
+def sign(api_key, timestamp, payload):
+    return hmac.new(api_key.encode(), (timestamp + payload).encode(), hashlib.sha256).hexdigest()
+
+class TestWebhookVerifier(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "test_key"
+        self.timestamp = str(NOW - 10)
+        self.payload = '{"textId": "123", "text": "héllo"}'
+        self.signature = sign(self.api_key, self.timestamp, self.payload)
+        self.verifier = WebhookVerifier(self.api_key, clock=lambda: NOW)
+
+    def test_verify_matches_verify_webhook(self):
+        self.assertTrue(self.verifier.verify(self.timestamp, self.signature, self.payload))
+        self.assertFalse(self.verifier.verify(self.timestamp, "invalid_signature", self.payload))
+
+    def test_verify_accepts_bytes(self):
+        self.assertTrue(self.verifier.verify(
+            self.timestamp.encode(), self.signature.encode(), self.payload.encode("utf-8")
+        ))
+        self.assertFalse(self.verifier.verify(self.timestamp, self.signature, b"tampered"))
+
+    def test_long_keys_are_hashed_first(self):
+        api_key = "k" * 100
+        verifier = WebhookVerifier(api_key, clock=lambda: NOW)
+        signature = sign(api_key, self.timestamp, self.payload)
+        self.assertTrue(verifier.verify(self.timestamp, signature, self.payload))
+
+    def test_verifier_is_reusable(self):
+        for _ in range(3):
+            self.assertTrue(self.verifier.verify(self.timestamp, self.signature, self.payload))
+
+    def test_old_timestamp_raises(self):
+        timestamp = str(NOW - 1000)
+        signature = sign(self.api_key, timestamp, self.payload)
+        with self.assertRaises(WebhookVerificationError):
+            self.verifier.verify(timestamp, signature, self.payload)
+
+    def test_invalid_data_raises(self):
+        with self.assertRaises(WebhookVerificationError):
+            self.verifier.verify("not-a-number", self.signature, self.payload)
+        with self.assertRaises(WebhookVerificationError):
+            self.verifier.verify(self.timestamp, "sïgnature", self.payload)
+
+    def test_verify_many(self):
+        stale = str(NOW - 1000)
+        results = self.verifier.verify_many([
+            (self.timestamp, self.signature, self.payload),
+            (self.timestamp, self.signature, b"tampered"),
+            (stale, sign(self.api_key, stale, self.payload), self.payload),
+            ("garbage", self.signature, self.payload),
+            (self.timestamp.encode(), self.signature.encode(), self.payload.encode()),
+        ])
+        self.assertEqual(results, [True, False, False, False, True])
+
+    def test_agrees_with_verify_webhook(self):
+        timestamp = str(int(time.time()))
+        signature = sign(self.api_key, timestamp, self.payload)
+        self.assertEqual(
+            WebhookVerifier(self.api_key).verify(timestamp, signature, self.payload),
+            verify_webhook(self.api_key, timestamp, signature, self.payload),
+        )
+
+    def test_replayed_webhook_is_rejected(self):
+        verifier = WebhookVerifier(self.api_key, clock=lambda: NOW, replay_guard=ReplayGuard(clock=lambda: NOW))
+        self.assertTrue(verifier.verify(self.timestamp, self.signature, self.payload))
+        with self.assertRaises(WebhookVerificationError):
+            verifier.verify(self.timestamp, self.signature.encode(), self.payload)
+        # Forged requests aren't recorded
+        self.assertFalse(verifier.verify(self.timestamp, "0" * 64, self.payload))
+        self.assertEqual(
+            verifier.verify_many([(self.timestamp, self.signature, self.payload)]), [False]
+        )
+
+    def test_replay_guard_must_cover_max_age(self):
+        with self.assertRaises(ValueError):
+            WebhookVerifier(self.api_key, max_age=900, replay_guard=ReplayGuard(max_age=60))
+
+class TestReplayGuard(unittest.TestCase):
+    def setUp(self):
+        self.now = NOW
+        self.guard = ReplayGuard(max_age=900, bucket_seconds=60, clock=lambda: self.now)
+
+    def test_accepts_each_signature_once(self):
+        self.assertTrue(self.guard.accept(NOW, "a"))
+        self.assertTrue(self.guard.accept(NOW, "b"))
+        self.assertFalse(self.guard.accept(str(NOW), "a"))
+        self.assertFalse(self.guard.accept(NOW, b"b"))
+        self.assertEqual(len(self.guard), 2)
+
+    def test_rejects_timestamps_outside_window(self):
+        self.assertFalse(self.guard.accept(NOW - 901, "a"))
+        self.assertEqual(len(self.guard), 0)
+
+    def test_expired_buckets_are_evicted(self):
+        for i in range(100):
+            self.guard.accept(NOW - i * 10, f"sig{i}")
+        self.assertEqual(len(self.guard), 91)
+
+        # Once everything has aged out, memory only holds the new traffic
+        self.now = NOW + 2000
+        self.assertTrue(self.guard.accept(self.now, "fresh"))
+        self.assertEqual(len(self.guard), 1)
+
+    def test_signatures_remembered_until_they_expire(self):
+        self.guard.accept(NOW, "a")
+        self.now = NOW + 899
+        self.assertFalse(self.guard.accept(NOW, "a"))
+        self.now = NOW + 901
+        self.assertFalse(self.guard.accept(NOW, "a"))
+
+    def test_invalid_bucket_size(self):
+        with self.assertRaises(ValueError):
+            ReplayGuard(bucket_seconds=0)
+
+class TestParseWebhook(unittest.TestCase):
+    def test_parses_payload(self):
+        self.assertEqual(
+            parse_webhook(b'{"textId": 123, "fromNumber": "+12025550108", "text": "Yes"}'),
+            WebhookResponse("123", "+12025550108", "Yes", None),
+        )
+
+    def test_malformed_payload_raises(self):
+        for payload in ("not json", "[]", '{"textId": "1"}'):
+            with self.assertRaises(WebhookVerificationError):
+                parse_webhook(payload)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,6 +15,9 @@ from .models import (
     OTPVerifyResponse,
     BulkSMSRequest,
     BulkSMSResponse,
+    BulkSMSResult,
+    BulkStatusResponse,
+    TERMINAL_STATUSES,
 )
 from .exceptions import (
     QuotaExceededError,
@@ -23,8 +26,21 @@ from .exceptions import (
     APIError,
     BulkSendError,
     RateLimitError,
+    RequestTimeoutError,
 )
-from .utils import verify_webhook
+from .journal import SendJournal
+from .middleware import WebhookMiddleware, WSGIWebhookMiddleware
+from .results import BulkResultTable
+from .segments import SegmentEstimate, SegmentInfo, count_segments, estimate_segments
+from .templates import MessageTemplate
+from .tracking import StatusTracker, StatusTransition
+from .quota import QuotaTracker
+from .rate_limit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
+from .status_cache import StatusCache
+from .utils import verify_webhook, normalize_phone, normalize_phones
+from .validation import PhoneValidationReport, validate_phones
+from .webhooks import ReplayGuard, WebhookVerifier, parse_webhook
 
 __all__ = [
     'TextbeltClient',
@@ -40,13 +56,40 @@ __all__ = [
     'OTPVerifyResponse',
     'BulkSMSRequest',
     'BulkSMSResponse',
+    'BulkSMSResult',
+    'BulkStatusResponse',
+    'TERMINAL_STATUSES',
     'QuotaExceededError',
     'InvalidRequestError',
     'WebhookVerificationError',
     'APIError',
     'BulkSendError',
     'RateLimitError',
+    'RequestTimeoutError',
+    'SendJournal',
+    'BulkResultTable',
+    'MessageTemplate',
+    'StatusTracker',
+    'StatusTransition',
+    'SegmentInfo',
+    'SegmentEstimate',
+    'count_segments',
+    'estimate_segments',
+    'QuotaTracker',
+    'RateLimiter',
+    'TokenBucket',
+    'RetryPolicy',
+    'StatusCache',
     'verify_webhook',
+    'WebhookVerifier',
+    'ReplayGuard',
+    'parse_webhook',
+    'WebhookMiddleware',
+    'WSGIWebhookMiddleware',
+    'normalize_phone',
+    'normalize_phones',
+    'PhoneValidationReport',
+    'validate_phones',
     'load_config',
     'get_env_var',
 ]
\ No newline at end of file
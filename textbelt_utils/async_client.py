@@ -1,5 +1,18 @@
 import asyncio
-from typing import Dict
+from dataclasses import replace
+from functools import partial
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import httpx
 
@@ -14,28 +27,179 @@ from .models import (
     OTPVerifyResponse,
     BulkSMSRequest,
     BulkSMSResponse,
+    BulkSMSResult,
+    BulkStatusResponse,
 )
 from .exceptions import (
     QuotaExceededError,
     InvalidRequestError,
     RateLimitError,
     APIError,
+    RequestTimeoutError,
 )
+from .journal import SendJournal
+from .quota import QuotaTracker
+from .results import BulkResultTable
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .status_cache import StatusCache
+
+T = TypeVar("T")
+Recipient = Union[str, Tuple[str, str]]
+
+DEADLINE_EXCEEDED = "Bulk send deadline exceeded before sending"
+QUOTA_EXHAUSTED = "Not sent: remaining quota exhausted"
+
+# Transport errors raised before a request could reach the server, the only ones
+# retried for non-idempotent POST requests
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+async def _aiter(items: Iterable[T]) -> AsyncIterator[T]:
+    """Adapt a sync iterable to an async iterator"""
+    for item in items:
+        yield item
 
 class AsyncTextbeltClient:
     """Async client for interacting with the Textbelt API"""
     
     BASE_URL = "https://textbelt.com"
     
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        http2: bool = False,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = 30.0,
+        total_timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        quota_cache_ttl: Optional[float] = None,
+        status_cache: Optional[StatusCache] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            api_key: Your Textbelt API key
+            http2: Whether to negotiate HTTP/2 so concurrent requests share connections
+                (requires the ``h2`` package, installed by the ``async`` extra)
+            max_connections: Maximum number of concurrent connections
+            max_keepalive_connections: Maximum number of idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept before being closed
+            client: An externally owned ``httpx.AsyncClient`` to use instead of creating
+                one. The connection options above are ignored and the client is not
+                closed by this object.
+            rate_limiter: Optional limiter consulted before every request. When set,
+                it replaces the fixed delay between bulk batches.
+            retry_policy: Optional policy for retrying rate-limited, server-error and
+                transport-error responses. Without one, requests are not retried.
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server between bytes of the response
+                (also used for writes and for waiting on a pooled connection)
+            total_timeout: Optional upper bound in seconds for a whole API call,
+                including retries and backoff
+            base_url: Optional API root to use instead of BASE_URL, e.g. a local
+                MockTextbeltServer
+            quota_cache_ttl: Optional number of seconds check_quota may answer from
+                the last reported quota instead of calling the API. Send responses
+                refresh the cached value, and concurrent cache misses share one request.
+            status_cache: Optional StatusCache check_status answers from before
+                calling the API. It can be shared between clients.
+        """
         self.api_key = api_key
-        self._client = httpx.AsyncClient()
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        self._total_timeout = total_timeout
+        self._quota = QuotaTracker()
+        self._quota_cache_ttl = quota_cache_ttl
+        self._status_cache = status_cache
+        self._quota_fetch: Optional[asyncio.Future] = None
+        if client is not None:
+            self._client = client
+            self._owns_client = False
+        else:
+            limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            self._client = httpx.AsyncClient(http2=http2, limits=limits)
+            self._owns_client = True
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._client.aclose()
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client if this object created it"""
+        if self._owns_client:
+            await self._client.aclose()
+
+    @property
+    def quota_remaining(self) -> Optional[int]:
+        """Remaining quota as of the last API response, without a network call.
+
+        None until a send or quota check has reported it.
+        """
+        return self._quota.remaining
+
+    async def _throttle(self, endpoint: str) -> None:
+        """Wait for the rate limiter, if one is configured"""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(endpoint)
+
+    async def _request(self, method: str, endpoint: str, url: str, **kwargs) -> httpx.Response:
+        """Make an HTTP request, applying rate limiting, timeouts and the retry policy"""
+        if self._total_timeout is None:
+            return await self._request_with_retries(method, endpoint, url, **kwargs)
+        try:
+            return await asyncio.wait_for(
+                self._request_with_retries(method, endpoint, url, **kwargs),
+                self._total_timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise RequestTimeoutError(
+                f"Request to /{endpoint} timed out after {self._total_timeout} seconds"
+            ) from e
+
+    async def _request_with_retries(
+        self, method: str, endpoint: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Make an HTTP request, retrying according to the retry policy"""
+        policy = self._retry_policy
+        send = getattr(self._client, method)
+        attempt = 1
+        while True:
+            await self._throttle(endpoint)
+            try:
+                response = await send(url, timeout=self._timeout, **kwargs)
+            except Exception as e:
+                # A POST that may have reached the server is not retried: the
+                # message could already have been sent
+                transport = (httpx.TransportError,) if method == "get" else _UNSENT_ERRORS
+                if policy is None or not policy.should_retry_exception(e, attempt, transport):
+                    if isinstance(e, httpx.TimeoutException):
+                        raise RequestTimeoutError(f"Request to /{endpoint} timed out: {e}") from e
+                    raise
+                delay = policy.backoff(attempt)
+            else:
+                if policy is None or not policy.should_retry_status(response.status_code, attempt):
+                    return response
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = None
+                delay = policy.backoff(attempt, parse_retry_after(data, response.headers))
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def send_sms(self, request: SMSRequest) -> SMSResponse:
         """Send an SMS using the Textbelt API asynchronously"""
@@ -48,7 +212,7 @@ class AsyncTextbeltClient:
             **({"webhookData": request.webhook_data} if request.webhook_data else {})
         }
 
-        response = await self._client.post(f"{self.BASE_URL}/text", data=payload)
+        response = await self._request("post", "text", f"{self.base_url}/text", data=payload)
         
         # Handle rate limiting
         if response.status_code == 429:
@@ -63,9 +227,12 @@ class AsyncTextbeltClient:
             raise APIError(f"API request failed: {str(e)}")
         
         data = response.json()
+        if "quotaRemaining" in data:
+            self._quota.update(data["quotaRemaining"])
         
         if not data["success"]:
             if "quota" in data.get("error", "").lower():
+                self._quota.update(data.get("quotaRemaining", 0))
                 raise QuotaExceededError("SMS quota exceeded")
             raise InvalidRequestError(data.get("error", "Unknown error"))
 
@@ -78,16 +245,91 @@ class AsyncTextbeltClient:
 
     async def check_status(self, text_id: str) -> StatusResponse:
         """Check the delivery status of a sent message asynchronously"""
-        response = await self._client.get(f"{self.BASE_URL}/status/{text_id}")
+        if self._status_cache is not None:
+            cached = self._status_cache.get(text_id)
+            if cached is not None:
+                return cached
+        response = await self._request("get", "status", f"{self.base_url}/status/{text_id}")
         response.raise_for_status()
         data = response.json()
-        return StatusResponse(status=data["status"])
+        status = StatusResponse(status=data["status"])
+        if self._status_cache is not None:
+            self._status_cache.put(text_id, status)
+        return status
+
+    async def check_status_many(
+        self,
+        text_ids: Union[Iterable[str], AsyncIterable[str]],
+        max_concurrency: int = 10,
+    ) -> BulkStatusResponse:
+        """Check the delivery status of many messages concurrently.
+        
+        A fixed pool of ``max_concurrency`` tasks pulls IDs from the input, so at
+        most that many lookups are in flight. A failed lookup is reported in
+        ``errors`` rather than aborting the batch.
+        
+        Args:
+            text_ids: Text IDs to look up, as a sync or async iterable; duplicates
+                are looked up once
+            max_concurrency: Number of lookups to keep in flight at once
+            
+        Returns:
+            A BulkStatusResponse with the status or error for every text ID
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        if hasattr(text_ids, "__aiter__"):
+            source = text_ids.__aiter__()
+        else:
+            source = _aiter(text_ids)
+        source_lock = asyncio.Lock()
+        statuses: Dict[str, StatusResponse] = {}
+        errors: Dict[str, str] = {}
+        seen = set()
+
+        async def worker() -> None:
+            while True:
+                async with source_lock:
+                    try:
+                        text_id = await source.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    if text_id in seen:
+                        continue
+                    seen.add(text_id)
+                try:
+                    statuses[text_id] = await self.check_status(text_id)
+                except Exception as e:
+                    errors[text_id] = str(e)
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+        return BulkStatusResponse(statuses=statuses, errors=errors)
 
     async def check_quota(self) -> QuotaResponse:
         """Check the remaining quota for the API key asynchronously"""
-        response = await self._client.get(f"{self.BASE_URL}/quota/{self.api_key}")
+        if self._quota_cache_ttl is None:
+            return await self._fetch_quota()
+
+        cached = self._quota.fresh(self._quota_cache_ttl)
+        if cached is not None:
+            return QuotaResponse(success=True, quota_remaining=cached)
+        # Callers that miss together share the first one's request
+        if self._quota_fetch is None:
+            self._quota_fetch = asyncio.ensure_future(self._fetch_quota())
+            self._quota_fetch.add_done_callback(self._clear_quota_fetch)
+        return await asyncio.shield(self._quota_fetch)
+
+    def _clear_quota_fetch(self, fetch: asyncio.Future) -> None:
+        if self._quota_fetch is fetch:
+            self._quota_fetch = None
+
+    async def _fetch_quota(self) -> QuotaResponse:
+        """Request the remaining quota from the API"""
+        response = await self._request("get", "quota", f"{self.base_url}/quota/{self.api_key}")
         response.raise_for_status()
         data = response.json()
+        self._quota.update(data["quotaRemaining"])
         return QuotaResponse(
             success=data["success"],
             quota_remaining=data["quotaRemaining"]
@@ -131,13 +373,16 @@ class AsyncTextbeltClient:
         if request.length:
             payload["length"] = request.length
 
-        response = await self._client.post(f"{self.BASE_URL}/otp/generate", data=payload)
+        response = await self._request("post", "otp/generate", f"{self.base_url}/otp/generate", data=payload)
         response.raise_for_status()
         
         data = response.json()
+        if "quotaRemaining" in data:
+            self._quota.update(data["quotaRemaining"])
         
         if not data["success"]:
             if "quota" in data.get("error", "").lower():
+                self._quota.update(data.get("quotaRemaining", 0))
                 raise QuotaExceededError("SMS quota exceeded")
             raise InvalidRequestError(data.get("error", "Unknown error"))
 
@@ -167,7 +412,7 @@ class AsyncTextbeltClient:
             "key": self.api_key,
         }
 
-        response = await self._client.get(f"{self.BASE_URL}/otp/verify", params=params)
+        response = await self._request("get", "otp/verify", f"{self.base_url}/otp/verify", params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -181,11 +426,34 @@ class AsyncTextbeltClient:
             error=data.get("error")
         )
 
-    async def send_bulk_sms(self, request: BulkSMSRequest) -> BulkSMSResponse:
+    async def send_bulk_sms(
+        self,
+        request: BulkSMSRequest,
+        max_concurrency: Optional[int] = None,
+        journal: Optional[SendJournal] = None,
+        deadline: Optional[float] = None,
+        respect_quota: bool = False,
+    ) -> BulkSMSResponse:
         """Send multiple SMS messages in bulk with concurrent sending and rate limiting.
         
+        By default phones are sent in fixed batches of ``request.batch_size``, each
+        batch finishing before the next starts. With ``max_concurrency`` set, a
+        sliding window of that many in-flight sends is kept instead: a new send
+        starts as soon as any other finishes, so one slow request never stalls
+        the rest.
+        
         Args:
             request: A BulkSMSRequest object containing the messages to send
+            max_concurrency: Optional number of sends to keep in flight at once
+            journal: Optional SendJournal that records each recipient's outcome as
+                it happens, so an interrupted send can be resumed with resume_bulk_sms
+            deadline: Optional number of seconds after which no new messages are
+                dispatched. Messages already in flight are allowed to finish and the
+                partial results are returned, with unsent phones reported in ``errors``.
+            respect_quota: Stop dispatching once the locally tracked quota is used
+                up, reporting the unsent phones in ``errors`` instead of running into
+                QuotaExceededError. The quota is checked once up front if no response
+                has reported it yet.
             
         Returns:
             A BulkSMSResponse object containing the results of the bulk send operation
@@ -196,66 +464,365 @@ class AsyncTextbeltClient:
             APIError: If there is an error communicating with the API
             RateLimitError: If rate limit is exceeded
         """
-        results: Dict[str, SMSResponse] = {}
-        errors: Dict[str, str] = {}
-        
-        # Create batches of phone numbers
-        phone_batches = [
-            request.phones[i:i + request.batch_size]
-            for i in range(0, len(request.phones), request.batch_size)
-        ]
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline if deadline is not None else None
+        if respect_quota and self.quota_remaining is None:
+            await self.check_quota()
+
+        stop_reason: Optional[str] = None
+
+        async def admit() -> bool:
+            """Decide whether another message may be dispatched"""
+            nonlocal stop_reason
+            if stop_reason is not None:
+                return False
+            # Checked first, as it may wait for sends in flight to settle
+            if respect_quota and await self._quota.await_available() == 0:
+                stop_reason = stop_reason or QUOTA_EXHAUSTED
+                return False
+            if expires_at is not None and loop.time() >= expires_at:
+                stop_reason = stop_reason or DEADLINE_EXCEEDED
+                return False
+            return stop_reason is None
+
+        table = BulkResultTable(unique_phones=request.deduplicate)
         
         async def send_message(phone: str) -> tuple[str, SMSResponse | Exception]:
             try:
-                message = request.message if request.message is not None else request.individual_messages[phone]
-                sms_request = SMSRequest(
-                    phone=phone,
-                    message=message,
-                    key=request.key or self.api_key,
-                    sender=request.sender,
-                    reply_webhook_url=request.reply_webhook_url,
-                    webhook_data=request.webhook_data
-                )
-                response = await self.send_sms(sms_request)
-                return phone, response
-            except (QuotaExceededError, RateLimitError) as e:
-                # Propagate critical errors
-                raise
-            except Exception as e:
+                message = request.message_for(phone)
+            except ValueError as e:
+                # A template that renders an invalid message fails only this recipient
                 return phone, e
+            send = partial(
+                self._send_recipient,
+                phone,
+                message,
+                request.key or self.api_key,
+                request.sender,
+                request.reply_webhook_url,
+                request.webhook_data,
+                validated=True,
+            )
+            if not respect_quota:
+                return await send()
+            while True:
+                with self._quota.hold() as held:
+                    if held:
+                        return await send()
+                # Sends still in flight may settle with quota to spare
+                if not await self._quota.await_available():
+                    return phone, QuotaExceededError(QUOTA_EXHAUSTED)
         
-        # Process each batch with concurrent sending
-        for batch in phone_batches:
-            # Create tasks for concurrent sending within the batch
-            tasks = [send_message(phone) for phone in batch]
+        def record(phone: str, result: SMSResponse | Exception) -> None:
+            if isinstance(result, Exception):
+                table.add_error(phone, str(result))
+                if journal is not None:
+                    journal.record(phone, error=str(result))
+            else:
+                table.add_response(phone, result)
+                if journal is not None:
+                    journal.record(phone, response=result)
+
+        try:
+            if max_concurrency is not None:
+                await self._send_windowed(request, send_message, record, max_concurrency, admit)
+            else:
+                # Create batches of phone numbers
+                phone_batches = [
+                    request.phones[i:i + request.batch_size]
+                    for i in range(0, len(request.phones), request.batch_size)
+                ]
+
+                # Process each batch with concurrent sending
+                for batch in phone_batches:
+                    # Create tasks for concurrent sending within the batch
+                    tasks = []
+                    for phone in batch:
+                        if not await admit():
+                            break
+                        tasks.append(send_message(phone))
+                    if not tasks:
+                        break
+                    
+                    # Wait for every message in the batch, even after a critical
+                    # error, so messages that did go out are still recorded
+                    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+                    error = None
+                    for outcome in batch_results:
+                        if isinstance(outcome, BaseException):
+                            error = error or outcome
+                        else:
+                            record(*outcome)
+                    if error is not None:
+                        # Propagate critical errors
+                        raise error
+
+                    # Apply rate limiting delay between batches unless a rate limiter paces requests
+                    if (
+                        self._rate_limiter is None
+                        and request.delay_between_messages > 0
+                        and batch != phone_batches[-1]
+                    ):
+                        await asyncio.sleep(request.delay_between_messages)
+        finally:
+            if journal is not None:
+                journal.flush()
+
+        if stop_reason is not None:
+            self._mark_unsent(request, table, stop_reason)
+        
+        return self._bulk_response(request, table)
+
+    async def resume_bulk_sms(
+        self,
+        request: BulkSMSRequest,
+        journal: SendJournal,
+        max_concurrency: Optional[int] = None,
+        include_failed: bool = False,
+    ) -> BulkSMSResponse:
+        """Resume a bulk send, skipping recipients the journal records as sent.
+        
+        Args:
+            request: The original BulkSMSRequest
+            journal: The SendJournal used by the interrupted send
+            max_concurrency: Optional number of sends to keep in flight at once
+            include_failed: Also skip recipients whose previous send failed
             
-            try:
-                # Wait for all messages in the batch to complete
-                batch_results = await asyncio.gather(*tasks)
-                
-                # Process results
-                for phone, result in batch_results:
-                    if isinstance(result, Exception):
-                        errors[phone] = str(result)
-                    else:
-                        results[phone] = result
-                
-                # Apply rate limiting delay between batches if there are more batches
-                if request.delay_between_messages > 0 and batch != phone_batches[-1]:
+        Returns:
+            A BulkSMSResponse covering only the recipients sent by this call
+        """
+        done = journal.completed(include_failed=include_failed)
+        remaining = [phone for phone in request.phones if phone not in done]
+        if not remaining:
+            return BulkSMSResponse(
+                total_messages=0,
+                successful_messages=0,
+                failed_messages=0,
+                results={},
+                errors={}
+            )
+        return await self.send_bulk_sms(
+            replace(request, phones=remaining),
+            max_concurrency=max_concurrency,
+            journal=journal,
+        )
+
+    async def _send_windowed(
+        self,
+        request,
+        send_message,
+        record,
+        max_concurrency: int,
+        admit: Callable[[], Awaitable[bool]],
+    ) -> None:
+        """Send to every phone keeping at most ``max_concurrency`` sends in flight.
+
+        A fixed pool of workers pulls phones from a shared iterator, so memory stays
+        proportional to the window rather than the recipient list. The first critical
+        error stops new sends; sends already in flight finish and are recorded
+        before it is re-raised.
+        """
+        phones = iter(request.phones)
+        pace = self._rate_limiter is None and request.delay_between_messages > 0
+        error: Optional[Exception] = None
+
+        async def worker() -> None:
+            nonlocal error
+            for phone in phones:
+                admitted = error is None and await admit()
+                # admit() may have waited, so check for an error again
+                if not admitted or error is not None:
+                    return
+                try:
+                    phone, result = await send_message(phone)
+                except Exception as e:
+                    error = error or e
+                    return
+                record(phone, result)
+                if pace and error is None:
                     await asyncio.sleep(request.delay_between_messages)
-            except (QuotaExceededError, RateLimitError) as e:
-                # Propagate critical errors
-                raise
+
+        workers = [
+            asyncio.ensure_future(worker())
+            for _ in range(min(max_concurrency, len(request.phones)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        if error is not None:
+            raise error
+
+    async def send_bulk_sms_stream(
+        self,
+        recipients: Union[Iterable[Recipient], AsyncIterable[Recipient]],
+        message: Optional[str] = None,
+        sender: Optional[str] = None,
+        reply_webhook_url: Optional[str] = None,
+        webhook_data: Optional[str] = None,
+        max_concurrency: int = 10,
+        delay_between_messages: float = BulkSMSRequest.MIN_DELAY,
+    ) -> AsyncIterator[BulkSMSResult]:
+        """Send messages to a stream of recipients, yielding each result as it completes.
+        
+        Recipients are pulled lazily from a sync or async iterable by a pool of
+        ``max_concurrency`` workers, and results are yielded in completion order
+        without being accumulated, so memory stays flat however many recipients
+        there are. Invalid recipients are reported as failed results rather than
+        raised. The first critical error stops workers from taking new
+        recipients; sends already in flight finish and their results are yielded
+        before the error is raised.
         
+        Args:
+            recipients: Phone numbers to send ``message`` to, or ``(phone, message)``
+                tuples for individual messages
+            message: Message to send to recipients given as plain phone numbers
+            sender: Optional sender name for compliance purposes
+            reply_webhook_url: Optional URL to receive reply webhooks
+            webhook_data: Optional custom data to include in webhooks
+            max_concurrency: Number of sends to keep in flight at once
+            delay_between_messages: Delay in seconds after each message (per worker)
+                when no rate limiter is configured
+            
+        Yields:
+            A BulkSMSResult for each recipient
+            
+        Raises:
+            QuotaExceededError: If the quota is exceeded during sending
+            RateLimitError: If rate limit is exceeded
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if delay_between_messages < BulkSMSRequest.MIN_DELAY:
+            raise ValueError(
+                f"Delay between messages must be at least {BulkSMSRequest.MIN_DELAY} seconds"
+            )
+
+        if hasattr(recipients, "__aiter__"):
+            source = recipients.__aiter__()
+        else:
+            source = _aiter(recipients)
+        source_lock = asyncio.Lock()
+        pace = self._rate_limiter is None
+        finished = object()
+        # Bounded so workers wait for a slow consumer instead of buffering results
+        outcomes: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency)
+        error: Optional[Exception] = None
+
+        async def worker() -> None:
+            while error is None:
+                # Async generators cannot be advanced concurrently
+                async with source_lock:
+                    if error is not None:
+                        return
+                    try:
+                        recipient = await source.__anext__()
+                    except StopAsyncIteration:
+                        return
+                phone, text = (recipient, message) if isinstance(recipient, str) else recipient
+                phone, result = await self._send_recipient(
+                    phone, text, self.api_key, sender, reply_webhook_url, webhook_data
+                )
+                if isinstance(result, Exception):
+                    await outcomes.put(BulkSMSResult(phone=phone, error=str(result)))
+                else:
+                    await outcomes.put(BulkSMSResult(phone=phone, response=result))
+                if pace:
+                    await asyncio.sleep(delay_between_messages)
+
+        async def run_worker() -> None:
+            nonlocal error
+            try:
+                await worker()
+            except Exception as e:
+                # Stop the other workers from taking new recipients
+                if error is None:
+                    error = e
+            await outcomes.put(finished)
+
+        workers = [asyncio.ensure_future(run_worker()) for _ in range(max_concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                item = await outcomes.get()
+                if item is finished:
+                    running -= 1
+                else:
+                    yield item
+            if error is not None:
+                raise error
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _send_recipient(
+        self,
+        phone: str,
+        message: Optional[str],
+        key: str,
+        sender: Optional[str],
+        reply_webhook_url: Optional[str],
+        webhook_data: Optional[str],
+        validated: bool = False,
+    ) -> Tuple[str, Union[SMSResponse, Exception]]:
+        """Send one bulk message, returning non-critical errors as results.
+
+        ``validated`` skips re-validating a phone and message that a
+        BulkSMSRequest has already checked.
+        """
+        try:
+            if message is None:
+                raise ValueError(f"No message provided for {phone}")
+            if validated:
+                sms_request = SMSRequest._trusted(
+                    phone, message, key, sender, reply_webhook_url, webhook_data
+                )
+            else:
+                sms_request = SMSRequest(
+                    phone=phone,
+                    message=message,
+                    key=key,
+                    sender=sender,
+                    reply_webhook_url=reply_webhook_url,
+                    webhook_data=webhook_data
+                )
+            response = await self.send_sms(sms_request)
+            return phone, response
+        except (QuotaExceededError, RateLimitError) as e:
+            # Propagate critical errors
+            raise
+        except Exception as e:
+            return phone, e
+
+    @staticmethod
+    def _mark_unsent(request: BulkSMSRequest, table: BulkResultTable, reason: str) -> None:
+        """Report phones that were never dispatched because the send stopped early"""
+        recorded = set(table.results)
+        recorded.update(table.errors)
+        for phone in request.phones:
+            if phone not in recorded:
+                table.add_error(phone, reason)
+
+    @staticmethod
+    def _bulk_response(request: BulkSMSRequest, table: BulkResultTable) -> BulkSMSResponse:
+        """Summarize collected results into a BulkSMSResponse"""
         # Calculate statistics
         total_messages = len(request.phones)
-        successful_messages = len([r for r in results.values() if r.success])
+        successful_messages = table.successful_count
         failed_messages = total_messages - successful_messages
         
         return BulkSMSResponse(
             total_messages=total_messages,
             successful_messages=successful_messages,
             failed_messages=failed_messages,
-            results=results,
-            errors=errors
+            results=table.results,
+            errors=table.errors,
+            duplicates_removed=request.duplicates_removed,
         )
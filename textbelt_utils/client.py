@@ -1,8 +1,14 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import replace
+from functools import partial
 import json
+import threading
 import time
-from typing import Dict
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, TypeVar, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 from .models import (
     SMSRequest,
@@ -11,21 +17,174 @@ from .models import (
     QuotaResponse,
     BulkSMSRequest,
     BulkSMSResponse,
+    BulkSMSResult,
+    BulkStatusResponse,
 )
 from .exceptions import (
     QuotaExceededError,
     InvalidRequestError,
     APIError,
     RateLimitError,
+    RequestTimeoutError,
 )
+from .journal import SendJournal
+from .quota import QuotaTracker
+from .results import BulkResultTable
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .status_cache import StatusCache
+
+T = TypeVar("T")
+
+DEADLINE_EXCEEDED = "Bulk send deadline exceeded before sending"
+QUOTA_EXHAUSTED = "Not sent: remaining quota exhausted"
+
+# Transport errors retried for idempotent GET requests; POST requests are only
+# retried when _never_sent says the request can't have reached the server
+_TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+def _never_sent(exc: BaseException) -> bool:
+    """Return True if ``exc`` was raised before the request could reach the server"""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], "reason", None) if exc.args else None
+    return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
 
 class TextbeltClient:
     """Client for interacting with the Textbelt API"""
 
     BASE_URL = "https://textbelt.com"
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        connect_timeout: Optional[float] = 5.0,
+        read_timeout: Optional[float] = 30.0,
+        total_timeout: Optional[float] = None,
+        base_url: Optional[str] = None,
+        quota_cache_ttl: Optional[float] = None,
+        status_cache: Optional[StatusCache] = None,
+    ):
+        """Initialize the client with a pooled HTTP session.
+
+        Args:
+            api_key: Your Textbelt API key
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept open per host
+            keep_alive: Whether to reuse connections between requests
+            rate_limiter: Optional limiter consulted before every request. When set,
+                it replaces the fixed delay between bulk messages.
+            retry_policy: Optional policy for retrying rate-limited, server-error and
+                transport-error responses. Without one, requests are not retried.
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server between bytes of the response
+            total_timeout: Optional upper bound in seconds for a whole API call,
+                including retries and backoff
+            base_url: Optional API root to use instead of BASE_URL, e.g. a local
+                MockTextbeltServer
+            quota_cache_ttl: Optional number of seconds check_quota may answer from
+                the last reported quota instead of calling the API. Send responses
+                refresh the cached value, and concurrent cache misses share one request.
+            status_cache: Optional StatusCache check_status answers from before
+                calling the API. It can be shared between clients.
+        """
         self.api_key = api_key
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._timeout = (connect_timeout, read_timeout)
+        self._total_timeout = total_timeout
+        self._quota = QuotaTracker()
+        self._quota_cache_ttl = quota_cache_ttl
+        self._status_cache = status_cache
+        self._quota_fetch_lock = threading.Lock()
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if not keep_alive:
+            self._session.headers["Connection"] = "close"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections"""
+        self._session.close()
+
+    @property
+    def quota_remaining(self) -> Optional[int]:
+        """Remaining quota as of the last API response, without a network call.
+
+        None until a send or quota check has reported it.
+        """
+        return self._quota.remaining
+
+    def _throttle(self, endpoint: str) -> None:
+        """Wait for the rate limiter, if one is configured"""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(endpoint)
+
+    def _request(self, method: str, endpoint: str, url: str, **kwargs) -> requests.Response:
+        """Make an HTTP request, applying rate limiting, timeouts and the retry policy"""
+        policy = self._retry_policy
+        send = getattr(self._session, method)
+        deadline = None
+        if self._total_timeout is not None:
+            deadline = time.monotonic() + self._total_timeout
+        attempt = 1
+        while True:
+            timeout = self._timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RequestTimeoutError(
+                        f"Request to /{endpoint} timed out after {self._total_timeout} seconds"
+                    )
+                timeout = tuple(remaining if t is None else min(t, remaining) for t in timeout)
+
+            self._throttle(endpoint)
+            try:
+                response = send(url, timeout=timeout, **kwargs)
+            except Exception as e:
+                delay = None
+                # A POST that may have reached the server is not retried: the
+                # message could already have been sent
+                transport = _TRANSPORT_ERRORS if method == "get" or _never_sent(e) else ()
+                if policy is not None and policy.should_retry_exception(e, attempt, transport):
+                    delay = policy.backoff(attempt)
+                if delay is None or not self._before_deadline(deadline, delay):
+                    if isinstance(e, requests.Timeout):
+                        raise RequestTimeoutError(f"Request to /{endpoint} timed out: {e}") from e
+                    raise
+            else:
+                if policy is None or not policy.should_retry_status(response.status_code, attempt):
+                    return response
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = None
+                delay = policy.backoff(attempt, parse_retry_after(data, response.headers))
+                if not self._before_deadline(deadline, delay):
+                    return response
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _before_deadline(deadline: Optional[float], delay: float) -> bool:
+        """Return True if waiting ``delay`` seconds still leaves time before ``deadline``"""
+        return deadline is None or time.monotonic() + delay < deadline
 
     def send_sms(self, request: SMSRequest) -> SMSResponse:
         """Send an SMS using the Textbelt API"""
@@ -42,7 +201,7 @@ class TextbeltClient:
         if request.webhook_data:
             payload["webhookData"] = request.webhook_data
 
-        response = requests.post(f"{self.BASE_URL}/text", data=payload)
+        response = self._request("post", "text", f"{self.base_url}/text", data=payload)
 
         # Handle rate limiting
         if response.status_code == 429:
@@ -58,8 +217,12 @@ class TextbeltClient:
         if not response.ok:
             raise APIError(f"API request failed: {data.get('error', 'Unknown error')}")
 
+        if "quotaRemaining" in data:
+            self._quota.update(data["quotaRemaining"])
+
         if not data["success"]:
             if "quota" in data.get("error", "").lower():
+                self._quota.update(data.get("quotaRemaining", 0))
                 raise QuotaExceededError("SMS quota exceeded")
             raise InvalidRequestError(data.get("error", "Unknown error"))
 
@@ -72,7 +235,11 @@ class TextbeltClient:
 
     def check_status(self, text_id: str) -> StatusResponse:
         """Check the delivery status of a sent message"""
-        response = requests.get(f"{self.BASE_URL}/status/{text_id}")
+        if self._status_cache is not None:
+            cached = self._status_cache.get(text_id)
+            if cached is not None:
+                return cached
+        response = self._request("get", "status", f"{self.base_url}/status/{text_id}")
 
         try:
             data = response.json()
@@ -82,11 +249,66 @@ class TextbeltClient:
         if not response.ok:
             raise APIError(f"Failed to check status: {data.get('error', 'Unknown error')}")
 
-        return StatusResponse(status=data["status"])
+        status = StatusResponse(status=data["status"])
+        if self._status_cache is not None:
+            self._status_cache.put(text_id, status)
+        return status
+
+    def check_status_many(
+        self,
+        text_ids: Iterable[str],
+        max_workers: int = 10,
+    ) -> BulkStatusResponse:
+        """Check the delivery status of many messages concurrently.
+        
+        Lookups are fanned out over a thread pool sharing this client's pooled
+        session and rate limiter. A failed lookup is reported in ``errors``
+        rather than aborting the batch.
+        
+        Args:
+            text_ids: Text IDs to look up; duplicates are looked up once
+            max_workers: Number of lookups to run at once
+            
+        Returns:
+            A BulkStatusResponse with the status or error for every text ID
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        def lookup(text_id: str) -> Tuple[str, Union[StatusResponse, Exception]]:
+            try:
+                return text_id, self.check_status(text_id)
+            except Exception as e:
+                return text_id, e
+
+        statuses: Dict[str, StatusResponse] = {}
+        errors: Dict[str, str] = {}
+        calls = (partial(lookup, text_id) for text_id in dict.fromkeys(text_ids))
+        for text_id, result in self._iter_threaded(calls, max_workers):
+            if isinstance(result, Exception):
+                errors[text_id] = str(result)
+            else:
+                statuses[text_id] = result
+        return BulkStatusResponse(statuses=statuses, errors=errors)
 
     def check_quota(self) -> QuotaResponse:
         """Check the remaining quota for the API key"""
-        response = requests.get(f"{self.BASE_URL}/quota/{self.api_key}")
+        if self._quota_cache_ttl is None:
+            return self._fetch_quota()
+
+        cached = self._quota.fresh(self._quota_cache_ttl)
+        if cached is not None:
+            return QuotaResponse(success=True, quota_remaining=cached)
+        # Callers that miss together wait for the first one's request
+        with self._quota_fetch_lock:
+            cached = self._quota.fresh(self._quota_cache_ttl)
+            if cached is not None:
+                return QuotaResponse(success=True, quota_remaining=cached)
+            return self._fetch_quota()
+
+    def _fetch_quota(self) -> QuotaResponse:
+        """Request the remaining quota from the API"""
+        response = self._request("get", "quota", f"{self.base_url}/quota/{self.api_key}")
 
         try:
             data = response.json()
@@ -96,6 +318,7 @@ class TextbeltClient:
         if not response.ok or not data["success"]:
             raise APIError("Failed to check quota")
 
+        self._quota.update(data["quotaRemaining"])
         return QuotaResponse(
             success=data["success"],
             quota_remaining=data["quotaRemaining"]
@@ -113,11 +336,35 @@ class TextbeltClient:
         )
         return self.send_sms(test_request)
 
-    def send_bulk_sms(self, request: BulkSMSRequest) -> BulkSMSResponse:
+    def send_bulk_sms(
+        self,
+        request: BulkSMSRequest,
+        max_workers: Optional[int] = None,
+        journal: Optional[SendJournal] = None,
+        deadline: Optional[float] = None,
+        respect_quota: bool = False,
+    ) -> BulkSMSResponse:
         """Send multiple SMS messages in bulk with rate limiting.
         
+        Messages are sent one at a time by default. With ``max_workers`` set, sends
+        are fanned out over a thread pool sharing this client's pooled session;
+        size ``pool_maxsize`` to at least ``max_workers`` so every worker can keep
+        its connection alive.
+        
         Args:
             request: A BulkSMSRequest object containing the messages to send
+            max_workers: Optional number of threads to send messages concurrently
+            journal: Optional SendJournal that records each recipient's outcome as
+                it happens, so an interrupted send can be resumed with resume_bulk_sms
+            deadline: Optional number of seconds after which no new messages are
+                sent. Messages already in flight are allowed to finish and the
+                partial results are returned, with unsent phones reported in ``errors``.
+                With ``max_workers``, messages still queued for a worker at the
+                deadline are not sent either.
+            respect_quota: Stop dispatching once the locally tracked quota is used
+                up, reporting the unsent phones in ``errors`` instead of running into
+                QuotaExceededError. The quota is checked once up front if no response
+                has reported it yet.
             
         Returns:
             A BulkSMSResponse object containing the results of the bulk send operation
@@ -128,52 +375,328 @@ class TextbeltClient:
             APIError: If there is an error communicating with the API
             RateLimitError: If rate limit is exceeded
         """
-        results: dict[str, SMSResponse] = {}
-        errors: dict[str, str] = {}
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        expires_at = time.monotonic() + deadline if deadline is not None else None
+        if respect_quota and self.quota_remaining is None:
+            self.check_quota()
+
+        stop_reason: Optional[str] = None
+
+        def dispatchable(phones: Iterable[str]) -> Iterator[str]:
+            nonlocal stop_reason
+            for phone in phones:
+                if stop_reason is not None:
+                    return
+                # Checked first, as it may wait for sends in flight to settle
+                if respect_quota and self._quota.wait_available() == 0:
+                    stop_reason = QUOTA_EXHAUSTED
+                    return
+                if expires_at is not None and time.monotonic() >= expires_at:
+                    stop_reason = DEADLINE_EXCEEDED
+                    return
+                yield phone
+
+        table = BulkResultTable(unique_phones=request.deduplicate)
+
+        def record(phone: str, result: Union[SMSResponse, Exception, None]) -> None:
+            nonlocal stop_reason
+            if result is None:
+                # Reached a worker only after the deadline; reported by _mark_unsent
+                stop_reason = DEADLINE_EXCEEDED
+                return
+            if isinstance(result, Exception):
+                table.add_error(phone, str(result))
+                if journal is not None:
+                    journal.record(phone, error=str(result))
+            else:
+                table.add_response(phone, result)
+                if journal is not None:
+                    journal.record(phone, response=result)
+
+        try:
+            if max_workers is not None:
+                calls = (
+                    partial(self._send_bulk_message, request, phone, respect_quota, expires_at)
+                    for phone in dispatchable(request.phones)
+                )
+                for phone, result in self._iter_threaded(calls, max_workers):
+                    record(phone, result)
+            else:
+                # Create batches of phone numbers
+                phone_batches = [
+                    request.phones[i:i + request.batch_size]
+                    for i in range(0, len(request.phones), request.batch_size)
+                ]
+                
+                for batch in phone_batches:
+                    for phone in dispatchable(batch):
+                        record(*self._send_bulk_message(request, phone, respect_quota))
+        finally:
+            if journal is not None:
+                journal.flush()
+
+        if stop_reason is not None:
+            self._mark_unsent(request, table, stop_reason)
         
-        # Create batches of phone numbers
-        phone_batches = [
-            request.phones[i:i + request.batch_size]
-            for i in range(0, len(request.phones), request.batch_size)
-        ]
+        return self._bulk_response(request, table)
+
+    def resume_bulk_sms(
+        self,
+        request: BulkSMSRequest,
+        journal: SendJournal,
+        max_workers: Optional[int] = None,
+        include_failed: bool = False,
+    ) -> BulkSMSResponse:
+        """Resume a bulk send, skipping recipients the journal records as sent.
         
-        for batch in phone_batches:
-            for phone in batch:
-                try:
-                    # Create individual SMS request
-                    message = request.message if request.message is not None else request.individual_messages[phone]
-                    sms_request = SMSRequest(
-                        phone=phone,
-                        message=message,
-                        key=request.key or self.api_key,
-                        sender=request.sender,
-                        reply_webhook_url=request.reply_webhook_url,
-                        webhook_data=request.webhook_data
-                    )
-                    
-                    # Send the message
-                    response = self.send_sms(sms_request)
-                    results[phone] = response
-                    
-                    # Apply rate limiting delay
-                    if request.delay_between_messages > 0:
-                        time.sleep(request.delay_between_messages)
-                        
-                except (QuotaExceededError, RateLimitError) as e:
-                    # Propagate critical errors immediately
-                    raise
-                except Exception as e:
-                    errors[phone] = str(e)
+        Args:
+            request: The original BulkSMSRequest
+            journal: The SendJournal used by the interrupted send
+            max_workers: Optional number of threads to send messages concurrently
+            include_failed: Also skip recipients whose previous send failed
+            
+        Returns:
+            A BulkSMSResponse covering only the recipients sent by this call
+        """
+        done = journal.completed(include_failed=include_failed)
+        remaining = [phone for phone in request.phones if phone not in done]
+        if not remaining:
+            return BulkSMSResponse(
+                total_messages=0,
+                successful_messages=0,
+                failed_messages=0,
+                results={},
+                errors={}
+            )
+        return self.send_bulk_sms(
+            replace(request, phones=remaining),
+            max_workers=max_workers,
+            journal=journal,
+        )
+
+    def send_bulk_sms_stream(
+        self,
+        recipients: Iterable[Union[str, Tuple[str, str]]],
+        message: Optional[str] = None,
+        sender: Optional[str] = None,
+        reply_webhook_url: Optional[str] = None,
+        webhook_data: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        delay_between_messages: float = BulkSMSRequest.MIN_DELAY,
+    ) -> Iterator[BulkSMSResult]:
+        """Send messages to a stream of recipients, yielding each result as it completes.
+        
+        Unlike send_bulk_sms, recipients are consumed lazily and nothing is
+        accumulated, so memory stays flat however many recipients there are.
+        Invalid recipients are reported as failed results rather than raised.
         
+        Args:
+            recipients: Phone numbers to send ``message`` to, or ``(phone, message)``
+                tuples for individual messages
+            message: Message to send to recipients given as plain phone numbers
+            sender: Optional sender name for compliance purposes
+            reply_webhook_url: Optional URL to receive reply webhooks
+            webhook_data: Optional custom data to include in webhooks
+            max_workers: Optional number of threads to send messages concurrently.
+                Results are then yielded in completion order.
+            delay_between_messages: Delay in seconds after each message (per worker)
+                when no rate limiter is configured
+            
+        Yields:
+            A BulkSMSResult for each recipient
+            
+        Raises:
+            QuotaExceededError: If the quota is exceeded during sending
+            RateLimitError: If rate limit is exceeded
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if delay_between_messages < BulkSMSRequest.MIN_DELAY:
+            raise ValueError(
+                f"Delay between messages must be at least {BulkSMSRequest.MIN_DELAY} seconds"
+            )
+
+        def calls():
+            for recipient in recipients:
+                phone, text = (recipient, message) if isinstance(recipient, str) else recipient
+                yield partial(
+                    self._send_recipient,
+                    phone,
+                    text,
+                    self.api_key,
+                    sender,
+                    reply_webhook_url,
+                    webhook_data,
+                    delay_between_messages,
+                )
+
+        if max_workers is None:
+            outcomes = (call() for call in calls())
+        else:
+            outcomes = self._iter_threaded(calls(), max_workers)
+
+        for phone, result in outcomes:
+            if isinstance(result, Exception):
+                yield BulkSMSResult(phone=phone, error=str(result))
+            else:
+                yield BulkSMSResult(phone=phone, response=result)
+
+    def _send_bulk_message(
+        self,
+        request: BulkSMSRequest,
+        phone: str,
+        respect_quota: bool = False,
+        expires_at: Optional[float] = None,
+    ) -> Tuple[str, Union[SMSResponse, Exception, None]]:
+        """Send one message of a bulk request, returning non-critical errors as results.
+
+        Returns None as the result, without sending, if ``expires_at`` has passed
+        by the time a worker picks the message up.
+        """
+        if expires_at is not None and time.monotonic() >= expires_at:
+            return phone, None
+        try:
+            message = request.message_for(phone)
+        except ValueError as e:
+            # A template that renders an invalid message fails only this recipient
+            return phone, e
+        send = partial(
+            self._send_recipient,
+            phone,
+            message,
+            request.key or self.api_key,
+            request.sender,
+            request.reply_webhook_url,
+            request.webhook_data,
+            request.delay_between_messages,
+            validated=True,
+        )
+        if not respect_quota:
+            return send()
+        while True:
+            with self._quota.hold() as held:
+                if held:
+                    return send()
+            # Sends still in flight may settle with quota to spare
+            if not self._quota.wait_available():
+                return phone, QuotaExceededError(QUOTA_EXHAUSTED)
+            if expires_at is not None and time.monotonic() >= expires_at:
+                return phone, None
+
+    def _send_recipient(
+        self,
+        phone: str,
+        message: Optional[str],
+        key: str,
+        sender: Optional[str],
+        reply_webhook_url: Optional[str],
+        webhook_data: Optional[str],
+        delay: float,
+        validated: bool = False,
+    ) -> Tuple[str, Union[SMSResponse, Exception]]:
+        """Send one bulk message, returning non-critical errors as results.
+
+        ``validated`` skips re-validating a phone and message that a
+        BulkSMSRequest has already checked.
+        """
+        try:
+            if message is None:
+                raise ValueError(f"No message provided for {phone}")
+
+            # Create individual SMS request
+            if validated:
+                sms_request = SMSRequest._trusted(
+                    phone, message, key, sender, reply_webhook_url, webhook_data
+                )
+            else:
+                sms_request = SMSRequest(
+                    phone=phone,
+                    message=message,
+                    key=key,
+                    sender=sender,
+                    reply_webhook_url=reply_webhook_url,
+                    webhook_data=webhook_data
+                )
+            
+            # Send the message
+            response = self.send_sms(sms_request)
+            
+            # Apply rate limiting delay unless a rate limiter paces requests
+            if self._rate_limiter is None and delay > 0:
+                time.sleep(delay)
+            
+            return phone, response
+        except (QuotaExceededError, RateLimitError) as e:
+            # Propagate critical errors immediately
+            raise
+        except Exception as e:
+            return phone, e
+
+    @staticmethod
+    def _iter_threaded(calls: Iterable[Callable[[], T]], max_workers: int) -> Iterator[T]:
+        """Run ``calls`` over a thread pool, yielding their results as they complete.
+
+        At most ``2 * max_workers`` calls are queued at once so memory stays flat for
+        large inputs. The first exception stops dispatching and cancels queued calls.
+        Calls already running are allowed to finish and their results are still
+        yielded, so the caller can record them, before the exception is re-raised.
+        """
+        calls = iter(calls)
+        window = 2 * max_workers
+        pending = set()
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while True:
+                    if error is None:
+                        for call in calls:
+                            pending.add(executor.submit(call))
+                            if len(pending) >= window:
+                                break
+                    if not pending:
+                        break
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future.cancelled():
+                            continue
+                        exc = future.exception()
+                        if exc is None:
+                            yield future.result()
+                        elif error is None:
+                            error = exc
+                            for queued in pending:
+                                queued.cancel()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _mark_unsent(request: BulkSMSRequest, table: BulkResultTable, reason: str) -> None:
+        """Report phones that were never dispatched because the send stopped early"""
+        recorded = set(table.results)
+        recorded.update(table.errors)
+        for phone in request.phones:
+            if phone not in recorded:
+                table.add_error(phone, reason)
+
+    @staticmethod
+    def _bulk_response(request: BulkSMSRequest, table: BulkResultTable) -> BulkSMSResponse:
+        """Summarize collected results into a BulkSMSResponse"""
         # Calculate statistics
         total_messages = len(request.phones)
-        successful_messages = len([r for r in results.values() if r.success])
+        successful_messages = table.successful_count
         failed_messages = total_messages - successful_messages
         
         return BulkSMSResponse(
             total_messages=total_messages,
             successful_messages=successful_messages,
             failed_messages=failed_messages,
-            results=results,
-            errors=errors
+            results=table.results,
+            errors=table.errors,
+            duplicates_removed=request.duplicates_removed,
         )
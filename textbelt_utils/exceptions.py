@@ -20,6 +20,10 @@ class APIError(TextbeltError):
     """Raised when the API returns an error"""
     pass
 
+class RequestTimeoutError(APIError):
+    """Raised when an API request does not complete within its timeout"""
+    pass
+
 class BulkSendError(Exception):
     """Raised when there is a batch-level error during bulk sending."""
     def __init__(self, message: str, failed_phones: dict[str, str]):
@@ -0,0 +1,111 @@
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+from .models import SMSResponse
+
+class SendJournal:
+    """Durable record of bulk send outcomes, used to resume interrupted campaigns.
+
+    Outcomes are stored in a SQLite database in WAL mode, keyed by phone number.
+    Writes are buffered and committed in batches of ``flush_every`` outcomes (or
+    after ``flush_interval`` seconds), so journaling adds little to send latency.
+    If the process dies, at most one unflushed batch is lost and those phones are
+    sent again on resume.
+
+    Example:
+        with SendJournal("campaign.db") as journal:
+            client.resume_bulk_sms(request, journal)
+    """
+
+    def __init__(self, path: str, flush_every: int = 100, flush_interval: float = 1.0):
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, int, Optional[str], Optional[str], float]] = []
+        self._last_flush = time.monotonic()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS outcomes ("
+            " phone TEXT PRIMARY KEY,"
+            " success INTEGER NOT NULL,"
+            " text_id TEXT,"
+            " error TEXT,"
+            " recorded_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(
+        self,
+        phone: str,
+        response: Optional[SMSResponse] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Buffer the outcome of sending to ``phone``, flushing if the batch is full."""
+        success = int(response is not None and response.success)
+        text_id = response.text_id if response is not None else None
+        with self._lock:
+            self._pending.append((phone, success, text_id, error, time.time()))
+            if (
+                len(self._pending) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Commit all buffered outcomes to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._pending:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO outcomes"
+                    " (phone, success, text_id, error, recorded_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    self._pending,
+                )
+            self._pending = []
+        self._last_flush = time.monotonic()
+
+    def completed(self, include_failed: bool = False) -> Set[str]:
+        """Return the phones that should not be sent to again.
+
+        Args:
+            include_failed: Also treat phones whose send failed as completed
+        """
+        self.flush()
+        query = "SELECT phone FROM outcomes"
+        if not include_failed:
+            query += " WHERE success = 1"
+        with self._lock:
+            return {row[0] for row in self._conn.execute(query)}
+
+    def text_ids(self) -> List[Tuple[str, str]]:
+        """Return ``(phone, text_id)`` pairs for every successfully sent message."""
+        self.flush()
+        with self._lock:
+            return list(self._conn.execute(
+                "SELECT phone, text_id FROM outcomes WHERE success = 1 AND text_id IS NOT NULL"
+            ))
+
+    def close(self) -> None:
+        """Flush buffered outcomes and close the database."""
+        self.flush()
+        self._conn.close()
@@ -0,0 +1,316 @@
+"""ASGI and WSGI middleware that receives Textbelt reply webhooks.
+
+The middleware answers POST requests to one path. It verifies the
+X-textbelt-timestamp and X-textbelt-signature headers, parses the body into a
+WebhookResponse, acknowledges at once and hands the webhook to a bounded pool
+of workers that call your handler. A slow handler never delays the response
+Textbelt is waiting for. When the queue is full the middleware answers 503,
+so load is shed instead of piling up in memory. Every other request is passed
+through to the wrapped app.
+
+    verifier = WebhookVerifier("your_api_key", replay_guard=ReplayGuard())
+
+    # ASGI (FastAPI, Starlette, Quart, ...); handler may be sync or async
+    app = WebhookMiddleware(app, verifier, handle_reply, path="/textbelt/webhook")
+
+    # WSGI (Flask, Django, ...)
+    app.wsgi_app = WSGIWebhookMiddleware(app.wsgi_app, verifier, handle_reply)
+"""
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+from typing import Any, Callable, List, Optional, Tuple
+
+from .exceptions import WebhookVerificationError
+from .models import WebhookResponse
+from .webhooks import WebhookVerifier, parse_webhook
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+}
+
+_logger = logging.getLogger(__name__)
+
+Handler = Callable[[WebhookResponse], Any]
+ErrorHandler = Callable[[WebhookResponse, Exception], None]
+
+class _WebhookReceiver:
+    """Verification, parsing and error reporting shared by both middlewares"""
+
+    def __init__(
+        self,
+        app,
+        verifier: WebhookVerifier,
+        handler: Handler,
+        path: str = "/textbelt/webhook",
+        workers: int = 4,
+        queue_size: int = 1000,
+        max_body_size: int = 64 * 1024,
+        on_error: Optional[ErrorHandler] = None,
+        retry_after: int = 5,
+    ):
+        """Wrap ``app``.
+
+        Args:
+            app: The application that handles every other request
+            verifier: WebhookVerifier for your API key
+            handler: Called with each verified WebhookResponse by a worker
+            path: Request path the webhook is delivered to
+            workers: Number of webhooks handled at once
+            queue_size: Number of verified webhooks that may wait for a worker
+                before requests are answered with 503
+            max_body_size: Largest request body accepted, in bytes
+            on_error: Optional callback for exceptions raised by ``handler``. By
+                default they are logged.
+            retry_after: Seconds sent in the Retry-After header of a 503
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.app = app
+        self.verifier = verifier
+        self.handler = handler
+        self.path = path
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_body_size = max_body_size
+        self.on_error = on_error
+        self.retry_after = retry_after
+
+    def _receive(self, timestamp, signature, body: bytes) -> Tuple[int, Optional[WebhookResponse]]:
+        """Verify and parse a webhook, returning the response status and the webhook"""
+        if not timestamp or not signature:
+            return 401, None
+        try:
+            if not self.verifier.verify(timestamp, signature, body):
+                return 401, None
+        except WebhookVerificationError:
+            return 401, None
+        try:
+            return 200, parse_webhook(body)
+        except WebhookVerificationError:
+            return 400, None
+
+    def _failed(self, webhook: WebhookResponse, error: Exception) -> None:
+        if self.on_error is not None:
+            self.on_error(webhook, error)
+        else:
+            _logger.error("Webhook handler failed for text %s", webhook.text_id, exc_info=error)
+
+    def _response(self, status: int) -> Tuple[bytes, List[Tuple[str, str]]]:
+        body = _REASONS[status].encode()
+        headers = [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))]
+        if status == 503:
+            headers.append(("Retry-After", str(self.retry_after)))
+        return body, headers
+
+class WebhookMiddleware(_WebhookReceiver):
+    """ASGI middleware that verifies webhooks and handles them in worker tasks.
+
+    Workers start with the first webhook, on the server's event loop. An async
+    handler is awaited; a sync handler runs in the loop's default executor. On
+    lifespan shutdown the queue is drained before the wrapped app is told to
+    shut down; call ``aclose`` yourself if the server doesn't send lifespan events.
+    """
+
+    def __init__(self, app, verifier: WebhookVerifier, handler: Handler, **kwargs):
+        super().__init__(app, verifier, handler, **kwargs)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._is_async = inspect.iscoroutinefunction(handler)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self.app(scope, self._draining(receive), send)
+        if scope["type"] != "http" or scope["path"] != self.path:
+            return await self.app(scope, receive, send)
+        if scope["method"] != "POST":
+            return await self._send(send, 405)
+
+        body = await self._read_body(receive)
+        if body is None:
+            return await self._send(send, 413)
+
+        self._start()
+        if self._queue.full():
+            return await self._send(send, 503)
+
+        timestamp = signature = None
+        for name, value in scope["headers"]:
+            if name == b"x-textbelt-timestamp":
+                timestamp = value
+            elif name == b"x-textbelt-signature":
+                signature = value
+        status, webhook = self._receive(timestamp, signature, body)
+        if webhook is not None:
+            # Nothing has awaited since the full() check, so this can't fail
+            self._queue.put_nowait(webhook)
+        await self._send(send, status)
+
+    async def _read_body(self, receive) -> Optional[bytes]:
+        """Read the request body, or return None if it exceeds max_body_size"""
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+        return b"".join(chunks)
+
+    async def _send(self, send, status: int) -> None:
+        body, headers = self._response(status)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(name.lower().encode(), value.encode()) for name, value in headers],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _draining(self, receive):
+        async def wrapped():
+            message = await receive()
+            if message["type"] == "lifespan.shutdown":
+                await self.aclose()
+            return message
+        return wrapped
+
+    def _start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self.workers)]
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            webhook = await self._queue.get()
+            try:
+                if self._is_async:
+                    await self.handler(webhook)
+                else:
+                    result = await loop.run_in_executor(None, self.handler, webhook)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                self._failed(webhook, e)
+            finally:
+                self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued webhook has been handled."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """Handle the webhooks still queued, then stop the workers."""
+        if self._queue is None:
+            return
+        await self._queue.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue = None
+        self._tasks = []
+
+class WSGIWebhookMiddleware(_WebhookReceiver):
+    """WSGI middleware that verifies webhooks and handles them in worker threads.
+
+    Workers are daemon threads started with the first webhook. Call ``close`` on
+    shutdown to handle the webhooks still queued.
+    """
+
+    def __init__(self, app, verifier: WebhookVerifier, handler: Handler, **kwargs):
+        super().__init__(app, verifier, handler, **kwargs)
+        self._queue: "queue.Queue[Optional[WebhookResponse]]" = queue.Queue()
+        # One slot per webhook waiting for a worker, taken before verifying so a
+        # webhook is never recorded by a replay guard and then refused
+        self._slots = threading.Semaphore(self.queue_size)
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        if environ.get("PATH_INFO") != self.path:
+            return self.app(environ, start_response)
+        if environ.get("REQUEST_METHOD") != "POST":
+            return self._send(start_response, 405)
+
+        try:
+            length = int(environ.get("CONTENT_LENGTH") or "")
+        except ValueError:
+            return self._send(start_response, 411)
+        if length > self.max_body_size:
+            return self._send(start_response, 413)
+        body = environ["wsgi.input"].read(length)
+
+        self._start()
+        if not self._slots.acquire(blocking=False):
+            return self._send(start_response, 503)
+        status, webhook = self._receive(
+            environ.get("HTTP_X_TEXTBELT_TIMESTAMP"),
+            environ.get("HTTP_X_TEXTBELT_SIGNATURE"),
+            body,
+        )
+        if webhook is None:
+            self._slots.release()
+        else:
+            self._queue.put(webhook)
+        return self._send(start_response, status)
+
+    def _send(self, start_response, status: int) -> List[bytes]:
+        body, headers = self._response(status)
+        start_response(f"{status} {_REASONS[status]}", headers)
+        return [body]
+
+    def _start(self) -> None:
+        if self._threads:
+            return
+        with self._start_lock:
+            if not self._threads:
+                self._threads = [
+                    threading.Thread(target=self._work, name=f"textbelt-webhook-{i}", daemon=True)
+                    for i in range(self.workers)
+                ]
+                for thread in self._threads:
+                    thread.start()
+
+    def _work(self) -> None:
+        while True:
+            webhook = self._queue.get()
+            try:
+                if webhook is None:
+                    return
+                self._slots.release()
+                self.handler(webhook)
+            except Exception as e:
+                self._failed(webhook, e)
+            finally:
+                self._queue.task_done()
+
+    def join(self) -> None:
+        """Block until every queued webhook has been handled."""
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Handle the webhooks still queued, then stop the worker threads."""
+        with self._start_lock:
+            threads, self._threads = self._threads, []
+            for _ in threads:
+                self._queue.put(None)
+            for thread in threads:
+                thread.join(timeout)
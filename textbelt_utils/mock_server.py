@@ -0,0 +1,246 @@
+"""Local stand-in for the Textbelt API, for tests and benchmarks.
+
+Run it from the command line:
+
+    python -m textbelt_utils.mock_server --port 8080 --latency 0.05
+
+or embed it:
+
+    with MockTextbeltServer(latency=0.01) as server:
+        client = TextbeltClient(api_key="test", base_url=server.url)
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import threading
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+class _State:
+    """Quota, message and OTP bookkeeping for the mock API"""
+
+    def __init__(self, quota: int):
+        self.quota_remaining = quota
+        self.messages_sent = 0
+        self._ids = itertools.count(1)
+        self._otps: Dict[str, str] = {}
+
+    def _consume_quota(self) -> Optional[dict]:
+        if self.quota_remaining <= 0:
+            return {"success": False, "quotaRemaining": 0, "error": "Out of quota"}
+        self.quota_remaining -= 1
+        self.messages_sent += 1
+        return None
+
+    def send(self, form: dict) -> dict:
+        if not form.get("phone") or not form.get("message"):
+            return {"success": False, "quotaRemaining": self.quota_remaining,
+                    "error": "Missing phone or message"}
+        error = self._consume_quota()
+        if error:
+            return error
+        return {"success": True, "quotaRemaining": self.quota_remaining,
+                "textId": str(next(self._ids))}
+
+    def status(self, text_id: str) -> dict:
+        # Every id handed out by this server has been "delivered"
+        return {"status": "DELIVERED" if text_id.isdigit() else "UNKNOWN"}
+
+    def quota(self) -> dict:
+        return {"success": True, "quotaRemaining": self.quota_remaining}
+
+    def generate_otp(self, form: dict) -> dict:
+        if not form.get("phone") or not form.get("userid"):
+            return {"success": False, "quotaRemaining": self.quota_remaining,
+                    "error": "Missing phone or userid"}
+        error = self._consume_quota()
+        if error:
+            return error
+        length = int(form.get("length") or 6)
+        otp = "".join(random.choice("0123456789") for _ in range(length))
+        self._otps[form["userid"]] = otp
+        return {"success": True, "quotaRemaining": self.quota_remaining,
+                "textId": str(next(self._ids)), "otp": otp}
+
+    def verify_otp(self, query: dict) -> dict:
+        expected = self._otps.get(query.get("userid", ""))
+        return {"success": True, "isValidOtp": expected is not None and expected == query.get("otp")}
+
+    def route(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        url = urlsplit(target)
+        path = unquote(url.path)
+        if method == "POST":
+            form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+            if path == "/text":
+                return 200, self.send(form)
+            if path == "/otp/generate":
+                return 200, self.generate_otp(form)
+        elif method == "GET":
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            if path.startswith("/status/"):
+                return 200, self.status(path[len("/status/"):])
+            if path.startswith("/quota/"):
+                return 200, self.quota()
+            if path == "/otp/verify":
+                return 200, self.verify_otp(query)
+        return 404, {"success": False, "error": "Not found"}
+
+class MockTextbeltServer:
+    """A local HTTP server implementing the Textbelt API.
+
+    Implements ``/text``, ``/status/{id}``, ``/quota/{key}``, ``/otp/generate``
+    and ``/otp/verify`` with configurable latency, so the clients can be
+    exercised and benchmarked without spending real quota. The server runs an
+    asyncio event loop in a background thread and speaks plain HTTP/1.1 with
+    keep-alive, so simulated latency overlaps across concurrent requests.
+
+    Attributes:
+        host: Interface to listen on
+        port: Port to listen on (0 picks a free port)
+        latency: Seconds each request takes to answer
+        jitter: Optional extra random latency in seconds added per request
+        quota: Starting quota; sends fail with "Out of quota" once it runs out
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        quota: int = 10_000_000,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self._state = _State(quota)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to a client's ``base_url``"""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def messages_sent(self) -> int:
+        """Number of messages accepted so far"""
+        return self._state.messages_sent
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = lines[0].split(" ", 2)
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length") or 0)
+                body = await reader.readexactly(length) if length else b""
+
+                delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                status, data = self._state.route(method, target, body)
+                payload = json.dumps(data).encode()
+                close = headers.get("connection", "").lower() == "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # stop() cancels keep-alive connections; ending quietly keeps the
+            # stream protocol from logging the cancellation as an error
+            pass
+        finally:
+            writer.close()
+
+    async def listen(self) -> asyncio.AbstractServer:
+        """Open the listening socket on the running event loop."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    def start(self) -> "MockTextbeltServer":
+        """Start serving in a background thread."""
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        async def run() -> None:
+            server = await self.listen()
+            started.set()
+            try:
+                await server.serve_forever()
+            except asyncio.CancelledError:
+                pass
+            # Drop any keep-alive connections still open
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        def target() -> None:
+            try:
+                self._loop.run_until_complete(run())
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local stand-in for the Textbelt API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds per request")
+    parser.add_argument("--quota", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    server = MockTextbeltServer(args.host, args.port, args.latency, args.jitter, args.quota)
+
+    async def run() -> None:
+        listener = await server.listen()
+        print(f"Mock Textbelt server listening on {server.url}", flush=True)
+        await listener.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
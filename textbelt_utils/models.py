@@ -1,8 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import re
-from typing import Optional, Literal, ClassVar
+import sys
+from typing import Any, Optional, Literal, ClassVar, Mapping
 
-@dataclass
+from .templates import MessageTemplate
+from .validation import PhoneValidationReport, deduplicate_phones, validate_phones
+
+# Slotted models have no per-instance __dict__; dataclass slots need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class SMSRequest:
     """Request model for sending SMS messages via Textbelt API.
     
@@ -40,7 +47,31 @@ class SMSRequest:
         if len(self.message) == 0:
             raise ValueError("Message cannot be empty")
 
-@dataclass
+    @classmethod
+    def _trusted(
+        cls,
+        phone: str,
+        message: str,
+        key: str,
+        sender: Optional[str] = None,
+        reply_webhook_url: Optional[str] = None,
+        webhook_data: Optional[str] = None,
+    ) -> "SMSRequest":
+        """Build a request from fields that were already validated, skipping __post_init__.
+
+        Used by the bulk senders, whose BulkSMSRequest has validated every phone
+        and message up front.
+        """
+        request = cls.__new__(cls)
+        request.phone = phone
+        request.message = message
+        request.key = key
+        request.sender = sender
+        request.reply_webhook_url = reply_webhook_url
+        request.webhook_data = webhook_data
+        return request
+
+@dataclass(**_SLOTS)
 class SMSResponse:
     """Response model for SMS sending operations.
     
@@ -55,7 +86,7 @@ class SMSResponse:
     text_id: Optional[str] = None
     error: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class WebhookResponse:
     """Response model for webhook data from Textbelt.
     
@@ -79,7 +110,10 @@ StatusType = Literal[
     "UNKNOWN"    # Could not determine status
 ]
 
-@dataclass
+# Statuses that never change once reported
+TERMINAL_STATUSES: frozenset = frozenset({"DELIVERED", "FAILED"})
+
+@dataclass(**_SLOTS)
 class StatusResponse:
     """Response model for message status checks.
     
@@ -99,7 +133,7 @@ class StatusResponse:
     """
     status: StatusType
 
-@dataclass
+@dataclass(**_SLOTS)
 class QuotaResponse:
     """Response model for quota checks.
     
@@ -110,7 +144,7 @@ class QuotaResponse:
     success: bool
     quota_remaining: int
 
-@dataclass
+@dataclass(**_SLOTS)
 class OTPGenerateRequest:
     """Request model for generating and sending OTP via Textbelt API.
     
@@ -162,7 +196,7 @@ class OTPGenerateRequest:
                     f"length must be between {self.MIN_LENGTH} and {self.MAX_LENGTH} digits"
                 )
 
-@dataclass
+@dataclass(**_SLOTS)
 class OTPGenerateResponse:
     """Response model for OTP generation.
     
@@ -179,7 +213,7 @@ class OTPGenerateResponse:
     otp: Optional[str] = None
     error: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class OTPVerifyRequest:
     """Request model for verifying OTP codes.
     
@@ -201,7 +235,7 @@ class OTPVerifyRequest:
         if not self.userid:
             raise ValueError("userid cannot be empty")
 
-@dataclass
+@dataclass(**_SLOTS)
 class OTPVerifyResponse:
     """Response model for OTP verification.
     
@@ -214,7 +248,7 @@ class OTPVerifyResponse:
     is_valid_otp: bool
     error: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class BulkSMSRequest:
     """Request model for sending bulk SMS messages via Textbelt API.
     
@@ -222,12 +256,25 @@ class BulkSMSRequest:
         phones: List of phone numbers in E.164 format (e.g., ['+1234567890', '+1987654321'])
         message: Single message to send to all recipients, or None if using individual_messages
         individual_messages: Dict mapping phone numbers to their specific messages, or None if using message
+        template: MessageTemplate rendered for each recipient as it is sent, as an
+            alternative to message and individual_messages
+        variables: Dict mapping phone numbers to the template variables for that
+            recipient. Required for every phone if the template has placeholders.
         key: Your Textbelt API key
         sender: Optional sender name for compliance purposes
         reply_webhook_url: Optional URL to receive reply webhooks
         webhook_data: Optional custom data to include in webhooks
         batch_size: Maximum number of messages to send concurrently (default: 100)
         delay_between_messages: Optional delay in seconds between messages (default: 0.1)
+        drop_invalid: Remove phone numbers that are not valid E.164 instead of
+            raising (default: False). The removed entries are listed in
+            ``validation_report``.
+        validation_report: Report of every invalid phone number found, set
+            during initialization
+        deduplicate: Strip surrounding whitespace from phone numbers and send to
+            each number only once (default: True)
+        duplicates_removed: Number of duplicate phone numbers removed, set during
+            initialization
     """
     phones: list[str]
     message: Optional[str] = None
@@ -238,6 +285,14 @@ class BulkSMSRequest:
     webhook_data: Optional[str] = None
     batch_size: int = 100
     delay_between_messages: float = 0.1
+    drop_invalid: bool = False
+    validation_report: Optional[PhoneValidationReport] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    deduplicate: bool = True
+    duplicates_removed: int = field(default=0, init=False, compare=False)
+    template: Optional[MessageTemplate] = None
+    variables: Optional[dict[str, Mapping[str, Any]]] = None
 
     # Constants for validation
     MAX_BATCH_SIZE: ClassVar[int] = 1000
@@ -249,17 +304,45 @@ class BulkSMSRequest:
         if not self.phones:
             raise ValueError("At least one phone number must be provided")
         
-        for phone in self.phones:
-            if not SMSRequest.PHONE_REGEX.match(phone):
+        if self.deduplicate:
+            # Normalize before validating so indices in the report match the input
+            self.phones = [
+                phone.strip() if isinstance(phone, str) else phone for phone in self.phones
+            ]
+        
+        self.validation_report = validate_phones(self.phones)
+        if not self.validation_report.valid:
+            if not self.drop_invalid:
                 raise ValueError(
-                    f"Phone number {phone} must be in E.164 format (e.g., +1234567890)"
+                    f"{self.validation_report.invalid_count} phone number(s) must be in "
+                    f"E.164 format (e.g., +1234567890): "
+                    f"{self.validation_report.summary(self.phones)}"
                 )
+            self.phones = self.validation_report.valid_phones(self.phones)
+            if not self.phones:
+                raise ValueError("No valid phone numbers provided")
+        
+        if self.deduplicate:
+            self.phones, self.duplicates_removed = deduplicate_phones(self.phones)
+            self.individual_messages = self._strip_keys(self.individual_messages)
+            self.variables = self._strip_keys(self.variables)
         
         # Validate message configuration
-        if self.message is None and self.individual_messages is None:
-            raise ValueError("Either message or individual_messages must be provided")
-        if self.message is not None and self.individual_messages is not None:
-            raise ValueError("Cannot provide both message and individual_messages")
+        sources = [self.message, self.individual_messages, self.template]
+        if all(source is None for source in sources):
+            raise ValueError("Either message, individual_messages or template must be provided")
+        if sum(source is not None for source in sources) > 1:
+            raise ValueError("Provide only one of message, individual_messages and template")
+        if self.variables is not None and self.template is None:
+            raise ValueError("variables can only be used with a template")
+        
+        # Every recipient needs variables if the template has placeholders;
+        # rendered messages are length-checked as they are sent
+        if self.template is not None and self.template.placeholders:
+            variables = self.variables or {}
+            missing_phones = [phone for phone in self.phones if phone not in variables]
+            if missing_phones:
+                raise ValueError(f"Missing template variables for phones: {set(missing_phones)}")
         
         # If using individual messages, validate all phones have messages
         if self.individual_messages is not None:
@@ -295,7 +378,29 @@ class BulkSMSRequest:
         if self.delay_between_messages < self.MIN_DELAY:
             raise ValueError(f"Delay between messages must be at least {self.MIN_DELAY} seconds")
 
-@dataclass
+    @staticmethod
+    def _strip_keys(mapping: Optional[dict]) -> Optional[dict]:
+        """Strip whitespace from phone-number keys, keeping the first of any duplicates"""
+        if mapping is None or all(phone == phone.strip() for phone in mapping):
+            return mapping
+        stripped = {}
+        for phone, value in mapping.items():
+            stripped.setdefault(phone.strip(), value)
+        return stripped
+
+    def message_for(self, phone: str) -> str:
+        """Return the message to send to ``phone``.
+
+        Template messages are rendered here, so a ValueError is raised if the
+        rendered message is invalid.
+        """
+        if self.message is not None:
+            return self.message
+        if self.template is not None:
+            return self.template.render(self.variables.get(phone) if self.variables else None)
+        return self.individual_messages[phone]
+
+@dataclass(**_SLOTS)
 class BulkSMSResponse:
     """Response model for bulk SMS sending operations.
     
@@ -303,14 +408,21 @@ class BulkSMSResponse:
         total_messages: Total number of messages in the batch
         successful_messages: Number of successfully sent messages
         failed_messages: Number of failed messages
-        results: Dictionary mapping phone numbers to their individual SMSResponse objects
-        errors: Dictionary mapping phone numbers to their error messages (if any)
+        results: Mapping of phone numbers to their individual SMSResponse objects
+        errors: Mapping of phone numbers to their error messages (if any)
+        duplicates_removed: Number of duplicate phone numbers that were not sent
+            to (see BulkSMSRequest.deduplicate)
+
+    The clients fill ``results`` and ``errors`` with read-only views over a
+    compact BulkResultTable; plain dicts are accepted as well. The views are
+    not dicts: use their ``to_dict()`` to get one, e.g. for ``json.dumps``.
     """
     total_messages: int
     successful_messages: int
     failed_messages: int
-    results: dict[str, SMSResponse]
-    errors: dict[str, str]
+    results: Mapping[str, SMSResponse]
+    errors: Mapping[str, str]
+    duplicates_removed: int = 0
 
     @property
     def success(self) -> bool:
@@ -321,3 +433,37 @@ class BulkSMSResponse:
     def partial_success(self) -> bool:
         """Return True if some messages were sent successfully."""
         return self.successful_messages > 0 and self.failed_messages > 0
+
+@dataclass(**_SLOTS)
+class BulkSMSResult:
+    """Outcome of sending one message from a streaming bulk send.
+    
+    Attributes:
+        phone: The recipient phone number
+        response: The SMSResponse if the message was accepted by the API
+        error: Error message if the message could not be sent
+    """
+    phone: str
+    response: Optional[SMSResponse] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """Return True if the message was sent successfully."""
+        return self.response is not None and self.response.success
+
+@dataclass(**_SLOTS)
+class BulkStatusResponse:
+    """Response model for batched delivery-status lookups.
+    
+    Attributes:
+        statuses: Dictionary mapping text IDs to their StatusResponse
+        errors: Dictionary mapping text IDs to the error that prevented the lookup
+    """
+    statuses: dict[str, StatusResponse]
+    errors: dict[str, str]
+
+    @property
+    def success(self) -> bool:
+        """Return True if every lookup succeeded."""
+        return not self.errors
@@ -0,0 +1,166 @@
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+import time
+from typing import Iterator, List, Optional
+
+# The reservation held by the send running in the current thread or task
+_held: ContextVar[Optional[List]] = ContextVar("textbelt_quota_held", default=None)
+
+class QuotaTracker:
+    """Live count of the remaining quota, kept current from API responses.
+
+    Every send and quota check reports ``quotaRemaining``, so the clients feed
+    each value in here and the remaining quota can be read without a network
+    call. Bulk sends that respect the quota hold a reservation for each message
+    while it is sent. The reservation is settled by the update that message's
+    response makes, so concurrent workers can neither overshoot what is left nor
+    count a message twice.
+
+    Responses can arrive out of order, so a reported value may already include
+    messages whose reservations are still held, and ``available`` may read 0
+    while quota is left. Before treating the quota as used up, wait for the
+    sends in flight to settle with ``wait_available`` or ``await_available``.
+
+    The tracker is guarded by a lock that is never held across I/O, so it is safe
+    to share between threads and asyncio tasks.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Notified whenever the remaining quota or the reservations change
+        self._changed = threading.Condition(self._lock)
+        self._waiters: List[asyncio.Future] = []
+        self._remaining: Optional[int] = None
+        self._reserved = 0
+        self._updated_at: Optional[float] = None
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Last reported quota, or None if no response has been seen yet"""
+        return self._remaining
+
+    @property
+    def available(self) -> Optional[int]:
+        """Remaining quota not yet reserved by in-flight sends, or None if unknown"""
+        with self._lock:
+            return self._available()
+
+    def _available(self) -> Optional[int]:
+        if self._remaining is None:
+            return None
+        return max(self._remaining - self._reserved, 0)
+
+    def _exhausted(self) -> bool:
+        """True while no quota is available but sends in flight may still free some"""
+        return self._available() == 0 and self._reserved > 0
+
+    def _notify(self) -> None:
+        self._changed.notify_all()
+        waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            future.get_loop().call_soon_threadsafe(_wake, future)
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        """Clock time of the last update, or None if never updated"""
+        return self._updated_at
+
+    def fresh(self, max_age: float) -> Optional[int]:
+        """Return the remaining quota if it was reported within ``max_age`` seconds."""
+        with self._lock:
+            if self._updated_at is None or self._clock() - self._updated_at > max_age:
+                return None
+            return self._remaining
+
+    def update(self, remaining: int) -> None:
+        """Record a quota value reported by the API.
+
+        If the current thread or task holds a reservation, the reported value
+        already accounts for its message, so the reservation is settled too.
+
+        While reservations are outstanding, concurrent responses can arrive out of
+        order. Quota only goes down while sending, so a value higher than the one
+        already recorded is a stale response and is ignored.
+        """
+        held = _held.get()
+        with self._lock:
+            if self._reserved and self._remaining is not None:
+                remaining = min(self._remaining, remaining)
+            self._remaining = remaining
+            self._updated_at = self._clock()
+            if held is not None and held[0] is self:
+                held[0] = None
+                self._reserved = max(self._reserved - 1, 0)
+            self._notify()
+
+    def reserve(self, count: int = 1) -> bool:
+        """Reserve quota for ``count`` messages about to be sent.
+
+        Returns:
+            False if the known remaining quota can't cover them. If the quota is
+            still unknown the reservation always succeeds.
+        """
+        with self._lock:
+            if self._remaining is not None and self._remaining - self._reserved < count:
+                return False
+            self._reserved += count
+            return True
+
+    def release(self, count: int = 1) -> None:
+        """Settle ``count`` reservations once their sends have completed."""
+        with self._lock:
+            self._reserved = max(self._reserved - count, 0)
+            self._notify()
+
+    def wait_available(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Return the available quota, first letting sends in flight settle if it is 0.
+
+        Blocks while nothing is available and reservations are outstanding, since
+        their responses may show quota to spare.
+
+        Returns:
+            The available quota, or None if unknown. 0 means the quota is used up,
+            unless ``timeout`` expired first.
+        """
+        with self._lock:
+            self._changed.wait_for(lambda: not self._exhausted(), timeout)
+            return self._available()
+
+    async def await_available(self) -> Optional[int]:
+        """Like ``wait_available``, but waits without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if not self._exhausted():
+                    return self._available()
+                future = loop.create_future()
+                self._waiters.append(future)
+            await future
+
+    @contextmanager
+    def hold(self) -> Iterator[bool]:
+        """Reserve quota for one message for the duration of its send.
+
+        Yields:
+            False if the quota is used up and the message should not be sent.
+            Otherwise yields True, and the reservation is settled by the next
+            update made in this thread or task, or when the block exits.
+        """
+        if not self.reserve():
+            yield False
+            return
+        held = [self]
+        token = _held.set(held)
+        try:
+            yield True
+        finally:
+            _held.reset(token)
+            if held[0] is not None:
+                self.release()
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
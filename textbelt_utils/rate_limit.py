@@ -0,0 +1,108 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+class TokenBucket:
+    """Token-bucket limiter that allows ``rate`` requests per second with bursts.
+
+    Tokens are reserved rather than polled: a caller that finds the bucket empty
+    takes a token on credit and is told how long to wait for it. This keeps the
+    bucket fair across threads and tasks and lets the same object pace both the
+    sync and async clients.
+
+    Attributes:
+        rate: Sustained number of requests allowed per second
+        burst: Maximum number of requests that may be made back to back
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = float(rate)
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait asynchronously until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class RateLimiter:
+    """Requests-per-second budget shared by the sync and async clients.
+
+    A global bucket limits every request made through a client, and optional
+    per-endpoint buckets add tighter limits for individual endpoints. Endpoint
+    names are the API paths without arguments: ``"text"``, ``"status"``,
+    ``"quota"``, ``"otp/generate"`` and ``"otp/verify"``.
+
+    Example:
+        limiter = RateLimiter(rate=10, burst=20, endpoint_limits={
+            "status": TokenBucket(rate=2),
+        })
+        client = TextbeltClient(api_key="...", rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        endpoint_limits: Optional[Dict[str, TokenBucket]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._global = TokenBucket(rate, burst, clock=clock) if rate is not None else None
+        self._endpoints = dict(endpoint_limits or {})
+
+    def reserve(self, endpoint: Optional[str] = None) -> float:
+        """Reserve a request slot and return how many seconds to wait for it."""
+        wait = 0.0
+        if self._global is not None:
+            wait = self._global.reserve()
+        bucket = self._endpoints.get(endpoint) if endpoint is not None else None
+        if bucket is not None:
+            wait = max(wait, bucket.reserve())
+        return wait
+
+    def acquire(self, endpoint: Optional[str] = None) -> None:
+        """Block until a request to ``endpoint`` is allowed."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, endpoint: Optional[str] = None) -> None:
+        """Wait asynchronously until a request to ``endpoint`` is allowed."""
+        wait = self.reserve(endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
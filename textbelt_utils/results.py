@@ -0,0 +1,230 @@
+from array import array
+from collections.abc import ItemsView, Mapping, ValuesView
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import SMSResponse
+
+# Values of the per-row status column
+_FAILED = 0      # the API answered with success=False
+_SUCCEEDED = 1   # the API answered with success=True
+_ERROR = 2       # no response; the row only carries an error message
+
+_NO_TEXT_ID = -1
+_OTHER_TEXT_ID = -2  # text id that doesn't fit the column, kept in an overflow dict
+_MAX_TEXT_ID = 2 ** 63 - 1
+
+TextId = Union[str, int]
+
+class BulkResultTable:
+    """Compact, columnar storage for the outcomes of a bulk send.
+
+    Each recipient is one row spread across parallel arrays: phone, status,
+    quota remaining, text id and an interned error code. Numeric text ids are
+    stored as integers and repeated error messages are stored once, so a
+    million rows take a few tens of MB instead of a dataclass and dict entry
+    per recipient. ``results`` and ``errors`` expose the rows as read-only
+    mappings shaped like the dicts BulkSMSResponse has always carried;
+    SMSResponse objects are only built when a row is accessed. The views are
+    not dicts, so call ``to_dict()`` on one before passing it to ``json.dumps``
+    or anything else that requires a real dict.
+
+    If a phone appears in more than one row (a send with ``deduplicate=False``),
+    the views behave like the dicts did: each phone is listed once, in order of
+    its first row, with the value of its latest row. That needs a phone index,
+    so pass ``unique_phones=True`` when every phone is known to appear at most
+    once per view; iteration and ``len`` then run straight off the rows.
+    ``response_count`` and ``error_count`` always count rows.
+    """
+
+    def __init__(self, unique_phones: bool = False):
+        self.unique_phones = unique_phones
+        self._phones: List[str] = []
+        self._status = bytearray()
+        self._quota = array("q")
+        self._text_ids = array("q")
+        self._other_text_ids: Dict[int, TextId] = {}
+        # Created on the first integer text id: 1 where the API sent an int rather
+        # than a string of digits, so each row returns the type it was given
+        self._int_text_ids: Optional[bytearray] = None
+        self._error_codes = array("I")  # 0 means no error, otherwise index + 1
+        self._error_messages: List[str] = []
+        self._error_lookup: Dict[str, int] = {}
+        self.successful_count = 0
+        self.response_count = 0
+        self.error_count = 0
+        self.results = _ResultsView(self)
+        self.errors = _ErrorsView(self)
+
+    def __len__(self) -> int:
+        return len(self._phones)
+
+    def _intern_error(self, error: Optional[str]) -> int:
+        if error is None:
+            return 0
+        code = self._error_lookup.get(error)
+        if code is None:
+            self._error_messages.append(error)
+            code = self._error_lookup[error] = len(self._error_messages)
+        return code
+
+    def add_response(self, phone: str, response: SMSResponse) -> None:
+        """Append a row for a message the API answered."""
+        row = len(self._phones)
+        self._phones.append(phone)
+        self._status.append(_SUCCEEDED if response.success else _FAILED)
+        self._quota.append(response.quota_remaining)
+        text_id = response.text_id
+        is_int = False
+        if text_id is None:
+            self._text_ids.append(_NO_TEXT_ID)
+        elif type(text_id) is int and 0 <= text_id <= _MAX_TEXT_ID:
+            self._text_ids.append(text_id)
+            is_int = True
+        elif (
+            isinstance(text_id, str) and text_id.isascii() and text_id.isdigit()
+            and (text_id == "0" or text_id[0] != "0") and len(text_id) < 19
+        ):
+            self._text_ids.append(int(text_id))
+        else:
+            self._text_ids.append(_OTHER_TEXT_ID)
+            self._other_text_ids[row] = text_id
+        if is_int and self._int_text_ids is None:
+            self._int_text_ids = bytearray(row)
+        if self._int_text_ids is not None:
+            self._int_text_ids.append(is_int)
+        self._error_codes.append(self._intern_error(response.error))
+        self.response_count += 1
+        if response.success:
+            self.successful_count += 1
+        self.results._invalidate()
+
+    def add_error(self, phone: str, error: str) -> None:
+        """Append a row for a message that could not be sent."""
+        self._phones.append(phone)
+        self._status.append(_ERROR)
+        self._quota.append(-1)
+        self._text_ids.append(_NO_TEXT_ID)
+        if self._int_text_ids is not None:
+            self._int_text_ids.append(False)
+        self._error_codes.append(self._intern_error(error))
+        self.error_count += 1
+        self.errors._invalidate()
+
+    def _response_at(self, row: int) -> SMSResponse:
+        text_id = self._text_ids[row]
+        if text_id == _NO_TEXT_ID:
+            text_id = None
+        elif text_id == _OTHER_TEXT_ID:
+            text_id = self._other_text_ids[row]
+        elif self._int_text_ids is None or not self._int_text_ids[row]:
+            text_id = str(text_id)
+        code = self._error_codes[row]
+        return SMSResponse(
+            success=self._status[row] == _SUCCEEDED,
+            quota_remaining=self._quota[row],
+            text_id=text_id,
+            error=self._error_messages[code - 1] if code else None,
+        )
+
+    def _error_at(self, row: int) -> str:
+        return self._error_messages[self._error_codes[row] - 1]
+
+class _RowView(Mapping):
+    """Read-only mapping over the rows of one kind, indexed by phone on demand.
+
+    Unless the table's phones are unique, every access goes through the phone
+    index so duplicate phones are collapsed consistently. The index is rebuilt
+    only after rows are added.
+    """
+
+    def __init__(self, table: BulkResultTable):
+        self._table = table
+        self._index: Optional[Dict[str, int]] = None
+
+    def _invalidate(self) -> None:
+        self._index = None
+
+    def _matches(self, status: int) -> bool:
+        raise NotImplementedError
+
+    def _value(self, row: int):
+        raise NotImplementedError
+
+    def _rows(self) -> Iterator[int]:
+        status = self._table._status
+        return (row for row in range(len(status)) if self._matches(status[row]))
+
+    def _lookup(self) -> Dict[str, int]:
+        if self._index is None:
+            phones = self._table._phones
+            self._index = {phones[row]: row for row in self._rows()}
+        return self._index
+
+    def __getitem__(self, phone: str):
+        return self._value(self._lookup()[phone])
+
+    def __contains__(self, phone) -> bool:
+        return phone in self._lookup()
+
+    def _count(self) -> int:
+        raise NotImplementedError
+
+    def _pairs(self) -> Iterable[Tuple[str, int]]:
+        """(phone, row) for each phone in the view, collapsing duplicate phones"""
+        if self._table.unique_phones:
+            phones = self._table._phones
+            return ((phones[row], row) for row in self._rows())
+        return self._lookup().items()
+
+    def __iter__(self) -> Iterator[str]:
+        return (phone for phone, _ in self._pairs())
+
+    def __len__(self) -> int:
+        if self._table.unique_phones:
+            return self._count()
+        return len(self._lookup())
+
+    def items(self) -> "_ItemsView":
+        return _ItemsView(self)
+
+    def values(self) -> "_ValuesView":
+        return _ValuesView(self)
+
+    def to_dict(self) -> dict:
+        """Return the view's contents as a plain dict, e.g. for ``json.dumps``."""
+        return {phone: self._value(row) for phone, row in self._pairs()}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+class _ItemsView(ItemsView):
+    """items() of a _RowView, iterating the rows without a lookup per phone"""
+
+    def __iter__(self):
+        view = self._mapping
+        return ((phone, view._value(row)) for phone, row in view._pairs())
+
+class _ValuesView(ValuesView):
+    def __iter__(self):
+        view = self._mapping
+        return (view._value(row) for _, row in view._pairs())
+
+class _ResultsView(_RowView):
+    def _matches(self, status: int) -> bool:
+        return status != _ERROR
+
+    def _value(self, row: int) -> SMSResponse:
+        return self._table._response_at(row)
+
+    def _count(self) -> int:
+        return self._table.response_count
+
+class _ErrorsView(_RowView):
+    def _matches(self, status: int) -> bool:
+        return status == _ERROR
+
+    def _value(self, row: int) -> str:
+        return self._table._error_at(row)
+
+    def _count(self) -> int:
+        return self._table.error_count
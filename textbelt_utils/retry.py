@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+import random
+from typing import Optional, Tuple, Type, FrozenSet
+
+@dataclass
+class RetryPolicy:
+    """Retry policy for transient API failures.
+
+    Requests that come back with a retryable status code (rate limiting and
+    server errors by default) or fail with a transport error are retried with
+    exponential backoff. When the API tells us how long to wait via
+    ``retryAfter`` or a ``Retry-After`` header, that value is used instead, up
+    to ``backoff_max``.
+
+    Sending a message or an OTP is not idempotent, so for those POST requests
+    transport errors are only retried when the request can't have reached the
+    server (the connection could not be established). A read timeout on a send
+    is never retried, since the message may already have gone out.
+
+    Attributes:
+        max_attempts: Total number of attempts per request, including the first
+        backoff_base: Delay in seconds before the first retry
+        backoff_max: Upper bound in seconds for any delay, including one requested
+            by the server
+        jitter: Whether to randomize delays ("full jitter") to spread out retries
+        retry_on_status: HTTP status codes that should be retried
+        retry_on_transport_errors: Whether to retry connection and timeout errors
+            raised by the underlying HTTP library (see above for POST requests)
+        retry_on_exceptions: Additional exception classes that should be retried
+        respect_retry_after: Whether to wait the server-provided retry delay
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_on_status: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_on_transport_errors: bool = True
+    retry_on_exceptions: Tuple[Type[BaseException], ...] = ()
+    respect_retry_after: bool = True
+
+    def __post_init__(self):
+        """Validate the policy after initialization."""
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff_base < 0 or self.backoff_max < 0:
+            raise ValueError("Backoff delays cannot be negative")
+
+    def should_retry_status(self, status_code: int, attempt: int) -> bool:
+        """Return True if a response with this status should be retried."""
+        return attempt < self.max_attempts and status_code in self.retry_on_status
+
+    def should_retry_exception(
+        self,
+        exc: BaseException,
+        attempt: int,
+        transport_errors: Tuple[Type[BaseException], ...] = (),
+    ) -> bool:
+        """Return True if a request that raised ``exc`` should be retried."""
+        if attempt >= self.max_attempts:
+            return False
+        retryable = self.retry_on_exceptions
+        if self.retry_on_transport_errors:
+            retryable = retryable + transport_errors
+        return bool(retryable) and isinstance(exc, retryable)
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return the delay in seconds before retrying after ``attempt`` failed."""
+        if retry_after is not None and self.respect_retry_after:
+            return min(self.backoff_max, max(0.0, retry_after))
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+def parse_retry_after(data: Optional[dict], headers) -> Optional[float]:
+    """Extract the server-provided retry delay from a response body or headers."""
+    value = None
+    if isinstance(data, dict):
+        value = data.get("retryAfter")
+    if value is None and headers is not None:
+        try:
+            value = headers.get("Retry-After")
+        except AttributeError:
+            value = None
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,152 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Literal, Optional
+
+from .models import BulkSMSRequest
+
+# GSM 03.38 default alphabet (the escape character itself is excluded)
+GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+# Extension table characters, each sent as an escape plus one septet
+GSM7_EXTENSION = frozenset("\f^{}\\[~]|€")
+GSM7_CHARACTERS = GSM7_BASIC | GSM7_EXTENSION
+
+# Capacity of a single message and of each part of a concatenated message
+GSM7_SINGLE, GSM7_PART = 160, 153
+UCS2_SINGLE, UCS2_PART = 70, 67
+
+EncodingType = Literal["GSM-7", "UCS-2"]
+
+@dataclass(frozen=True)
+class SegmentInfo:
+    """How a message will be encoded and split by carriers.
+
+    Attributes:
+        encoding: GSM-7 if every character is in the GSM alphabet, otherwise UCS-2
+        segments: Number of SMS segments the message is sent as
+        units: Message length in encoding units (septets for GSM-7, UTF-16 code
+            units for UCS-2)
+    """
+    encoding: EncodingType
+    segments: int
+    units: int
+
+@dataclass
+class SegmentEstimate:
+    """Pre-flight segment count for a bulk send.
+
+    Attributes:
+        messages: Number of messages that would be sent
+        total_segments: Total segments across all messages
+        max_segments: Segments used by the longest message
+        ucs2_messages: Number of messages that need UCS-2 encoding
+        unrenderable: Number of template messages that failed to render
+        estimated_cost: total_segments times the cost per segment, if given
+    """
+    messages: int = 0
+    total_segments: int = 0
+    max_segments: int = 0
+    ucs2_messages: int = 0
+    unrenderable: int = 0
+    estimated_cost: Optional[float] = None
+
+def _pack(sizes, single: int, part: int) -> int:
+    """Count segments when characters of ``sizes`` units can't be split across parts"""
+    total = sum(sizes)
+    if total <= single:
+        return 1
+    segments, used = 1, 0
+    for size in sizes:
+        if used + size > part:
+            segments += 1
+            used = 0
+        used += size
+    return segments
+
+@lru_cache(maxsize=4096)
+def count_segments(message: str) -> SegmentInfo:
+    """Work out the encoding and number of segments for ``message``.
+
+    Messages made only of GSM-7 characters use 160 septets in a single segment
+    or 153 per part when concatenated; extension characters such as ``€`` or
+    ``{`` take two septets. Anything else forces UCS-2 at 70 code units, or 67
+    per part, with emoji and other astral characters taking two. Escape
+    sequences and surrogate pairs are never split across parts.
+
+    Args:
+        message: The message text
+
+    Returns:
+        A SegmentInfo describing the encoding and segment count
+    """
+    if GSM7_CHARACTERS.issuperset(message):
+        extended = 0 if GSM7_BASIC.issuperset(message) else sum(
+            1 for char in message if char in GSM7_EXTENSION
+        )
+        units = len(message) + extended
+        if units <= GSM7_SINGLE:
+            segments = 1
+        elif not extended:
+            segments = -(-units // GSM7_PART)
+        else:
+            segments = _pack(
+                [2 if char in GSM7_EXTENSION else 1 for char in message],
+                GSM7_SINGLE,
+                GSM7_PART,
+            )
+        return SegmentInfo("GSM-7", segments, units)
+
+    units = len(message.encode("utf-16-le")) // 2
+    if units <= UCS2_SINGLE:
+        segments = 1
+    elif units == len(message):
+        segments = -(-units // UCS2_PART)
+    else:
+        segments = _pack(
+            [2 if ord(char) > 0xFFFF else 1 for char in message],
+            UCS2_SINGLE,
+            UCS2_PART,
+        )
+    return SegmentInfo("UCS-2", segments, units)
+
+def estimate_segments(
+    request: BulkSMSRequest,
+    cost_per_segment: Optional[float] = None,
+) -> SegmentEstimate:
+    """Estimate the segments a bulk send will use, in one pass over its messages.
+
+    A shared message is measured once. Individual and template messages are
+    measured per recipient, rendering templates the same way the send would.
+
+    Args:
+        request: The bulk request to estimate
+        cost_per_segment: Optional price of one segment, used for estimated_cost
+
+    Returns:
+        A SegmentEstimate for the whole request
+    """
+    estimate = SegmentEstimate()
+
+    def add(info: SegmentInfo, count: int = 1) -> None:
+        estimate.messages += count
+        estimate.total_segments += info.segments * count
+        estimate.max_segments = max(estimate.max_segments, info.segments)
+        if info.encoding == "UCS-2":
+            estimate.ucs2_messages += count
+
+    if request.message is not None:
+        add(count_segments(request.message), len(request.phones))
+    else:
+        for phone in request.phones:
+            try:
+                message = request.message_for(phone)
+            except ValueError:
+                estimate.unrenderable += 1
+                continue
+            add(count_segments(message))
+
+    if cost_per_segment is not None:
+        estimate.estimated_cost = estimate.total_segments * cost_per_segment
+    return estimate
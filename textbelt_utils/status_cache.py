@@ -0,0 +1,108 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Dict, MutableMapping, Optional, Tuple
+
+from .models import TERMINAL_STATUSES, StatusResponse, StatusType
+
+class StatusCache:
+    """Cache of delivery statuses, consulted by ``check_status`` before the API.
+
+    DELIVERED and FAILED never change, so terminal statuses are kept until
+    evicted: by default in an in-memory LRU of ``maxsize`` entries, or in any
+    ``MutableMapping`` passed as ``store`` (for example a ``shelve`` file, so they
+    survive restarts). Other statuses may still change and are only reused for
+    ``pending_ttl`` seconds.
+
+    The cache is guarded by a lock that is never held across I/O, so one
+    instance can be shared between clients, threads and asyncio tasks.
+
+    Example:
+        cache = StatusCache(maxsize=100_000, pending_ttl=10)
+        client = TextbeltClient(api_key="...", status_cache=cache)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        pending_ttl: float = 30.0,
+        store: Optional[MutableMapping[str, str]] = None,
+        clock=time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of terminal statuses kept in memory, and of
+                pending statuses. Ignored for terminal statuses when ``store`` is given.
+            pending_ttl: Seconds a non-terminal status may be reused. Use 0 to only
+                cache terminal statuses.
+            store: Optional mapping of text ID to status used for terminal statuses
+                instead of the in-memory LRU. It is not bounded by ``maxsize``.
+            clock: Monotonic clock, injectable for testing
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if pending_ttl < 0:
+            raise ValueError("pending_ttl cannot be negative")
+
+        self.maxsize = maxsize
+        self.pending_ttl = pending_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lru = store is None
+        self._terminal: MutableMapping[str, str] = OrderedDict() if store is None else store
+        # Insertion-ordered, so the oldest entry is evicted first
+        self._pending: Dict[str, Tuple[StatusType, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._terminal) + len(self._pending)
+
+    def get(self, text_id: str) -> Optional[StatusResponse]:
+        """Return the cached status for ``text_id``, or None if it must be fetched."""
+        with self._lock:
+            status = self._terminal.get(text_id)
+            if status is not None:
+                if self._lru:
+                    self._terminal.move_to_end(text_id)
+                self.hits += 1
+                return StatusResponse(status=status)
+
+            entry = self._pending.get(text_id)
+            if entry is not None:
+                if self._clock() < entry[1]:
+                    self.hits += 1
+                    return StatusResponse(status=entry[0])
+                del self._pending[text_id]
+            self.misses += 1
+            return None
+
+    def put(self, text_id: str, response: StatusResponse) -> None:
+        """Record a status returned by the API."""
+        status = response.status
+        with self._lock:
+            if status in TERMINAL_STATUSES:
+                self._pending.pop(text_id, None)
+                self._terminal[text_id] = status
+                if self._lru:
+                    self._terminal.move_to_end(text_id)
+                    if len(self._terminal) > self.maxsize:
+                        self._terminal.popitem(last=False)
+            elif self.pending_ttl > 0:
+                self._pending.pop(text_id, None)
+                self._pending[text_id] = (status, self._clock() + self.pending_ttl)
+                if len(self._pending) > self.maxsize:
+                    del self._pending[next(iter(self._pending))]
+
+    def invalidate(self, text_id: str) -> None:
+        """Forget any cached status for ``text_id``."""
+        with self._lock:
+            self._pending.pop(text_id, None)
+            self._terminal.pop(text_id, None)
+
+    def clear(self) -> None:
+        """Forget every cached status, including those in a custom store."""
+        with self._lock:
+            self._pending.clear()
+            self._terminal.clear()
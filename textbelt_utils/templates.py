@@ -0,0 +1,109 @@
+from string import Template
+from typing import Any, FrozenSet, List, Mapping, Optional
+
+class MessageTemplate:
+    """A message with ``$name`` / ``${name}`` placeholders, parsed once.
+
+    The source is split into literal and placeholder segments when the template
+    is created, so rendering a message for each recipient is a single join. Use
+    ``$$`` for a literal dollar sign.
+
+    Example:
+        template = MessageTemplate("Hi $first_name, your code is ${code}.")
+        template.render({"first_name": "Ada", "code": 1234})
+
+    Attributes:
+        source: The template text
+        placeholders: Names of the variables the template uses
+    """
+
+    def __init__(self, source: str, max_length: Optional[int] = None):
+        """Parse ``source`` into segments.
+
+        Args:
+            source: Template text using string.Template placeholder syntax
+            max_length: Maximum length of a rendered message (default:
+                SMSRequest.MAX_MESSAGE_LENGTH)
+
+        Raises:
+            ValueError: If the template is empty or has a malformed placeholder
+        """
+        if max_length is None:
+            from .models import SMSRequest
+            max_length = SMSRequest.MAX_MESSAGE_LENGTH
+        if not source:
+            raise ValueError("Template cannot be empty")
+
+        self.source = source
+        self.max_length = max_length
+        # Literals and placeholder names alternate, starting and ending with a literal
+        self._literals: List[str] = []
+        self._names: List[str] = []
+
+        literal: List[str] = []
+        position = 0
+        for match in Template.pattern.finditer(source):
+            literal.append(source[position:match.start()])
+            position = match.end()
+            if match.group("escaped") is not None:
+                literal.append("$")
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(f"Invalid placeholder at position {match.start()} in template")
+            self._literals.append("".join(literal))
+            self._names.append(name)
+            literal = []
+        literal.append(source[position:])
+        self._literals.append("".join(literal))
+
+        self.placeholders: FrozenSet[str] = frozenset(self._names)
+        if sum(len(text) for text in self._literals) > max_length:
+            raise ValueError(f"Template exceeds maximum length of {max_length}")
+
+    def __repr__(self) -> str:
+        return f"MessageTemplate({self.source!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MessageTemplate):
+            return NotImplemented
+        return self.source == other.source and self.max_length == other.max_length
+
+    def __hash__(self) -> int:
+        return hash((self.source, self.max_length))
+
+    def render(self, variables: Optional[Mapping[str, Any]] = None) -> str:
+        """Render the message for one recipient.
+
+        Args:
+            variables: Values for the template's placeholders
+
+        Returns:
+            The rendered message
+
+        Raises:
+            ValueError: If a variable is missing or the rendered message is empty
+                or too long
+        """
+        literals = self._literals
+        if not self._names:
+            message = literals[0]
+        else:
+            if variables is None:
+                variables = {}
+            parts = [literals[0]]
+            try:
+                for i, name in enumerate(self._names, 1):
+                    parts.append(str(variables[name]))
+                    parts.append(literals[i])
+            except KeyError as e:
+                raise ValueError(f"Missing template variable {e.args[0]!r}") from None
+            message = "".join(parts)
+
+        if not message:
+            raise ValueError("Message cannot be empty")
+        if len(message) > self.max_length:
+            raise ValueError(
+                f"Rendered message length {len(message)} exceeds maximum of {self.max_length}"
+            )
+        return message
@@ -0,0 +1,209 @@
+import asyncio
+from dataclasses import dataclass
+import heapq
+import itertools
+import time
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .async_client import AsyncTextbeltClient
+from .client import TextbeltClient
+from .models import TERMINAL_STATUSES, BulkStatusResponse, StatusType
+
+@dataclass
+class StatusTransition:
+    """A change in a tracked message's delivery status.
+
+    Attributes:
+        text_id: The message whose status changed
+        previous: The status before this change, or None for the first status seen
+        status: The new status
+        terminal: Whether the new status is final, so the message is no longer tracked
+    """
+    text_id: str
+    previous: Optional[StatusType]
+    status: StatusType
+    terminal: bool
+
+@dataclass
+class _Entry:
+    status: Optional[StatusType]
+    delay: float
+    polls: int = 0
+
+class StatusTracker:
+    """Poll delivery statuses until every tracked message is DELIVERED or FAILED.
+
+    Messages wait in a priority queue keyed by their next poll time, so each
+    round only looks up the messages that are due, concurrently via
+    ``check_status_many``. A message whose status hasn't changed is polled less
+    often (``backoff`` times longer each time, up to ``max_delay``); a change
+    resets its delay. Messages are dropped as soon as they reach a terminal status.
+
+    Works with both TextbeltClient (``poll``/``run``) and AsyncTextbeltClient
+    (``apoll``/``arun``).
+
+    Example:
+        tracker = StatusTracker(client)
+        tracker.track_many(text_ids)
+        for change in tracker.run(timeout=3600):
+            print(change.text_id, change.previous, "->", change.status)
+    """
+
+    def __init__(
+        self,
+        client: Union[TextbeltClient, AsyncTextbeltClient],
+        initial_delay: float = 5.0,
+        backoff: float = 2.0,
+        max_delay: float = 300.0,
+        max_polls: Optional[int] = None,
+        concurrency: int = 10,
+        on_transition: Optional[Callable[[StatusTransition], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            client: Client used to look up statuses
+            initial_delay: Seconds before a message is first polled, and between
+                polls after its status changes
+            backoff: Factor the delay grows by after each poll without a change
+            max_delay: Upper bound for the delay between polls of one message
+            max_polls: Optional number of polls after which a message that is still
+                not terminal is given up on
+            concurrency: Number of status lookups to run at once
+            on_transition: Optional callback invoked with every StatusTransition
+            clock: Monotonic clock, injectable for testing
+        """
+        if initial_delay < 0 or max_delay < initial_delay:
+            raise ValueError("Delays must satisfy 0 <= initial_delay <= max_delay")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+
+        self._client = client
+        self.initial_delay = initial_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.max_polls = max_polls
+        self.concurrency = concurrency
+        self.on_transition = on_transition
+        self._clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._queue: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+        self.abandoned: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, text_id: str) -> bool:
+        return text_id in self._entries
+
+    def track(self, text_id: str, delay: Optional[float] = None) -> None:
+        """Start tracking ``text_id``, first polling it after ``delay`` seconds."""
+        if text_id in self._entries:
+            return
+        self._entries[text_id] = _Entry(status=None, delay=self.initial_delay)
+        self._schedule(text_id, self.initial_delay if delay is None else delay)
+
+    def track_many(self, text_ids: Iterable[str], delay: Optional[float] = None) -> None:
+        """Start tracking every ID in ``text_ids``."""
+        for text_id in text_ids:
+            self.track(text_id, delay)
+
+    def status(self, text_id: str) -> Optional[StatusType]:
+        """Return the last status seen for a tracked message."""
+        entry = self._entries.get(text_id)
+        return entry.status if entry is not None else None
+
+    def next_poll_in(self) -> Optional[float]:
+        """Seconds until the next message is due, or None if nothing is tracked."""
+        if not self._queue:
+            return None
+        return max(self._queue[0][0] - self._clock(), 0.0)
+
+    def _schedule(self, text_id: str, delay: float) -> None:
+        heapq.heappush(self._queue, (self._clock() + delay, next(self._counter), text_id))
+
+    def _due(self) -> List[str]:
+        now = self._clock()
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            due.append(heapq.heappop(self._queue)[2])
+        return due
+
+    def _apply(self, due: List[str], response: BulkStatusResponse) -> List[StatusTransition]:
+        """Update tracked entries from a round of lookups and reschedule them"""
+        transitions = []
+        for text_id in due:
+            entry = self._entries[text_id]
+            entry.polls += 1
+            result = response.statuses.get(text_id)
+            if result is not None and result.status != entry.status:
+                terminal = result.status in TERMINAL_STATUSES
+                transition = StatusTransition(text_id, entry.status, result.status, terminal)
+                transitions.append(transition)
+                entry.status = result.status
+                if terminal:
+                    del self._entries[text_id]
+                    continue
+                entry.delay = self.initial_delay
+            else:
+                # No change, or the lookup failed: poll less often
+                entry.delay = min(entry.delay * self.backoff, self.max_delay)
+
+            if self.max_polls is not None and entry.polls >= self.max_polls:
+                del self._entries[text_id]
+                self.abandoned.append(text_id)
+                continue
+            self._schedule(text_id, entry.delay)
+
+        if self.on_transition is not None:
+            for transition in transitions:
+                self.on_transition(transition)
+        return transitions
+
+    def poll(self) -> List[StatusTransition]:
+        """Look up every message that is due and return the resulting transitions."""
+        due = self._due()
+        if not due:
+            return []
+        return self._apply(due, self._client.check_status_many(due, self.concurrency))
+
+    async def apoll(self) -> List[StatusTransition]:
+        """Async version of poll, for use with AsyncTextbeltClient."""
+        due = self._due()
+        if not due:
+            return []
+        return self._apply(due, await self._client.check_status_many(due, self.concurrency))
+
+    def run(
+        self,
+        timeout: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> Iterator[StatusTransition]:
+        """Poll until nothing is left to track, yielding transitions as they happen.
+
+        Args:
+            timeout: Optional number of seconds after which to stop polling
+            sleep: Function used to wait for the next message to be due
+        """
+        deadline = self._clock() + timeout if timeout is not None else None
+        while self._entries:
+            wait = self.next_poll_in()
+            if deadline is not None and self._clock() + wait > deadline:
+                return
+            if wait > 0:
+                sleep(wait)
+            yield from self.poll()
+
+    async def arun(self, timeout: Optional[float] = None) -> AsyncIterator[StatusTransition]:
+        """Async version of run, for use with AsyncTextbeltClient."""
+        deadline = self._clock() + timeout if timeout is not None else None
+        while self._entries:
+            wait = self.next_poll_in()
+            if deadline is not None and self._clock() + wait > deadline:
+                return
+            if wait > 0:
+                await asyncio.sleep(wait)
+            for transition in await self.apoll():
+                yield transition
@@ -1,6 +1,9 @@
+from functools import lru_cache
 import hmac
 import hashlib
+import re
 import time
+from typing import Iterable, List, Optional
 
 from .exceptions import WebhookVerificationError
 
@@ -65,3 +68,69 @@ def is_valid_e164(phone: str) -> bool:
         return False
         
     return 10 <= len(digits) <= 15
+
+# Punctuation commonly used to format phone numbers
+_FORMATTING = re.compile(r'[\s\-.()/]')
+_E164 = re.compile(r'\+[1-9]\d{1,14}')
+
+@lru_cache(maxsize=65536)
+def normalize_phone(raw: str, default_country_code: str = "1") -> Optional[str]:
+    """
+    Convert a phone number in a common national or international format to E.164
+
+    Spaces, dashes, dots, slashes and parentheses are ignored. Numbers starting
+    with + or the 00 international prefix keep their country code; anything else
+    is treated as a national number in ``default_country_code``, with a leading
+    trunk 0 dropped (or a leading 1 for NANP numbers). Results are memoized in a
+    bounded LRU cache, so repeat contacts are only parsed once.
+
+    Args:
+        raw: Phone number as entered, e.g. "(202) 555-0108" or "+44 20 7946 0958"
+        default_country_code: Country calling code for national numbers (default "1")
+
+    Returns:
+        str: The number in E.164 format, or None if it cannot be normalized
+    """
+    if not isinstance(raw, str):
+        return None
+
+    number = raw.strip()
+    if number.startswith(('+', '00')):
+        # Drop the national trunk prefix written as "+44 (0)20 ..."
+        number = number.replace('(0)', '')
+    number = _FORMATTING.sub('', number)
+    if number.startswith('+'):
+        candidate = number
+    elif number.startswith('00'):
+        candidate = '+' + number[2:]
+    elif not number.isdigit():
+        return None
+    elif default_country_code == "1":
+        # NANP: ten digits, optionally preceded by the 1 trunk prefix
+        if len(number) == 11 and number.startswith('1'):
+            number = number[1:]
+        if len(number) != 10:
+            return None
+        candidate = '+1' + number
+    else:
+        candidate = '+' + default_country_code + number.lstrip('0')
+
+    if not _E164.fullmatch(candidate) or not candidate[1:].isascii():
+        return None
+    return candidate
+
+def normalize_phones(
+    raws: Iterable[str],
+    default_country_code: str = "1"
+) -> List[Optional[str]]:
+    """
+    Normalize many phone numbers to E.164, sharing normalize_phone's cache
+
+    Args:
+        raws: Phone numbers as entered
+        default_country_code: Country calling code for national numbers (default "1")
+
+    Returns:
+        list: The E.164 form of each number, or None where it cannot be normalized
+    """
+    return [normalize_phone(raw, default_country_code) for raw in raws]
@@ -0,0 +1,124 @@
+from dataclasses import dataclass, field
+import re
+from typing import Dict, List, Sequence, Tuple
+
+# Same rule as SMSRequest.PHONE_REGEX. _VALID_RUN consumes a run of valid
+# newline-terminated numbers from a joined buffer in one call.
+_PHONE = re.compile(r'\+[1-9]\d{1,14}')
+_VALID_RUN = re.compile(r'(?:\+[1-9]\d{1,14}\n)*')
+
+@dataclass
+class PhoneValidationReport:
+    """Outcome of validating a list of phone numbers.
+
+    Attributes:
+        total: Number of phone numbers checked
+        invalid: Dict mapping the index of each invalid phone number to the reason
+            it was rejected, in list order
+    """
+    total: int
+    invalid: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def valid(self) -> bool:
+        """Return True if every phone number is valid."""
+        return not self.invalid
+
+    @property
+    def invalid_count(self) -> int:
+        """Number of invalid phone numbers."""
+        return len(self.invalid)
+
+    def valid_phones(self, phones: Sequence[str]) -> List[str]:
+        """Return ``phones`` with the invalid entries removed."""
+        if not self.invalid:
+            return list(phones)
+        invalid = self.invalid
+        return [phone for i, phone in enumerate(phones) if i not in invalid]
+
+    def summary(self, phones: Sequence[str], limit: int = 5) -> str:
+        """Describe the first ``limit`` invalid entries, for error messages."""
+        shown = [
+            f"{phones[i]!r} at index {i} ({reason})"
+            for i, reason in list(self.invalid.items())[:limit]
+        ]
+        more = self.invalid_count - len(shown)
+        if more > 0:
+            shown.append(f"and {more} more")
+        return "; ".join(shown)
+
+def invalid_reason(phone) -> str:
+    """Explain why ``phone`` is not a valid E.164 number."""
+    if not isinstance(phone, str):
+        return f"not a string ({type(phone).__name__})"
+    if not phone:
+        return "empty"
+    if not phone.startswith('+'):
+        return "missing leading +"
+    digits = phone[1:]
+    if not digits.isdigit():
+        return "contains non-digit characters"
+    if digits[0] == '0':
+        return "country code cannot start with 0"
+    if len(digits) < 2:
+        return "too short"
+    if len(digits) > 15:
+        return "too long (max 15 digits)"
+    return "not in E.164 format"
+
+def validate_phones(phones: Sequence[str]) -> PhoneValidationReport:
+    """Validate every phone number against E.164 in a single pass.
+
+    The numbers are joined into one newline-terminated buffer and a single
+    compiled regex consumes each run of valid numbers, so the per-number work
+    happens in the regex engine instead of a Python loop. Only invalid numbers
+    are examined individually, to work out why they were rejected.
+
+    Args:
+        phones: Phone numbers to validate
+
+    Returns:
+        A PhoneValidationReport listing every invalid index and its reason
+    """
+    report = PhoneValidationReport(total=len(phones))
+    try:
+        buffer = "\n".join(phones) + "\n"
+    except TypeError:
+        buffer = None
+    if buffer is None or buffer.count("\n") != len(phones):
+        # Non-string entries or embedded newlines: check each number on its own
+        for i, phone in enumerate(phones):
+            if not isinstance(phone, str) or not _PHONE.fullmatch(phone):
+                report.invalid[i] = invalid_reason(phone)
+        return report
+
+    line, position, end = 0, 0, len(buffer)
+    while True:
+        valid_end = _VALID_RUN.match(buffer, position).end()
+        line += buffer.count("\n", position, valid_end)
+        if valid_end >= end or line >= len(phones):
+            break
+        # The line starting at valid_end is invalid
+        report.invalid[line] = invalid_reason(phones[line])
+        position = buffer.index("\n", valid_end) + 1
+        line += 1
+    return report
+
+def deduplicate_phones(phones: Sequence[str]) -> Tuple[List[str], int]:
+    """Remove duplicate phone numbers, keeping the first occurrence of each.
+
+    Surrounding whitespace is stripped first, as ``utils.is_valid_e164`` does,
+    so " +12025550108" and "+12025550108" count as the same recipient. The pass
+    is a single O(n) walk using a dict as an ordered set.
+
+    Args:
+        phones: Phone numbers, possibly with duplicates
+
+    Returns:
+        A tuple of the unique phone numbers in their original order and the
+        number of duplicates removed
+    """
+    unique = list(dict.fromkeys(
+        phone.strip() if isinstance(phone, str) else phone for phone in phones
+    ))
+    return unique, len(phones) - len(unique)
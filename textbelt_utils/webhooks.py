@@ -0,0 +1,221 @@
+import hashlib
+import hmac
+import json
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .exceptions import WebhookVerificationError
+from .models import WebhookResponse
+
+Data = Union[str, bytes]
+
+_IPAD = bytes(x ^ 0x36 for x in range(256))
+_OPAD = bytes(x ^ 0x5C for x in range(256))
+
+class ReplayGuard:
+    """Remembers webhook signatures so a captured request can't be replayed.
+
+    A webhook is only accepted while its timestamp is within ``max_age``, so a
+    signature only needs to be remembered until then. Signatures are grouped
+    into buckets of ``bucket_seconds`` by their timestamp and a whole bucket is
+    dropped once every timestamp in it is too old to verify. Memory is bounded
+    by the traffic within the window, not by total traffic.
+
+    Updates are serialized by a lock, so one guard can be shared between threads.
+
+    Example:
+        guard = ReplayGuard(max_age=900)
+        verifier = WebhookVerifier("your_api_key", replay_guard=guard)
+    """
+
+    def __init__(self, max_age: int = 900, bucket_seconds: int = 60, clock=time.time):
+        """Initialize the guard.
+
+        Args:
+            max_age: Seconds a signature is remembered past its timestamp. Must be
+                at least the verifier's max_age.
+            bucket_seconds: Width of each eviction bucket; memory may exceed the
+                window by up to one bucket
+            clock: Wall clock returning Unix time, injectable for testing
+        """
+        if bucket_seconds < 1:
+            raise ValueError("bucket_seconds must be at least 1")
+        self.max_age = max_age
+        self.bucket_seconds = bucket_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, Set[Data]] = {}
+        self._horizon = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(seen) for seen in self._buckets.values())
+
+    def accept(self, timestamp: Union[int, Data], signature: Data) -> bool:
+        """Record a verified webhook.
+
+        Args:
+            timestamp: The webhook's timestamp
+            signature: The webhook's signature
+
+        Returns:
+            False if this signature has been seen before, or its timestamp is too
+            old to be remembered; True the first time it is seen
+        """
+        if isinstance(signature, bytes):
+            signature = signature.decode('latin-1')
+        timestamp = int(timestamp)
+        width = self.bucket_seconds
+        oldest = int(self._clock()) - self.max_age
+        if timestamp < oldest:
+            return False
+        key = timestamp // width
+        with self._lock:
+            # Drop buckets whose newest timestamp is now too old
+            horizon = oldest // width
+            if horizon > self._horizon:
+                self._horizon = horizon
+                for expired in [k for k in self._buckets if k < horizon]:
+                    del self._buckets[expired]
+            seen = self._buckets.get(key)
+            if seen is None:
+                self._buckets[key] = {signature}
+                return True
+            if signature in seen:
+                return False
+            seen.add(signature)
+            return True
+
+class WebhookVerifier:
+    """Reusable verifier for Textbelt webhook signatures.
+
+    The HMAC-SHA256 inner and outer hash states are keyed with the API key once,
+    when the verifier is created, and each request works on copies of them.
+    Payloads can be passed as the raw request body bytes, which are hashed
+    without decoding or re-encoding.
+    Use one verifier per API key for the lifetime of the application.
+
+    Example:
+        verifier = WebhookVerifier("your_api_key")
+        verifier.verify(timestamp, signature, request_body)
+    """
+
+    def __init__(
+        self,
+        api_key: Data,
+        max_age: int = 900,
+        clock=time.time,
+        replay_guard: Optional[ReplayGuard] = None,
+    ):
+        """Key the HMAC state.
+
+        Args:
+            api_key: Your Textbelt API key
+            max_age: Maximum age of timestamp in seconds (default 15 minutes)
+            clock: Wall clock returning Unix time, injectable for testing
+            replay_guard: Optional ReplayGuard that rejects a valid webhook whose
+                signature has already been accepted
+
+        Raises:
+            ValueError: If the replay guard forgets signatures sooner than max_age
+        """
+        if replay_guard is not None and replay_guard.max_age < max_age:
+            raise ValueError("replay_guard.max_age must be at least max_age")
+        if isinstance(api_key, str):
+            api_key = api_key.encode('utf-8')
+        # RFC 2104 precomputation: hash the padded key into the inner and outer
+        # states so each request only hashes its own data
+        block_size = hashlib.sha256().block_size
+        if len(api_key) > block_size:
+            api_key = hashlib.sha256(api_key).digest()
+        api_key = api_key.ljust(block_size, b'\0')
+        self._inner = hashlib.sha256(api_key.translate(_IPAD))
+        self._outer = hashlib.sha256(api_key.translate(_OPAD))
+        self.max_age = max_age
+        self._clock = clock
+        self._replay_guard = replay_guard
+
+    def verify(self, timestamp: Data, signature: Data, payload: Data) -> bool:
+        """Verify one webhook request.
+
+        Args:
+            timestamp: X-textbelt-timestamp header value
+            signature: X-textbelt-signature header value
+            payload: Raw request body, ideally as bytes
+
+        Returns:
+            bool: True if the signature matches
+
+        Raises:
+            WebhookVerificationError: If the timestamp is too old, the data is
+                malformed, or the replay guard has already seen this webhook
+        """
+        try:
+            if self._clock() - int(timestamp) > self.max_age:
+                raise WebhookVerificationError("Webhook timestamp too old")
+            if not self._matches(timestamp, signature, payload):
+                return False
+            if self._replay_guard is not None and not self._replay_guard.accept(timestamp, signature):
+                raise WebhookVerificationError("Webhook already received")
+            return True
+        except (ValueError, TypeError) as e:
+            raise WebhookVerificationError(f"Invalid webhook data: {str(e)}")
+
+    def verify_many(self, webhooks: Iterable[Tuple[Data, Data, Data]]) -> List[bool]:
+        """Verify a batch of ``(timestamp, signature, payload)`` webhooks.
+
+        The clock is read once for the whole batch. Unlike ``verify``, a stale,
+        malformed or replayed webhook is reported as False instead of raising, so
+        one bad request doesn't hide the results for the rest.
+
+        Returns:
+            One bool per webhook, in order
+        """
+        oldest = self._clock() - self.max_age
+        matches = self._matches
+        guard = self._replay_guard
+        results = []
+        for timestamp, signature, payload in webhooks:
+            try:
+                results.append(
+                    int(timestamp) >= oldest
+                    and matches(timestamp, signature, payload)
+                    and (guard is None or guard.accept(timestamp, signature))
+                )
+            except (ValueError, TypeError):
+                results.append(False)
+        return results
+
+    def _matches(self, timestamp: Data, signature: Data, payload: Data) -> bool:
+        inner = self._inner.copy()
+        inner.update(timestamp.encode('utf-8') if isinstance(timestamp, str) else timestamp)
+        inner.update(payload.encode('utf-8') if isinstance(payload, str) else payload)
+        mac = self._outer.copy()
+        mac.update(inner.digest())
+        if isinstance(signature, str):
+            return hmac.compare_digest(signature, mac.hexdigest())
+        return hmac.compare_digest(signature, mac.hexdigest().encode('ascii'))
+
+def parse_webhook(payload: Data) -> WebhookResponse:
+    """Parse a reply webhook body into a WebhookResponse.
+
+    Args:
+        payload: Raw JSON request body
+
+    Returns:
+        WebhookResponse: The reply's text ID, sender, text and custom data
+
+    Raises:
+        WebhookVerificationError: If the body is not a JSON webhook payload
+    """
+    try:
+        data = json.loads(payload)
+        return WebhookResponse(
+            text_id=str(data["textId"]),
+            from_number=data["fromNumber"],
+            text=data["text"],
+            data=data.get("data"),
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        raise WebhookVerificationError(f"Invalid webhook payload: {str(e)}")